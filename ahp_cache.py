@@ -0,0 +1,128 @@
+"""
+Кеш ваг і узгодженості матриць за хешем їхнього вмісту.
+
+Ключ — хеш байтів матриці, її форми та методу розрахунку, тому однакові
+матриці з різних сесій і перезапусків сторінки рахуються один раз.
+Загальний LRUCache також використовує ahp_service для кешу відповідей.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+import ahp_core
+
+
+class LRUCache:
+    """
+    Потокобезпечний LRU-кеш «ключ → значення» з лічильниками влучань і промахів.
+    Значення None не зберігаються: get повертає None при промаху.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        return self.get_many([key])[0]
+
+    def get_many(self, keys):
+        """Значення для списку ключів під одним блокуванням; None — промах."""
+        results = []
+        with self._lock:
+            for key in keys:
+                value = self._data.get(key)
+                if value is not None:
+                    self._data.move_to_end(key)
+                results.append(value)
+            found = sum(r is not None for r in results)
+            self.hits += found
+            self.misses += len(results) - found
+        return results
+
+    def put(self, key, value):
+        self.put_many([(key, value)])
+
+    def put_many(self, items):
+        with self._lock:
+            for key, value in items:
+                self._data[key] = value
+                self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._data), "maxsize": self.maxsize}
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+
+class WeightsCache:
+    """LRU-кеш результатів ahp_core за хешем матриці й методу."""
+
+    def __init__(self, maxsize=4096):
+        self._lru = LRUCache(maxsize)
+
+    @staticmethod
+    def key(matrix, method=ahp_core.MEAN):
+        matrix = np.ascontiguousarray(matrix, dtype=float)
+        digest = hashlib.blake2b(matrix.tobytes(), digest_size=16)
+        digest.update(f"{matrix.shape}:{method}".encode())
+        return digest.hexdigest()
+
+    def get(self, matrix, method=ahp_core.MEAN):
+        """
+        Повертає (ваги, (lambda_max, ci, cr)) для матриці.
+        Масив ваг лише для читання, бо він спільний для всіх, хто отримав цей результат.
+        """
+        key = self.key(matrix, method)
+        result = self._lru.get(key)
+        if result is None:
+            weights = ahp_core.calc_weights(matrix, method)
+            weights.setflags(write=False)
+            result = weights, ahp_core.calculate_consistency(matrix, weights, method)
+            self._lru.put(key, result)
+        return result
+
+    def get_many(self, matrices, method=ahp_core.MEAN):
+        """
+        Як get, але для списку матриць: усі промахи рахуються одним викликом
+        ahp_core.evaluate_many (пакетами за розміром).
+        """
+        matrices = [np.asarray(m, dtype=float) for m in matrices]
+        keys = [self.key(m, method) for m in matrices]
+        results = self._lru.get_many(keys)
+
+        todo = [pos for pos, r in enumerate(results) if r is None]
+        if todo:
+            weights, lambda_max, ci, cr = ahp_core.evaluate_many([matrices[pos] for pos in todo], method)
+            for pos, w, lam, c_i, c_r in zip(todo, weights, lambda_max, ci, cr):
+                w = np.array(w)
+                w.setflags(write=False)
+                results[pos] = (w, (lam, c_i, c_r))
+            self._lru.put_many([(keys[pos], results[pos]) for pos in todo])
+        return results
+
+    def weights(self, matrix, method=ahp_core.MEAN):
+        return self.get(matrix, method)[0]
+
+    def consistency(self, matrix, method=ahp_core.MEAN):
+        return self.get(matrix, method)[1]
+
+    def stats(self):
+        return self._lru.stats()
+
+    def clear(self):
+        self._lru.clear()
+
+
+# Спільний кеш процесу: Streamlit імпортує модуль один раз для всіх сесій
+default_cache = WeightsCache()
@@ -0,0 +1,196 @@
+"""
+Пакетний розрахунок збережених моделей з командного рядка.
+
+Приклади:
+    python ahp_cli.py studies/*.json --format csv -o results.csv
+    python ahp_cli.py archive/ --workers 4 --threshold 0.1
+    cat ahp_matrices.json | python ahp_cli.py -
+
+Моделі у форматі експорту (JSON або .ahpm) рахуються пачками в пулі процесів,
+а результати пишуться у CSV або JSONL у порядку вхідних файлів, щойно пачка
+готова. Зі стандартного входу читається один JSON-документ (модель або список
+моделей) чи JSONL — по моделі в рядку.
+
+Код завершення: 0 — усе гаразд; 1 — ВУ якоїсь матриці перевищує поріг
+(--threshold, типово ahp_core.CR_LIMIT, як у застосунку);
+2 — якусь модель не вдалося прочитати або розрахувати.
+"""
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import ahp_core
+import ahp_io
+from ahp_synthesis import score_models
+
+# Розширення файлів моделей, які шукаються в каталогах
+MODEL_EXTENSIONS = (".json", ".ahpm")
+
+# Стовпці CSV; priorities і alt_cr записуються як JSON-рядки
+CSV_FIELDS = ["source", "goal_name", "best", "criteria_cr", "max_cr", "priorities", "alt_cr", "error"]
+
+EXIT_OK, EXIT_INCONSISTENT, EXIT_FAILED = 0, 1, 2
+
+
+def expand_paths(patterns):
+    """Шляхи до файлів моделей: файли, шаблони glob (з **) і каталоги (рекурсивно)."""
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, _, files in sorted(os.walk(pattern)):
+                for name in sorted(files):
+                    if name.endswith(MODEL_EXTENSIONS):
+                        yield os.path.join(root, name)
+            continue
+        matches = sorted(glob.glob(pattern, recursive=True))
+        # Шлях без збігів лишається як є: помилку читання буде видно в результатах
+        yield from matches or [pattern]
+
+
+def stdin_sources(text):
+    """Моделі зі стандартного входу як пари (назва, модель)."""
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        lines = [line for line in text.splitlines() if line.strip()]
+        return [(f"<stdin>:{number}", line) for number, line in enumerate(lines, start=1)]
+    if isinstance(data, list):
+        return [(f"<stdin>:{number}", model) for number, model in enumerate(data, start=1)]
+    return [("<stdin>", data)]
+
+
+def _load(source):
+    # Джерело — шлях до файлу або пара (назва, модель чи рядок JSON)
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            return source, ahp_io.read_model(f.read())
+    name, model = source
+    return name, json.loads(model) if isinstance(model, str) else model
+
+
+def score_chunk(sources, method=ahp_core.MEAN):
+    """Результати для пачки джерел; кожен словник доповнюється ключем source."""
+    names, models, failed = [], [], {}
+    for source in sources:
+        try:
+            name, model = _load(source)
+        except Exception as e:
+            # Будь-яка помилка читання — запис з помилкою для цього джерела, а не збій усієї пачки
+            failed[len(names)] = {"error": f"Не вдалося прочитати: {e}"}
+            name, model = source if isinstance(source, str) else source[0], None
+        names.append(name)
+        models.append(model)
+
+    valid = [i for i in range(len(models)) if i not in failed]
+    try:
+        scored = dict(zip(valid, score_models([models[i] for i in valid], method)))
+    except Exception:
+        # Збій спільного розрахунку: рахуємо моделі поодинці, щоб знайти проблемну
+        scored = {i: _score_one(models[i], method) for i in valid}
+    return [dict(source=name, **(failed.get(i) or scored[i])) for i, name in enumerate(names)]
+
+
+def _score_one(model, method):
+    try:
+        return score_models([model], method)[0]
+    except Exception as e:
+        return {"error": f"Не вдалося розрахувати: {e!r}"}
+
+
+def _chunks(sources, size):
+    for start in range(0, len(sources), size):
+        yield sources[start:start + size]
+
+
+def run_batch(sources, method=ahp_core.MEAN, workers=None, chunk_size=64):
+    """
+    Результати для всіх джерел у вхідному порядку (генератор).
+    При workers == 1 пачки рахуються в поточному процесі.
+    """
+    chunks = list(_chunks(list(sources), chunk_size))
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            yield from score_chunk(chunk, method)
+        return
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        for results in pool.map(score_chunk, chunks, [method] * len(chunks)):
+            yield from results
+
+
+class _Writer:
+    # Запис результатів у форматі CSV або JSONL
+    def __init__(self, stream, fmt):
+        self.stream = stream
+        self.csv = csv.DictWriter(stream, CSV_FIELDS, extrasaction="ignore") if fmt == "csv" else None
+        if self.csv:
+            self.csv.writeheader()
+
+    def write(self, record):
+        if self.csv:
+            row = dict(record)
+            for key in ("priorities", "alt_cr"):
+                if key in row:
+                    row[key] = json.dumps(row[key], ensure_ascii=False)
+            self.csv.writerow(row)
+        else:
+            self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Пакетний розрахунок ваг, узгодженості та глобальних пріоритетів збережених моделей."
+    )
+    parser.add_argument("inputs", nargs="*", default=["-"],
+                        help="файли, шаблони glob або каталоги; '-' — стандартний вхід (типово)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl", help="формат результатів")
+    parser.add_argument("-o", "--output", help="файл результатів (типово — стандартний вихід)")
+    parser.add_argument("--method", choices=ahp_core.METHODS, default=ahp_core.MEAN,
+                        help="метод розрахунку вектора пріоритетів")
+    parser.add_argument("--threshold", type=float, default=ahp_core.CR_LIMIT,
+                        help=f"допустиме відношення узгодженості (ВУ) кожної матриці (типово {ahp_core.CR_LIMIT})")
+    parser.add_argument("--workers", type=int, default=None, help="кількість процесів (типово — кількість ядер)")
+    parser.add_argument("--chunk-size", type=int, default=64, help="моделей в одному завданні для процесу")
+    args = parser.parse_args(argv)
+
+    sources = []
+    paths = [p for p in args.inputs if p != "-"]
+    if "-" in args.inputs:
+        sources.extend(stdin_sources(sys.stdin.read()))
+    sources.extend(expand_paths(paths))
+
+    stream = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    writer = _Writer(stream, args.format)
+    total = inconsistent = failed = 0
+    start = time.perf_counter()
+    try:
+        for record in run_batch(sources, args.method, args.workers, args.chunk_size):
+            writer.write(record)
+            total += 1
+            if "error" in record:
+                failed += 1
+            elif record["max_cr"] > args.threshold:
+                inconsistent += 1
+    except Exception as e:
+        # Наприклад, аварійне завершення процесу-обробника
+        print(f"Пакетний розрахунок перервано: {e!r}", file=sys.stderr)
+        return EXIT_FAILED
+    finally:
+        if args.output:
+            stream.close()
+    elapsed = time.perf_counter() - start
+
+    rate = total / elapsed if elapsed > 0 else float("inf")
+    print(f"Оброблено моделей: {total} за {elapsed:.2f} с ({rate:.1f} моделей/с); "
+          f"ВУ > {args.threshold}: {inconsistent}; помилок: {failed}", file=sys.stderr)
+    if failed:
+        return EXIT_FAILED
+    return EXIT_INCONSISTENT if inconsistent else EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
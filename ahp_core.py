@@ -0,0 +1,439 @@
+"""
+Обчислювальне ядро методу Сааті.
+
+Модуль не залежить від Streamlit, pandas чи graphviz і працює зі звичайними
+масивами NumPy, тому його можна імпортувати з пакетних задач і сервісів.
+"""
+import json
+import os
+import tempfile
+
+import numpy as np
+
+
+# Таблиця випадкової узгодженості (n: ВВУ) для n = 1...10
+RI_TABLE = {
+    1: 0, 2: 0, 3: 0.58, 4: 0.9, 5: 1.12, 6: 1.24, 7: 1.32, 8: 1.41, 9: 1.45, 10: 1.49
+}
+
+# Параметри моделювання ВВУ для n > 10 і файл, у якому зберігаються результати
+RI_TRIALS = 10000
+RI_SEED = 2024
+RI_CACHE_PATH = os.environ.get(
+    "SAATY_RI_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "saaty_app", "random_index.json")
+)
+
+# Шкала Сааті: 1/9 ... 1/2, 1, 2 ... 9
+SAATY_SCALE = np.concatenate([1 / np.arange(9, 1, -1), np.arange(1, 10)]).astype(float)
+
+# Допустиме відношення узгодженості (ВУ): вище нього судження вважаються суперечливими
+CR_LIMIT = 0.20
+
+# Методи розрахунку вектора пріоритетів
+MEAN = "mean"            # нормалізація стовпців і середнє по рядках (наближений)
+EIGEN = "eigen"          # головний власний вектор (класичний метод Сааті)
+GEOMETRIC = "geometric"  # середнє геометричне рядків (логарифмічні найменші квадрати)
+METHODS = (MEAN, EIGEN, GEOMETRIC)
+
+# Коди проблем, які повертає check_matrix
+ZERO_COLUMN = "zero_column"
+NOT_FINITE = "not_finite"
+DISCONNECTED = "disconnected"
+
+
+def check_matrix(matrix):
+    """
+    Перевіряє, чи можна розрахувати пріоритети матриці.
+    Пропущені судження (NaN поза діагоналлю) допускаються, якщо граф
+    порівнянь зв'язний. Повертає None, ZERO_COLUMN, NOT_FINITE або DISCONNECTED.
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    if (np.nansum(matrix, axis=0) == 0).any():
+        return ZERO_COLUMN
+    if np.isinf(matrix).any() or np.isnan(np.diag(matrix)).any():
+        return NOT_FINITE
+    if not is_complete(matrix) and not is_connected(matrix):
+        return DISCONNECTED
+    return None
+
+
+def _invalid(matrices, method):
+    # Маска матриць, для яких пріоритети не можна розрахувати
+    col_sum = matrices.sum(axis=1)
+    bad = (col_sum == 0).any(axis=1) | ~np.isfinite(col_sum).all(axis=1)
+    if method != MEAN:
+        bad |= (matrices <= 0).any(axis=(1, 2))
+    return bad
+
+
+def eigen_weights_batch(matrices, tol=1e-12, max_iter=200, check_every=8):
+    """
+    Головні власні вектори стосу додатних матриць (k, n, n) степеневим методом.
+    Старт — середнє геометричне рядків; збіжність перевіряється кожні
+    check_every кроків, і далі ітеруються лише матриці, що ще не збіглися.
+    Матриці, які не збіглися за max_iter кроків, розраховуються через numpy.linalg.eig.
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    if not matrices.size:
+        return np.zeros(matrices.shape[:2])
+    weights = np.exp(np.log(matrices).mean(axis=2))[..., None]
+    weights /= weights.sum(axis=1, keepdims=True)
+    active = np.arange(len(matrices))
+    sub, w = matrices, weights
+
+    for _ in range(0, max_iter, check_every):
+        for _ in range(check_every):
+            prev = w
+            w = sub @ w
+            w /= w.sum(axis=1, keepdims=True)
+        done = np.abs(w - prev).max(axis=(1, 2)) < tol
+        weights[active] = w
+        if done.all():
+            active = active[:0]
+            break
+        if done.any():
+            active = active[~done]
+            sub, w = matrices[active], weights[active]
+
+    if len(active):
+        values, vectors = np.linalg.eig(matrices[active])
+        top = values.real.argmax(axis=1)
+        principal = np.abs(vectors[np.arange(len(active)), :, top].real)
+        weights[active, :, 0] = principal / principal.sum(axis=1, keepdims=True)
+    return weights[..., 0]
+
+
+def calc_weights_batch(matrices, method=MEAN):
+    """
+    Вектори пріоритетів для стосу матриць форми (k, n, n).
+    Повертає масив (k, n); рядки некоректних матриць заповнені NaN.
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    bad = _invalid(matrices, method)
+    safe = np.where(bad[:, None, None], 1.0, matrices) if bad.any() else matrices
+
+    if method == MEAN:
+        weights = (safe / safe.sum(axis=1)[:, None, :]).mean(axis=2)
+    elif method == EIGEN:
+        weights = eigen_weights_batch(safe)
+    elif method == GEOMETRIC:
+        weights = np.exp(np.log(safe).mean(axis=2))
+        weights /= weights.sum(axis=1, keepdims=True)
+    else:
+        raise ValueError(f"Невідомий метод розрахунку пріоритетів: {method}")
+    weights[bad] = np.nan
+    return weights
+
+
+def consistency_batch(matrices, weights=None, method=MEAN):
+    """
+    Lambda Max, ІУ та ВУ для стосу матриць форми (k, n, n).
+    Lambda Max оцінюється за вектором ваг, отриманим вибраним методом
+    (для EIGEN це точне головне власне число).
+    Повертає три масиви довжини k.
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    k, n = matrices.shape[:2]
+    if n < 3:
+        return np.full(k, float(n)), np.zeros(k), np.zeros(k)
+
+    if weights is None:
+        weights = calc_weights_batch(matrices, method)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        consist_vector = np.einsum("kij,kj->ki", matrices, weights) / weights
+    lambda_max = consist_vector.mean(axis=1)
+    ci = (lambda_max - n) / (n - 1)
+
+    ri = random_index(n)
+    cr = np.zeros(k) if ri == 0 else ci / ri
+    return lambda_max, ci, cr
+
+
+def evaluate_many(matrices, method=MEAN):
+    """
+    Ваги та узгодженість для набору матриць різних розмірів.
+    Неповні матриці спершу доповнюються; далі матриці групуються за розміром,
+    і кожна група рахується одним пакетом.
+    Повертає (список векторів ваг, lambda_max, ci, cr) у порядку вхідних матриць.
+    """
+    matrices = [np.asarray(m, dtype=float) for m in matrices]
+    matrices = [m if is_complete(m) or check_matrix(m) is not None else complete_matrix(m) for m in matrices]
+    weights = [None] * len(matrices)
+    lambda_max = np.empty(len(matrices))
+    ci = np.empty(len(matrices))
+    cr = np.empty(len(matrices))
+
+    groups = {}
+    for idx, m in enumerate(matrices):
+        groups.setdefault(len(m), []).append(idx)
+    for idx in groups.values():
+        stack = np.stack([matrices[i] for i in idx])
+        w = calc_weights_batch(stack, method)
+        lambda_max[idx], ci[idx], cr[idx] = consistency_batch(stack, w)
+        for pos, i in enumerate(idx):
+            weights[i] = w[pos]
+    return weights, lambda_max, ci, cr
+
+
+def is_complete(matrix):
+    """Чи заповнені всі судження матриці."""
+    return not np.isnan(matrix).any()
+
+
+def _known_pairs(matrix):
+    # Пари i < j, для яких відоме хоча б одне із суджень a_ij, a_ji,
+    # і логарифм відношення w_i / w_j за цими судженнями
+    matrix = np.asarray(matrix, dtype=float)
+    i, j = np.triu_indices(len(matrix), 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        logs = np.stack([np.log(matrix[i, j]), -np.log(matrix[j, i])])
+    given = np.isfinite(logs)
+    count = given.sum(axis=0)
+    known = count > 0
+    log_ratio = np.where(given, logs, 0).sum(axis=0)[known] / count[known]
+    return i[known], j[known], log_ratio
+
+
+def is_connected(matrix):
+    """Чи зв'язний граф порівнянь (вершини — елементи, ребра — відомі судження)."""
+    n = len(matrix)
+    if n <= 1:
+        return True
+    i, j, _ = _known_pairs(matrix)
+    adjacency = np.zeros((n, n), dtype=bool)
+    adjacency[i, j] = adjacency[j, i] = True
+
+    reached = np.zeros(n, dtype=bool)
+    reached[0] = True
+    while True:
+        grown = reached | adjacency[reached].any(axis=0)
+        if (grown == reached).all():
+            return bool(reached.all())
+        reached = grown
+
+
+def llsm_weights(matrix):
+    """
+    Пріоритети за неповною матрицею методом логарифмічних найменших квадратів:
+    мінімізується сума (ln a_ij - ln w_i + ln w_j)^2 лише за відомими судженнями.
+    Система будується як лапласіан графа порівнянь зі списку ребер.
+    Для повної матриці результат збігається з методом GEOMETRIC.
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    n = len(matrix)
+    if not is_connected(matrix):
+        raise ValueError("Граф порівнянь незв'язний: пріоритети неможливо визначити.")
+
+    i, j, log_ratio = _known_pairs(matrix)
+    rhs = np.bincount(i, log_ratio, minlength=n) - np.bincount(j, log_ratio, minlength=n)
+    log_w = np.linalg.solve(_llsm_system(n, i, j), rhs)
+    weights = np.exp(log_w - log_w.max())
+    return weights / weights.sum()
+
+
+def _llsm_system(n, i, j):
+    # Лапласіан графа порівнянь за ребрами (i, j). Він вироджений (зсув усіх ln w
+    # на сталу), тому додається 1/n, що фіксує суму ln w = 0
+    degree = np.bincount(i, minlength=n) + np.bincount(j, minlength=n)
+    laplacian = np.diag(degree.astype(float))
+    np.add.at(laplacian, (i, j), -1.0)
+    np.add.at(laplacian, (j, i), -1.0)
+    return laplacian + 1 / n
+
+
+def llsm_operator(matrix):
+    """
+    Лінійний оператор LLSM для фіксованого набору відомих суджень:
+    (i, j, P), де i < j — пари відомих суджень, а P — матриця (n, пари), для якої
+    ln w = P @ ln a_ij (з точністю до нормування). Дає змогу доповнювати багато
+    матриць з однаковими пропусками одним матричним добутком.
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    n = len(matrix)
+    if not is_connected(matrix):
+        raise ValueError("Граф порівнянь незв'язний: пріоритети неможливо визначити.")
+    i, j, _ = _known_pairs(matrix)
+    incidence = np.zeros((n, len(i)))
+    incidence[i, np.arange(len(i))] = 1.0
+    incidence[j, np.arange(len(i))] = -1.0
+    return i, j, np.linalg.solve(_llsm_system(n, i, j), incidence)
+
+
+def complete_matrix(matrix):
+    """
+    Доповнює неповну матрицю: судження, для якого відоме симетричне, стає його
+    оберненим, а решта пропущених a_ij — відношенням w_i / w_j пріоритетів
+    llsm_weights (відомі судження не змінюються).
+    """
+    matrix = np.array(matrix, dtype=float)
+    if is_complete(matrix):
+        return matrix
+    weights = llsm_weights(matrix)
+    matrix = np.where(np.isnan(matrix), 1 / matrix.T, matrix)
+    missing = np.isnan(matrix)
+    matrix[missing] = (weights[:, None] / weights[None, :])[missing]
+    return matrix
+
+
+def calc_weights(matrix, method=MEAN):
+    """
+    Вектор пріоритетів матриці. За замовчуванням — нормалізація стовпців
+    і середнє по рядках. Неповна матриця спершу доповнюється complete_matrix.
+    Для некоректної матриці повертає вектор з NaN.
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    if not is_complete(matrix):
+        if check_matrix(matrix) is not None:
+            return np.full(len(matrix), np.nan)
+        matrix = complete_matrix(matrix)
+    return calc_weights_batch(matrix[None], method)[0]
+
+
+def calculate_consistency(matrix, weights=None, method=MEAN):
+    """
+    Розраховує Lambda Max, Індекс Узгодженості (ІУ/CI) та Відношення Узгодженості (ВУ/CR).
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    n = len(matrix)
+    if n < 3:
+        return n, 0, 0
+
+    if not is_complete(matrix):
+        if check_matrix(matrix) is not None:
+            return np.nan, np.nan, np.nan
+        matrix = complete_matrix(matrix)
+    if weights is None:
+        weights = calc_weights(matrix, method)
+    if np.isnan(weights).any():
+        return np.nan, np.nan, np.nan  # Помилка при розрахунку ваг
+
+    lambda_max, ci, cr = consistency_batch(matrix[None], np.asarray(weights, dtype=float)[None])
+    return lambda_max[0], ci[0], cr[0]
+
+
+def random_reciprocal_matrices(k, n, rng=None):
+    """Стос з k випадкових обернено-симетричних матриць n x n зі значеннями шкали Сааті."""
+    rng = np.random.default_rng(rng)
+    iu = np.triu_indices(n, 1)
+    matrices = np.ones((k, n, n))
+    upper = rng.choice(SAATY_SCALE, size=(k, len(iu[0])))
+    matrices[:, iu[0], iu[1]] = upper
+    matrices[:, iu[1], iu[0]] = 1 / upper
+    return matrices
+
+
+def simulate_random_index(n, trials=RI_TRIALS, seed=RI_SEED):
+    """
+    ВВУ методом Монте-Карло: середній ІУ випадкових обернено-симетричних
+    матриць n x n зі значеннями шкали Сааті (за головним власним числом).
+    """
+    if n < 3:
+        return 0.0
+    rng = np.random.default_rng([seed, n])
+    chunk = max(1, 4_000_000 // (n * n))
+    lambda_sum = 0.0
+    for start in range(0, trials, chunk):
+        matrices = random_reciprocal_matrices(min(chunk, trials - start), n, rng)
+        weights = eigen_weights_batch(matrices)
+        lambda_sum += ((matrices @ weights[..., None])[..., 0] / weights).mean(axis=1).sum()
+    return (lambda_sum / trials - n) / (n - 1)
+
+
+_ri_cache = {}
+
+
+def _load_ri_cache():
+    try:
+        with open(RI_CACHE_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return
+    if data.get("trials") == RI_TRIALS and data.get("seed") == RI_SEED:
+        _ri_cache.update({int(n): ri for n, ri in data.get("values", {}).items()})
+
+
+def _save_ri_cache():
+    # Інший процес міг дописати свої n, поки ми рахували: спершу зливаємо файл із пам'яттю,
+    # а пишемо через тимчасовий файл у тому ж каталозі, щоб читач не побачив напівзаписаний JSON
+    own = dict(_ri_cache)
+    _load_ri_cache()
+    _ri_cache.update(own)
+    data = {"trials": RI_TRIALS, "seed": RI_SEED, "values": {str(n): ri for n, ri in sorted(_ri_cache.items())}}
+    directory = os.path.dirname(RI_CACHE_PATH)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".random_index.", suffix=".tmp")
+    except OSError:
+        return  # Кеш на диску необов'язковий
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, RI_CACHE_PATH)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def random_index(n):
+    """
+    Повертає випадковий індекс узгодженості (ВВУ) для матриці розміру n.
+    Для n <= 10 використовується RI_TABLE, для більших n значення моделюється
+    один раз і зберігається у файлі RI_CACHE_PATH.
+    """
+    if n in RI_TABLE:
+        return RI_TABLE[n]
+    if n not in _ri_cache:
+        _load_ri_cache()
+    if n not in _ri_cache:
+        _ri_cache[n] = float(simulate_random_index(n))
+        _save_ri_cache()
+    return _ri_cache[n]
+
+
+def fill_reciprocal(edited, prev):
+    """
+    Дзеркалить змінені судження: для кожної пари (i, j), у якій користувач змінив
+    одну з клітинок відносно prev, записує обернене значення в симетричну клітинку.
+    Якщо змінено обидві клітинки пари, джерелом вважається клітинка над діагоналлю.
+    Значення > 1, близькі до цілих, округлюються до цілих; значення < 1 — до трьох
+    знаків, а їхні обернені — до цілих або трьох знаків. Одиниця дзеркалиться лише
+    в порожню (NaN) симетричну клітинку. Стерте судження (NaN) стирає і симетричне.
+    Повертає нову матрицю з одиницями на діагоналі.
+    """
+    result = np.array(edited, dtype=float)
+    prev = np.asarray(prev, dtype=float)
+
+    changed = (result != prev) & ~(np.isnan(result) & np.isnan(prev))
+    upper = np.triu(changed, 1)
+    source = upper | (np.tril(changed, -1) & ~upper.T)
+    rows, cols = np.nonzero(source)
+    val = result[rows, cols]
+
+    with np.errstate(divide="ignore"):
+        big = val > 1
+        snapped = np.round(val)
+        val = np.where(big & np.isclose(val, snapped), snapped, val)
+        val = np.where(val < 1, np.round(val, 3), val)
+        inv_val = 1 / val
+        snapped = np.round(inv_val)
+        mirror = np.where(big, np.round(inv_val, 3),
+                          np.where(np.isclose(inv_val, snapped), snapped, np.round(inv_val, 3)))
+
+    # Значення 1 не дзеркалиться, якщо симетричне судження вже задане; порожню клітинку воно заповнює
+    keep = big | (val < 1) | np.isnan(val) | ((val == 1) & np.isnan(prev[cols, rows]))
+    rows, cols = rows[keep], cols[keep]
+    result[rows, cols] = val[keep]
+    result[cols, rows] = mirror[keep]
+
+    np.fill_diagonal(result, 1.0)
+    return result
+
+
+def global_priorities(criteria_weights, alt_weights):
+    """
+    Глобальні пріоритети альтернатив.
+    alt_weights — матриця (альтернативи x критерії) локальних ваг.
+    """
+    return np.asarray(alt_weights, dtype=float).dot(np.asarray(criteria_weights, dtype=float))
@@ -0,0 +1,73 @@
+"""
+Схема ієрархії задачі для великих моделей.
+
+Повна схема містить ребро від кожної альтернативи до кожного критерію, тобто
+критерії x альтернативи ребер, і розкладка такого графа гальмує сторінку.
+Якщо ребер більше за COLLAPSE_EDGES, рівень альтернатив згортається в один
+груповий вузол; окремий критерій можна розгорнути, показавши його альтернативи.
+
+DOT-текст і SVG кешуються за назвами та структурою, тому розкладка
+повторюється лише після зміни ієрархії.
+"""
+from functools import lru_cache
+
+import graphviz
+
+# Скільки ребер «альтернатива → критерій» малюється без згортання
+COLLAPSE_EDGES = 200
+
+# Ідентифікатор групового вузла альтернатив
+GROUP_NODE = "__alternatives__"
+
+
+def is_collapsed(criteria, alternatives):
+    """Чи згортається рівень альтернатив для моделі такого розміру."""
+    return len(criteria) * len(alternatives) > COLLAPSE_EDGES
+
+
+def hierarchy_dot(goal_name, criteria, alternatives, expanded=None):
+    """
+    DOT-текст схеми ієрархії. Для великої моделі альтернативи згортаються
+    в один вузол; expanded — критерій, альтернативи якого показуються окремо.
+    """
+    return _hierarchy_dot(goal_name, tuple(criteria), tuple(alternatives), expanded)
+
+
+@lru_cache(maxsize=64)
+def _hierarchy_dot(goal_name, criteria, alternatives, expanded):
+    dot = graphviz.Digraph()
+    dot.attr(rankdir="BT", size="8,6")
+    dot.node("goal", goal_name, shape="box", style="filled", color="#a1c9f1")
+    for crit in criteria:
+        dot.node(crit, crit, shape="box", style="filled", color="#b6fcb6")
+        dot.edge(crit, "goal")
+
+    if not is_collapsed(criteria, alternatives):
+        for alt in alternatives:
+            dot.node(alt, alt, shape="ellipse", style="filled", color="#fce8a6")
+        for crit in criteria:
+            for alt in alternatives:
+                dot.edge(alt, crit)
+        return dot.source
+
+    dot.node(GROUP_NODE, f"Альтернативи ({len(alternatives)})", shape="folder", style="filled", color="#fce8a6")
+    for crit in criteria:
+        if crit != expanded:
+            dot.edge(GROUP_NODE, crit)
+    if expanded in criteria:
+        for alt in alternatives:
+            dot.node(alt, alt, shape="ellipse", style="filled", color="#fce8a6")
+            dot.edge(alt, expanded)
+    return dot.source
+
+
+@lru_cache(maxsize=64)
+def render_svg(source):
+    """
+    SVG для DOT-тексту, розкладений локальною програмою graphviz (dot).
+    Якщо програми немає, повертає None — тоді розкладку робить браузер.
+    """
+    try:
+        return graphviz.Source(source).pipe(format="svg").decode("utf-8")
+    except (graphviz.ExecutableNotFound, graphviz.CalledProcessError):
+        return None
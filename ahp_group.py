@@ -0,0 +1,153 @@
+"""
+Групове рішення: об'єднання оцінок кількох експертів однієї моделі.
+
+Моделі експертів (у форматі експорту застосунку) складаються в масиви
+(експерти, ...), після чого всі розрахунки виконуються пакетно:
+  AIJ — зважене середнє геометричне окремих суджень, далі звичайний розрахунок;
+  AIP — розрахунок пріоритетів кожного експерта і їх зважене середнє геометричне.
+"""
+import numpy as np
+
+import ahp_core
+from ahp_io import model_arrays
+
+# Способи агрегування
+AIJ = "aij"  # агрегування окремих суджень
+AIP = "aip"  # агрегування індивідуальних пріоритетів
+
+
+def stack_models(models):
+    """
+    Матриці всіх експертів у спільному порядку назв першої моделі:
+    (criteria_names, alternative_names, критерії (N, k, k), альтернативи (N, k, m, m)).
+    """
+    if not models:
+        raise ValueError("Потрібна принаймні одна модель експерта.")
+    criteria = list(models[0]["criteria_names"])
+    alternatives = list(models[0]["alternative_names"])
+    for number, model in enumerate(models, start=1):
+        if set(model["criteria_names"]) != set(criteria) or set(model["alternative_names"]) != set(alternatives):
+            raise ValueError(f"Модель експерта {number} має інші критерії або альтернативи, ніж модель 1.")
+
+    arrays = [model_arrays(dict(model, criteria_names=criteria, alternative_names=alternatives)) for model in models]
+    criteria_matrices = np.array([a[2] for a in arrays]).reshape(len(models), len(criteria), len(criteria))
+    alt_matrices = np.array([a[3] for a in arrays]).reshape(len(models), len(criteria), len(alternatives), len(alternatives))
+    return criteria, alternatives, criteria_matrices, alt_matrices
+
+
+def geometric_mean(stack, weights):
+    """
+    Зважене середнє геометричне по першій осі. Пропущені значення (NaN)
+    не враховуються, а ваги решти експертів для цієї клітинки перенормовуються.
+    """
+    weights = np.asarray(weights, dtype=float).reshape((-1,) + (1,) * (stack.ndim - 1))
+    logs = np.log(stack)
+    given = ~np.isnan(logs)
+    total = np.where(given, weights, 0).sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.exp(np.where(given, logs * weights, 0).sum(axis=0) / total)
+
+
+def _completed(matrices):
+    # Доповнює неповні матриці стосу (..., n, n) перед пакетним розрахунком
+    flat = np.array(matrices, dtype=float).reshape((-1,) + matrices.shape[-2:])
+    for pos in np.flatnonzero(np.isnan(flat).any(axis=(1, 2))):
+        if ahp_core.check_matrix(flat[pos]) is None:
+            flat[pos] = ahp_core.complete_matrix(flat[pos])
+    return flat
+
+
+def _weights_and_cr(matrices, method):
+    # Ваги та ВУ для стосу (..., n, n); повертає (..., n) і (...)
+    flat = _completed(matrices)
+    weights = ahp_core.calc_weights_batch(flat, method)
+    cr = ahp_core.consistency_batch(flat, weights)[2]
+    return weights.reshape(matrices.shape[:-1]), cr.reshape(matrices.shape[:-2])
+
+
+def _normalized(values, axis=-1):
+    return values / values.sum(axis=axis, keepdims=True)
+
+
+def aggregate(criteria_matrices, alt_matrices, expert_weights=None, method=ahp_core.MEAN, aggregation=AIJ):
+    """
+    Групові пріоритети для стосів матриць N експертів: критерії (N, k, k),
+    альтернативи (N, k, m, m); ваги експертів за замовчуванням однакові.
+
+    Повертає словник:
+      criteria_weights (k,), local_weights (m, k), priorities (m,) — груповий результат;
+      group_criteria_matrix (k, k), group_alt_matrices (k, m, m) — матриці AIJ;
+      group_cr (1 + k,) — ВУ групових матриць (критерії, далі альтернативи за критеріями);
+      expert_cr (N, 1 + k) — ВУ матриць кожного експерта;
+      expert_priorities (N, m) — глобальні пріоритети кожного експерта;
+      expert_divergence (N,) — середній квадрат відхилення ln-суджень експерта від групових;
+      kendall_w — коефіцієнт конкордації Кендалла для ранжувань експертів (1 — повна згода).
+    """
+    criteria_matrices = np.asarray(criteria_matrices, dtype=float)
+    alt_matrices = np.asarray(alt_matrices, dtype=float)
+    n_experts, k, m = alt_matrices.shape[:3]
+    expert_weights = np.ones(n_experts) if expert_weights is None else np.asarray(expert_weights, dtype=float)
+    expert_weights = expert_weights / expert_weights.sum()
+
+    # Індивідуальні результати всіх експертів одним пакетом на розмір матриці
+    expert_criteria, expert_criteria_cr = _weights_and_cr(criteria_matrices, method)
+    expert_local, expert_alt_cr = _weights_and_cr(alt_matrices, method)
+    expert_priorities = np.einsum("ekm,ek->em", expert_local, expert_criteria)
+
+    # Групові матриці (AIJ) — потрібні також для узгодженості та розбіжностей
+    group_criteria_matrix = geometric_mean(criteria_matrices, expert_weights)
+    group_alt_matrices = geometric_mean(alt_matrices, expert_weights)
+    group_criteria, group_criteria_cr = _weights_and_cr(group_criteria_matrix, method)
+    group_local, group_alt_cr = _weights_and_cr(group_alt_matrices, method)
+
+    if aggregation == AIJ:
+        criteria_weights, local_weights = group_criteria, group_local
+        priorities = group_local.T @ group_criteria
+    elif aggregation == AIP:
+        criteria_weights = _normalized(geometric_mean(expert_criteria, expert_weights))
+        local_weights = _normalized(geometric_mean(expert_local, expert_weights))
+        priorities = _normalized(geometric_mean(expert_priorities, expert_weights))
+    else:
+        raise ValueError(f"Невідомий спосіб агрегування: {aggregation}")
+
+    # Розбіжність: відхилення ln-суджень від групових поза діагоналлю
+    with np.errstate(invalid="ignore", divide="ignore"):
+        criteria_dev = (np.log(criteria_matrices) - np.log(group_criteria_matrix)) ** 2
+        alt_dev = (np.log(alt_matrices) - np.log(group_alt_matrices)) ** 2
+    deviations = np.concatenate([
+        criteria_dev[:, ~np.eye(k, dtype=bool)],
+        alt_dev[:, :, ~np.eye(m, dtype=bool)].reshape(n_experts, -1),
+    ], axis=1)
+    given = ~np.isnan(deviations)
+    expert_divergence = np.where(given, deviations, 0).sum(axis=1) / np.maximum(given.sum(axis=1), 1)
+
+    # Коефіцієнт конкордації Кендалла для ранжувань експертів
+    ranks = np.argsort(np.argsort(-expert_priorities, axis=1), axis=1) + 1
+    rank_sums = ranks.sum(axis=0)
+    spread = ((rank_sums - rank_sums.mean()) ** 2).sum()
+    kendall_w = 12 * spread / (n_experts ** 2 * (m ** 3 - m)) if m > 1 else 1.0
+
+    return {
+        "criteria_weights": criteria_weights,
+        "local_weights": local_weights.T,
+        "priorities": priorities,
+        "group_criteria_matrix": group_criteria_matrix,
+        "group_alt_matrices": group_alt_matrices,
+        "group_cr": np.concatenate([[group_criteria_cr], group_alt_cr]),
+        "expert_cr": np.column_stack([expert_criteria_cr, expert_alt_cr]),
+        "expert_priorities": expert_priorities,
+        "expert_divergence": expert_divergence,
+        "kendall_w": kendall_w,
+    }
+
+
+def group_decision(models, expert_weights=None, method=ahp_core.MEAN, aggregation=AIJ):
+    """
+    Групове рішення для моделей експертів у форматі експорту.
+    Результат aggregate доповнюється назвами criteria_names і alternative_names.
+    """
+    criteria, alternatives, criteria_matrices, alt_matrices = stack_models(models)
+    result = aggregate(criteria_matrices, alt_matrices, expert_weights, method, aggregation)
+    result["criteria_names"] = criteria
+    result["alternative_names"] = alternatives
+    return result
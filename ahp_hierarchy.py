@@ -0,0 +1,186 @@
+"""
+Багаторівнева ієрархія: мета → критерії → підкритерії → ... → альтернативи.
+
+Кожен вузол із дочірніми вузлами має матрицю порівнянь цих вузлів, а листовий
+критерій — матрицю порівнянь альтернатив. Вузол може входити до кількох
+батьківських вузлів, тобто ієрархія — орієнтований ациклічний граф.
+
+Глобальні пріоритети синтезуються знизу вгору: ребра (батько, дитина, локальна
+вага) зберігаються як розріджена матриця у форматі списку ребер, і оцінки
+альтернатив усіх вузлів одного рівня рахуються одним добутком. Після зміни
+матриці перераховуються лише цей вузол і його предки.
+"""
+import numpy as np
+
+import ahp_cache
+import ahp_core
+from ahp_io import matrix_from_dict
+
+
+class Hierarchy:
+    """Ієрархія порівнянь з інкрементним синтезом глобальних пріоритетів."""
+
+    def __init__(self, alternatives, method=ahp_core.MEAN, cache=None):
+        self.alternatives = list(alternatives)
+        self.method = method
+        self.cache = cache or ahp_cache.default_cache
+        self.children = {}
+        self.matrices = {}
+        self._dirty = set()
+        self._built = False
+
+    @classmethod
+    def from_model(cls, model, method=ahp_core.MEAN, cache=None):
+        """
+        Ієрархія з моделі у форматі експорту. Необов'язковий ключ "sub_criteria"
+        описує підкритерії: {критерій: {"names": [...], "matrix": {...}}}.
+        Матриці альтернатив у "alt_matrices" задаються для листових критеріїв.
+        """
+        alternatives = model["alternative_names"]
+        sub_criteria = model.get("sub_criteria", {})
+        hierarchy = cls(alternatives, method, cache)
+
+        goal = model.get("goal_name", "ГОЛОВНА МЕТА")
+        criteria = model["criteria_names"]
+        hierarchy.add_node(goal, criteria, matrix_from_dict(model["criteria_matrix"], criteria))
+        pending = list(criteria)
+        while pending:
+            name = pending.pop()
+            if name in hierarchy.children:
+                continue
+            if name in sub_criteria:
+                names = sub_criteria[name]["names"]
+                hierarchy.add_node(name, names, matrix_from_dict(sub_criteria[name]["matrix"], names))
+                pending.extend(names)
+            else:
+                hierarchy.add_node(name, (), matrix_from_dict(model["alt_matrices"][name], alternatives))
+        return hierarchy
+
+    def add_node(self, name, children=(), matrix=None):
+        """Додає вузол; без дочірніх вузлів він листовий і порівнює альтернативи."""
+        if name in self.children:
+            raise ValueError(f"Вузол '{name}' уже існує.")
+        self.children[name] = list(children)
+        self._built = False
+        if matrix is not None:
+            self.set_matrix(name, matrix)
+
+    def set_matrix(self, name, matrix):
+        """Нова матриця вузла; під час наступного синтезу перерахуються лише він і його предки."""
+        matrix = np.asarray(matrix, dtype=float)
+        size = len(self.children[name]) or len(self.alternatives)
+        if matrix.shape != (size, size):
+            raise ValueError(f"Матриця вузла '{name}' має бути розміру {size} x {size}.")
+        self.matrices[name] = matrix
+        self._dirty.add(name)
+
+    @property
+    def leaves(self):
+        return [name for name, children in self.children.items() if not children]
+
+    def _build(self):
+        names = list(self.children)
+        index = {name: i for i, name in enumerate(names)}
+        for parent, children in self.children.items():
+            for child in children:
+                if child not in index:
+                    raise ValueError(f"Вузол '{child}' (дочірній для '{parent}') не описано.")
+        missing = [name for name in names if name not in self.matrices]
+        if missing:
+            raise ValueError(f"Не задано матриці для вузлів: {', '.join(missing)}.")
+
+        parents = [[] for _ in names]
+        for parent, children in self.children.items():
+            for child in children:
+                parents[index[child]].append(index[parent])
+        roots = [i for i, p in enumerate(parents) if not p]
+        if len(roots) != 1:
+            raise ValueError("Ієрархія повинна мати рівно одну мету (вузол без батьків).")
+
+        # Висота вузла: 0 для листків, 1 + максимальна висота дочірніх для решти
+        height = [None] * len(names)
+        visiting = set()
+
+        def visit(i):
+            if height[i] is None:
+                if i in visiting:
+                    raise ValueError("Ієрархія містить цикл.")
+                visiting.add(i)
+                kids = [index[c] for c in self.children[names[i]]]
+                height[i] = 1 + max(visit(c) for c in kids) if kids else 0
+                visiting.discard(i)
+            return height[i]
+
+        for i in range(len(names)):
+            visit(i)
+
+        # Ребра впорядковані за батьком: ребра вузла i займають edges[start[i]:end[i]]
+        self._names = names
+        self._index = index
+        self._parents = parents
+        self._root = roots[0]
+        self._height = np.array(height)
+        self._edge_child = np.array([index[c] for p in names for c in self.children[p]], dtype=np.intp)
+        counts = np.array([len(self.children[p]) for p in names])
+        self._edge_end = np.cumsum(counts)
+        self._edge_start = self._edge_end - counts
+        self._edge_weight = np.zeros(len(self._edge_child))
+        self._scores = np.zeros((len(names), len(self.alternatives)))
+        self._dirty = set(names)
+        self._built = True
+
+    def _synthesize(self):
+        if not self._built:
+            self._build()
+        if not self._dirty:
+            return
+
+        # Вузли, що змінилися, та всі їхні предки
+        affected = set()
+        stack = [self._index[name] for name in self._dirty]
+        while stack:
+            node = stack.pop()
+            if node not in affected:
+                affected.add(node)
+                stack.extend(self._parents[node])
+
+        dirty = list(self._dirty)
+        results = self.cache.get_many([self.matrices[name] for name in dirty], self.method)
+        for name, (weights, _) in zip(dirty, results):
+            i = self._index[name]
+            if np.isnan(weights).any():
+                raise ValueError(f"Не вдалося розрахувати ваги для вузла '{name}'.")
+            if self.children[name]:
+                self._edge_weight[self._edge_start[i]:self._edge_end[i]] = weights
+            else:
+                self._scores[i] = weights
+        self._dirty.clear()
+
+        inner = np.array(sorted(i for i in affected if self.children[self._names[i]]), dtype=np.intp)
+        for h in np.unique(self._height[inner]):
+            level = inner[self._height[inner] == h]
+            # Розріджений добуток: сума локальна вага * оцінки дитини по ребрах кожного батька
+            edges = np.concatenate([np.arange(self._edge_start[i], self._edge_end[i]) for i in level])
+            contributions = self._edge_weight[edges, None] * self._scores[self._edge_child[edges]]
+            offsets = np.concatenate([[0], np.cumsum(self._edge_end[level] - self._edge_start[level])[:-1]])
+            self._scores[level] = np.add.reduceat(contributions, offsets, axis=0)
+
+    def priorities(self):
+        """Глобальні пріоритети альтернатив відносно мети."""
+        self._synthesize()
+        return self._scores[self._root].copy()
+
+    def node_weights(self):
+        """Глобальні ваги всіх вузлів відносно мети (для DAG — сума за всіма шляхами)."""
+        self._synthesize()
+        weights = np.zeros(len(self._names))
+        weights[self._root] = 1.0
+        parent_of_edge = np.repeat(np.arange(len(self._names)), self._edge_end - self._edge_start)
+        for h in np.unique(self._height)[::-1]:
+            edges = np.flatnonzero(self._height[parent_of_edge] == h)
+            np.add.at(weights, self._edge_child[edges], weights[parent_of_edge[edges]] * self._edge_weight[edges])
+        return dict(zip(self._names, weights))
+
+    def consistency(self):
+        """(lambda_max, ci, cr) для матриці кожного вузла."""
+        return {name: self.cache.consistency(matrix, self.method) for name, matrix in self.matrices.items()}
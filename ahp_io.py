@@ -0,0 +1,182 @@
+"""
+Читання та запис моделей у форматі експорту застосунку.
+
+Модель — словник, який зберігає кнопка «Зберегти як JSON»: назви мети,
+критеріїв і альтернатив, матриця критеріїв і матриці альтернатив у форматі
+DataFrame.to_dict() ({стовпець: {рядок: значення}}).
+
+Поряд із JSON підтримується компактний бінарний формат (.ahpm): заголовок
+з назвами і один суцільний блок float64 з усіма матрицями, який читається
+через np.memmap без копіювання.
+"""
+import json
+import os
+import struct
+
+import numpy as np
+
+
+def matrix_from_dict(data, names):
+    """Матриця n x n зі словника {стовпець: {рядок: значення}} у порядку names."""
+    return np.array([[data[col][row] for col in names] for row in names], dtype=float).reshape(len(names), len(names))
+
+
+def matrix_to_dict(matrix, names):
+    """
+    Словник {стовпець: {рядок: значення}}, як у DataFrame.to_dict().
+    Пропущені судження (NaN) записуються як None, тобто null у JSON.
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    return {
+        col: {row: None if np.isnan(matrix[i, j]) else float(matrix[i, j]) for i, row in enumerate(names)}
+        for j, col in enumerate(names)
+    }
+
+
+def model_arrays(model):
+    """
+    Назви та матриці моделі у вигляді масивів:
+    (criteria_names, alternative_names, матриця критеріїв (k, k), матриці альтернатив (k, m, m)).
+    """
+    criteria = list(model["criteria_names"])
+    alternatives = list(model["alternative_names"])
+    criteria_matrix = matrix_from_dict(model["criteria_matrix"], criteria)
+    alt_matrices = np.array(
+        [matrix_from_dict(model["alt_matrices"][crit], alternatives) for crit in criteria], dtype=float
+    ).reshape(len(criteria), len(alternatives), len(alternatives))
+    return criteria, alternatives, criteria_matrix, alt_matrices
+
+
+def model_from_arrays(goal_name, criteria, alternatives, criteria_matrix, alt_matrices):
+    """Модель у форматі експорту з назв і масивів (обернено до model_arrays)."""
+    return {
+        "goal_name": goal_name,
+        "criteria_names": list(criteria),
+        "alternative_names": list(alternatives),
+        "num_criteria": len(criteria),
+        "num_alternatives": len(alternatives),
+        "criteria_matrix": matrix_to_dict(criteria_matrix, criteria),
+        "alt_matrices": {crit: matrix_to_dict(alt_matrices[j], alternatives) for j, crit in enumerate(criteria)},
+    }
+
+
+def model_to_json(goal_name, criteria, alternatives, criteria_matrix, alt_matrices):
+    """Модель у форматі експорту як JSON-текст; пропущені судження записуються як null."""
+    return json.dumps(
+        model_from_arrays(goal_name, criteria, alternatives, criteria_matrix, alt_matrices),
+        ensure_ascii=False, indent=2,
+    )
+
+
+# Бінарний формат моделі (.ahpm):
+#   MAGIC (8 байт), версія та довжина заголовка (два uint32, little-endian),
+#   JSON-заголовок з назвами, доповнений пробілами до межі ALIGNMENT байт,
+#   далі один суцільний блок float64 (little-endian): матриця критеріїв (k, k),
+#   за нею матриці альтернатив (k, m, m) у порядку критеріїв.
+MAGIC = b"AHPMODEL"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+BINARY_DTYPE = np.dtype("<f8")
+_PREFIX = struct.Struct("<8sII")
+
+
+def is_binary(data):
+    """Чи починаються байти з сигнатури бінарного формату."""
+    return bytes(data[:len(MAGIC)]) == MAGIC
+
+
+def model_to_bytes(goal_name, criteria, alternatives, criteria_matrix, alt_matrices):
+    """Модель у бінарному форматі (.ahpm)."""
+    k, m = len(criteria), len(alternatives)
+    criteria_matrix = np.asarray(criteria_matrix, dtype=BINARY_DTYPE).reshape(k, k)
+    alt_matrices = np.asarray(alt_matrices, dtype=BINARY_DTYPE).reshape(k, m, m)
+    header = json.dumps({
+        "goal_name": goal_name,
+        "criteria_names": list(criteria),
+        "alternative_names": list(alternatives),
+    }, ensure_ascii=False).encode("utf-8")
+    header += b" " * (-(_PREFIX.size + len(header)) % ALIGNMENT)
+    return b"".join([
+        _PREFIX.pack(MAGIC, FORMAT_VERSION, len(header)), header,
+        criteria_matrix.tobytes(), alt_matrices.tobytes(),
+    ])
+
+
+def save_binary(path, goal_name, criteria, alternatives, criteria_matrix, alt_matrices):
+    """Записує модель у файл бінарного формату."""
+    with open(path, "wb") as f:
+        f.write(model_to_bytes(goal_name, criteria, alternatives, criteria_matrix, alt_matrices))
+
+
+def _read_header(prefix):
+    # Розбирає початок файлу; повертає (заголовок, зсув блоку даних)
+    if len(prefix) < _PREFIX.size or not is_binary(prefix):
+        raise ValueError("Файл не є моделлю у бінарному форматі.")
+    _, version, length = _PREFIX.unpack_from(prefix)
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Непідтримувана версія бінарного формату: {version}.")
+    if len(prefix) < _PREFIX.size + length:
+        raise ValueError("Заголовок бінарного файлу обрізано.")
+    header = json.loads(bytes(prefix[_PREFIX.size:_PREFIX.size + length]))
+    _check_header(header)
+    return header, _PREFIX.size + length
+
+
+def _check_header(header):
+    # Заголовок має бути словником зі списками унікальних назв-рядків
+    if not isinstance(header, dict):
+        raise ValueError("Заголовок бінарного файлу має бути об'єктом JSON.")
+    for key in ("criteria_names", "alternative_names"):
+        names = header.get(key)
+        if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+            raise ValueError(f"У заголовку бінарного файлу немає списку назв '{key}'.")
+        if len(set(names)) != len(names):
+            raise ValueError(f"Назви '{key}' у заголовку бінарного файлу повторюються.")
+    if not isinstance(header.get("goal_name", ""), str):
+        raise ValueError("Назва мети в заголовку бінарного файлу має бути рядком.")
+
+
+def _split_block(header, block):
+    # Матриці як представлення (без копіювання) суцільного блоку даних
+    criteria, alternatives = header["criteria_names"], header["alternative_names"]
+    k, m = len(criteria), len(alternatives)
+    if block.size != k * k + k * m * m:
+        raise ValueError("Розмір блоку даних не відповідає заголовку.")
+    return (
+        header.get("goal_name", "ГОЛОВНА МЕТА"), criteria, alternatives,
+        block[:k * k].reshape(k, k), block[k * k:].reshape(k, m, m),
+    )
+
+
+def load_binary(path):
+    """
+    Модель з файлу бінарного формату через np.memmap (лише читання, без копіювання):
+    (goal_name, criteria_names, alternative_names, матриця критеріїв (k, k), матриці альтернатив (k, m, m)).
+    """
+    with open(path, "rb") as f:
+        prefix = f.read(_PREFIX.size)
+        if len(prefix) == _PREFIX.size and is_binary(prefix):
+            prefix += f.read(_PREFIX.unpack(prefix)[2])
+        size = os.fstat(f.fileno()).st_size
+    header, offset = _read_header(prefix)
+    k, m = len(header["criteria_names"]), len(header["alternative_names"])
+    count = k * k + k * m * m
+    if size != offset + count * BINARY_DTYPE.itemsize:
+        raise ValueError("Розмір блоку даних не відповідає заголовку.")
+    block = np.memmap(path, dtype=BINARY_DTYPE, mode="r", offset=offset, shape=(count,)) if count else np.empty(0)
+    return _split_block(header, block)
+
+
+def binary_from_bytes(data):
+    """Те саме, що load_binary, для байтів у пам'яті (np.frombuffer без копіювання)."""
+    header, offset = _read_header(memoryview(data))
+    if (len(data) - offset) % BINARY_DTYPE.itemsize:
+        raise ValueError("Розмір блоку даних не відповідає заголовку.")
+    return _split_block(header, np.frombuffer(data, dtype=BINARY_DTYPE, offset=offset))
+
+
+def read_model(data):
+    """Модель у форматі експорту з байтів файлу: бінарного або JSON."""
+    if is_binary(data):
+        return model_from_arrays(*binary_from_bytes(data))
+    return json.loads(data)
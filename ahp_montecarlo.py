@@ -0,0 +1,164 @@
+"""
+Стійкість ранжування до невизначеності суджень (метод Монте-Карло).
+
+Кожне судження над діагоналлю кожної матриці незалежно зсувається на
+-1, 0 або +1 крок шкали Сааті, симетричне стає оберненим, після чого ваги та
+глобальні пріоритети рахуються пакетами. Розіграші діляться на блоки
+фіксованого розміру з власними потоками випадкових чисел (SeedSequence.spawn),
+тому результат не залежить від кількості процесів.
+
+Пропущені судження неповних матриць не збурюються: кожен розіграш доповнюється
+заново за збуреними відомими судженнями (LLSM, як у ahp_core.complete_matrix),
+одним матричним добутком для всіх розіграшів.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import ahp_core
+
+# Кількість розіграшів в одному блоці (одне завдання для процесу)
+BLOCK_DRAWS = 5000
+
+# Скільки чисел float64 обробляється за один пакетний крок усередині блоку
+CHUNK_BUDGET = 4_000_000
+
+
+def scale_positions(matrices):
+    """Індекси найближчих (у логарифмічній шкалі) значень SAATY_SCALE."""
+    log_scale = np.log(ahp_core.SAATY_SCALE)
+    log_values = np.log(np.asarray(matrices, dtype=float))
+    return np.abs(log_values[..., None] - log_scale).argmin(axis=-1)
+
+
+def perturb(matrices, draws, rng, max_step=1):
+    """
+    Збурені копії стосу матриць (c, n, n): масив (draws, c, n, n).
+    Судження, зсунуте на 0 кроків, лишається без змін; інші отримують
+    значення шкали на відповідній відстані від найближчого до вихідного.
+    Пропущені судження (NaN над діагоналлю) лишаються пропущеними.
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    count, n = matrices.shape[0], matrices.shape[-1]
+    i, j = np.triu_indices(n, 1)
+    upper = matrices[:, i, j]
+
+    # Для кожного судження — таблиця можливих значень після зсуву
+    offsets = np.arange(-max_step, max_step + 1)
+    last = len(ahp_core.SAATY_SCALE) - 1
+    choices = ahp_core.SAATY_SCALE[np.clip(scale_positions(upper)[..., None] + offsets, 0, last)]
+    choices[..., max_step] = upper
+    choices[np.isnan(upper)] = np.nan
+    base = np.arange(upper.size).reshape(upper.shape) * len(offsets)
+    picked = base + rng.integers(0, len(offsets), size=(draws,) + upper.shape, dtype=np.int8)
+    values = choices.ravel()[picked]
+    inverse = (1 / choices).ravel()[picked]
+
+    # Перестановка, що розкладає [діагональ, верхній трикутник, нижній] у порядок n x n
+    pairs = len(i)
+    order = np.empty(n * n, dtype=np.intp)
+    order[np.arange(n) * (n + 1)] = np.arange(n)
+    order[i * n + j] = n + np.arange(pairs)
+    order[j * n + i] = n + pairs + np.arange(pairs)
+    parts = np.concatenate([np.ones((draws, count, n)), values, inverse], axis=-1)
+    return parts[..., order].reshape(draws, count, n, n)
+
+
+def _completion(matrix):
+    # Для неповної матриці — (пропущені пари i, j над діагоналлю, відомі пари, оператор LLSM);
+    # для повної — None
+    n = len(matrix)
+    i, j = np.triu_indices(n, 1)
+    missing = np.isnan(matrix[i, j])
+    if not missing.any():
+        return None
+    known_i, known_j, operator = ahp_core.llsm_operator(matrix)
+    return i[missing], j[missing], known_i, known_j, operator
+
+
+def complete_draws(draws, completion):
+    """
+    Доповнює на місці стос збурених копій однієї матриці (d, n, n): пропущені
+    судження стають відношеннями w_i / w_j ваг LLSM за відомими судженнями кожної копії.
+    """
+    if completion is None:
+        return draws
+    rows, cols, known_i, known_j, operator = completion
+    log_w = np.log(draws[:, known_i, known_j]) @ operator.T
+    ratio = np.exp(log_w[:, rows] - log_w[:, cols])
+    draws[:, rows, cols] = ratio
+    draws[:, cols, rows] = 1 / ratio
+    return draws
+
+
+def _simulate_block(criteria_matrix, alt_matrices, draws, seed, method, max_step):
+    # Один блок розіграшів; повертає глобальні пріоритети (draws, m)
+    rng = np.random.default_rng(seed)
+    k, m = alt_matrices.shape[:2]
+    chunk = max(1, CHUNK_BUDGET // (k * m * m + k * k))
+    priorities = np.empty((draws, m))
+    criteria_completion = _completion(criteria_matrix)
+    alt_completions = [_completion(matrix) for matrix in alt_matrices]
+
+    for start in range(0, draws, chunk):
+        size = min(chunk, draws - start)
+        criteria_draws = complete_draws(perturb(criteria_matrix[None], size, rng, max_step)[:, 0], criteria_completion)
+        criteria = ahp_core.calc_weights_batch(criteria_draws, method)
+        alts = perturb(alt_matrices, size, rng, max_step)
+        for c, completion in enumerate(alt_completions):
+            alts[:, c] = complete_draws(alts[:, c], completion)
+        local = ahp_core.calc_weights_batch(alts.reshape(size * k, m, m), method).reshape(size, k, m)
+        priorities[start:start + size] = np.einsum("dkm,dk->dm", local, criteria)
+    return priorities
+
+
+def robustness(criteria_matrix, alt_matrices, draws=10000, seed=0, method=ahp_core.MEAN,
+               max_step=1, confidence=0.95, workers=None):
+    """
+    Стійкість ранжування для матриці критеріїв (k x k) і стосу матриць
+    альтернатив (k, m, m) у порядку критеріїв. Матриці можуть бути неповними
+    (NaN), якщо судження пов'язують усі елементи; збурюються лише задані судження.
+
+    Повертає словник:
+      acceptability — (m, m), частка розіграшів, у яких альтернатива a має ранг r (0 — найкраща);
+      mean, lower, upper — середні глобальні пріоритети та межі довірчого інтервалу;
+      draws — кількість розіграшів.
+    """
+    # Судження, задане лише з одного боку діагоналі, дзеркалиться, тож NaN над діагоналлю — пропуск пари
+    criteria_matrix = np.asarray(criteria_matrix, dtype=float)
+    criteria_matrix = np.where(np.isnan(criteria_matrix), 1 / criteria_matrix.T, criteria_matrix)
+    alt_matrices = np.asarray(alt_matrices, dtype=float)
+    alt_matrices = np.where(np.isnan(alt_matrices), 1 / alt_matrices.transpose(0, 2, 1), alt_matrices)
+    for matrix in [criteria_matrix, *alt_matrices]:
+        if not ahp_core.is_complete(matrix) and not ahp_core.is_connected(matrix):
+            raise ValueError("Граф порівнянь незв'язний: пріоритети неможливо визначити.")
+
+    sizes = [BLOCK_DRAWS] * (draws // BLOCK_DRAWS)
+    if draws % BLOCK_DRAWS:
+        sizes.append(draws % BLOCK_DRAWS)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [(criteria_matrix, alt_matrices, size, s, method, max_step) for size, s in zip(sizes, seeds)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(args) == 1:
+        blocks = [_simulate_block(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(args))) as pool:
+            blocks = list(pool.map(_simulate_block, *zip(*args)))
+    priorities = np.concatenate(blocks)
+
+    m = priorities.shape[1]
+    ranks = np.argsort(np.argsort(-priorities, axis=1, kind="stable"), axis=1, kind="stable")
+    acceptability = np.bincount((np.arange(m) * m + ranks).ravel(), minlength=m * m).reshape(m, m)
+    acceptability = acceptability / len(ranks)
+
+    tail = (1 - confidence) / 2 * 100
+    lower, upper = np.percentile(priorities, [tail, 100 - tail], axis=0)
+    return {
+        "acceptability": acceptability,
+        "mean": priorities.mean(axis=0),
+        "lower": lower,
+        "upper": upper,
+        "draws": len(priorities),
+    }
@@ -0,0 +1,123 @@
+"""
+Пошук суперечливих суджень і пропозиції виправлень для зниження ВУ.
+
+Внесок судження в неузгодженість оцінюється за матрицею відношень
+e_ij = a_ij * w_j / w_i: для узгодженої матриці всі e_ij = 1, а lambda_max —
+середня сума рядків e. Заміна пари (a_ij, a_ji) на (v, 1/v) за незмінних ваг
+змінює lambda_max на ((v - a_ij) * w_j / w_i + (1/v - a_ji) * w_i / w_j) / n,
+тому ця оцінка першого порядку рахується одразу для всіх суджень і всіх
+значень шкали Сааті. Кілька найкращих кандидатів перевіряються точним
+пакетним розрахунком, і найкраща заміна застосовується; кроки повторюються,
+доки ВУ не стане нижчим за поріг.
+"""
+import numpy as np
+
+import ahp_core
+
+# Скільки кандидатів з найкращою оцінкою перевіряється точно на кожному кроці
+VERIFY_CANDIDATES = 32
+
+
+def inconsistency_ratios(matrix, weights=None, method=ahp_core.MEAN):
+    """Матриця відношень e_ij = a_ij * w_j / w_i (одиниці для узгодженої матриці)."""
+    matrix = np.asarray(matrix, dtype=float)
+    if weights is None:
+        weights = ahp_core.calc_weights(matrix, method)
+    return matrix * weights[None, :] / weights[:, None]
+
+
+def worst_judgments(matrix, count=5, method=ahp_core.MEAN):
+    """
+    Судження над діагоналлю з найбільшим внеском у неузгодженість:
+    список (i, j, a_ij, w_i / w_j, |ln e_ij|) за спаданням відхилення.
+    Пропущені судження (NaN) не враховуються.
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    complete = matrix if ahp_core.is_complete(matrix) else ahp_core.complete_matrix(matrix)
+    weights = ahp_core.calc_weights(complete, method)
+    deviation = np.abs(np.log(inconsistency_ratios(complete, weights)))
+    i, j = np.triu_indices(len(matrix), 1)
+    given = ~np.isnan(matrix[i, j])
+    i, j = i[given], j[given]
+    order = np.argsort(-deviation[i, j], kind="stable")[:count]
+    return [
+        (int(i[p]), int(j[p]), float(matrix[i[p], j[p]]), float(weights[i[p]] / weights[j[p]]), float(deviation[i[p], j[p]]))
+        for p in order
+    ]
+
+
+def _with_edits(matrix, rows, cols, values):
+    # Стос копій матриці, у кожній з яких замінено одну пару (a_ij, a_ji)
+    candidates = np.repeat(matrix[None], len(values), axis=0)
+    idx = np.arange(len(values))
+    candidates[idx, rows, cols] = values
+    candidates[idx, cols, rows] = 1 / values
+    return candidates
+
+
+def propose_repairs(matrix, threshold=ahp_core.CR_LIMIT, method=ahp_core.MEAN, max_edits=None):
+    """
+    Мінімальний (жадібно) набір замін суджень значеннями шкали Сааті, після
+    якого ВУ не перевищує threshold (типово ahp_core.CR_LIMIT). Змінюються лише
+    задані судження.
+
+    Повертає словник:
+      edits — список {"row", "col", "old", "new", "cr"} (cr — ВУ після заміни);
+      matrix — виправлена матриця (пропущені судження лишаються NaN);
+      cr_before, cr_after — ВУ до і після; reached — чи досягнуто порогу.
+    """
+    original = np.asarray(matrix, dtype=float)
+    n = len(original)
+    current = original.copy()
+    rows, cols = np.triu_indices(n, 1)
+    given = ~np.isnan(original[rows, cols])
+    rows, cols = rows[given], cols[given]
+    max_edits = len(rows) if max_edits is None else max_edits
+    scale = ahp_core.SAATY_SCALE
+    ri = ahp_core.random_index(n)
+
+    def evaluate(stack):
+        # Точні ВУ для стосу матриць (неповні доповнюються)
+        full = np.array([m if ahp_core.is_complete(m) else ahp_core.complete_matrix(m) for m in stack])
+        weights = ahp_core.calc_weights_batch(full, method)
+        return ahp_core.consistency_batch(full, weights)[2], weights
+
+    cr_values, weights = evaluate(current[None])
+    cr_before = cr = float(cr_values[0])
+    edits = []
+    edited = np.zeros(len(rows), dtype=bool)
+    while n >= 3 and ri and cr > threshold and len(edits) < max_edits and not edited.all():
+        # Оцінка першого порядку для всіх суджень x значень шкали: (судження, значення)
+        w = weights[0]
+        old = current[rows, cols]
+        forward, backward = (w[cols] / w[rows])[:, None], (w[rows] / w[cols])[:, None]
+        delta_lambda = ((scale[None, :] - old[:, None]) * forward + (1 / scale[None, :] - 1 / old[:, None]) * backward) / n
+        estimate = cr + delta_lambda / ((n - 1) * ri)
+        estimate[np.isclose(scale[None, :], old[:, None]) | edited[:, None]] = np.inf
+
+        # Точна перевірка найкращих кандидатів одним пакетом
+        count = min(VERIFY_CANDIDATES, int(np.isfinite(estimate).sum()))
+        if count == 0:
+            break
+        best = np.argpartition(estimate.ravel(), count - 1)[:count]
+        pair, value = np.unravel_index(best, estimate.shape)
+        exact, candidate_weights = evaluate(_with_edits(current, rows[pair], cols[pair], scale[value]))
+
+        # Якщо поріг досягається, обираємо найменшу за кроками шкали заміну, інакше — найбільше зниження ВУ
+        passing = np.flatnonzero(exact <= threshold)
+        if len(passing):
+            distance = np.abs(np.log(scale[value[passing]]) - np.log(old[pair[passing]]))
+            choice = passing[np.lexsort((exact[passing], distance))[0]]
+        else:
+            choice = int(np.argmin(exact))
+        if exact[choice] >= cr:
+            break
+
+        p, v = pair[choice], scale[value[choice]]
+        i, j = rows[p], cols[p]
+        edits.append({"row": int(i), "col": int(j), "old": float(current[i, j]), "new": float(v), "cr": float(exact[choice])})
+        current[i, j], current[j, i] = v, 1 / v
+        edited[p] = True
+        cr, weights = float(exact[choice]), candidate_weights[choice][None]
+
+    return {"edits": edits, "matrix": current, "cr_before": cr_before, "cr_after": cr, "reached": cr <= threshold}
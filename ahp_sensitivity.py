@@ -0,0 +1,63 @@
+"""
+Аналіз чутливості глобальних пріоритетів до ваг критеріїв.
+
+Для кожного критерію його вага пробігає сітку значень, а ваги решти критеріїв
+пропорційно масштабуються так, щоб сума лишалася 1. Усі варіанти рахуються
+одним матричним добутком.
+"""
+import numpy as np
+
+
+def sweep_weights(criteria_weights, grid):
+    """
+    Ваги критеріїв для всіх точок сітки: масив (k, p, k), де [j, t] — вектор ваг,
+    у якому вага критерію j дорівнює grid[t]. Якщо інші критерії мали нульову
+    сумарну вагу, залишок ділиться між ними порівну.
+    """
+    criteria_weights = np.asarray(criteria_weights, dtype=float)
+    grid = np.asarray(grid, dtype=float)
+    k = len(criteria_weights)
+
+    # share[j, i] — частка критерію i у вазі, що лишається після критерію j
+    rest = 1 - criteria_weights
+    empty = rest <= 1e-12
+    share = criteria_weights[None, :] / np.where(empty, 1.0, rest)[:, None]
+    share[empty] = 1 / max(k - 1, 1)
+
+    weights = (1 - grid)[None, :, None] * share[:, None, :]
+    idx = np.arange(k)
+    weights[idx, :, idx] = grid
+    return weights
+
+
+def sensitivity_sweep(local_weights, criteria_weights, grid):
+    """
+    Глобальні пріоритети для всіх точок сітки: масив (k, p, m) для
+    k критеріїв, p точок сітки і m альтернатив.
+    local_weights — матриця (альтернативи x критерії) локальних ваг.
+    """
+    local_weights = np.asarray(local_weights, dtype=float)
+    return sweep_weights(criteria_weights, grid) @ local_weights.T
+
+
+def break_even_points(local_weights, criteria_weights, grid, priorities=None):
+    """
+    Точки, у яких змінюється найкраща альтернатива.
+    Оскільки пріоритети лінійні за вагою одного критерію, точка перетину між
+    сусідніми вузлами сітки знаходиться точно лінійною інтерполяцією.
+    Повертає словник масивів: criterion, weight, before, after (індекси альтернатив).
+    """
+    grid = np.asarray(grid, dtype=float)
+    if priorities is None:
+        priorities = sensitivity_sweep(local_weights, criteria_weights, grid)
+
+    top = priorities.argmax(axis=2)
+    crit, step = np.nonzero(top[:, 1:] != top[:, :-1])
+    before, after = top[crit, step], top[crit, step + 1]
+
+    gap_start = priorities[crit, step, before] - priorities[crit, step, after]
+    gap_end = priorities[crit, step + 1, before] - priorities[crit, step + 1, after]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        share = np.where(gap_start != gap_end, gap_start / (gap_start - gap_end), 0.0)
+    weight = grid[step] + (grid[step + 1] - grid[step]) * share
+    return {"criterion": crit, "weight": weight, "before": before, "after": after}
@@ -0,0 +1,247 @@
+"""
+HTTP-сервіс розрахунку моделей методу Сааті (лише стандартна бібліотека й NumPy).
+
+    python ahp_service.py --port 8000
+    curl -X POST --data-binary @ahp_matrices.json "http://127.0.0.1:8000/score?method=eigen"
+
+POST /score приймає модель у форматі експорту (JSON або .ahpm) і повертає
+результат ahp_synthesis.score_models: ваги, lambda_max / ІУ / ВУ кожної матриці
+та глобальні пріоритети. GET /health повертає стан і статистику кешу.
+
+Сервіс не зберігає стану між запитами, крім кешу результатів. Запити
+обробляються асинхронно; одночасні запити збираються в мікропакети, які
+рахуються одним викликом score_models в окремому потоці, а однакові запити
+(за хешем тіла і методом) беруться з кешу або чекають на вже запущений розрахунок.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import ahp_cache
+import ahp_core
+import ahp_io
+from ahp_synthesis import score_models
+
+# Найбільший розмір тіла запиту (байт)
+MAX_BODY = 16 * 1024 * 1024
+
+_REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 500: "Internal Server Error",
+}
+
+
+class ResultCache(ahp_cache.LRUCache):
+    """LRU-кеш відповідей за хешем тіла запиту й методу."""
+
+    @staticmethod
+    def key(body, method):
+        digest = hashlib.blake2b(body, digest_size=16)
+        digest.update(method.encode())
+        return digest.hexdigest()
+
+
+class MicroBatcher:
+    """
+    Збирає моделі одночасних запитів у пакети до max_batch штук, чекаючи
+    щонайбільше max_delay секунд після першої моделі, і рахує кожен пакет
+    одним викликом score_models у пулі потоків, не блокуючи цикл подій.
+    """
+
+    def __init__(self, max_batch=64, max_delay=0.002):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.batches = 0
+        self.batched_models = 0
+        self._queues = {}
+
+    async def score(self, model, method):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if method not in self._queues:
+            self._queues[method] = asyncio.Queue()
+            loop.create_task(self._worker(method, self._queues[method]))
+        await self._queues[method].put((model, future))
+        return await future
+
+    async def _worker(self, method, queue):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0 and queue.empty():
+                    break
+                try:
+                    batch.append(queue.get_nowait() if timeout <= 0 else await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            models = [model for model, _ in batch]
+            try:
+                results = await loop.run_in_executor(None, score_models, models, method)
+            except Exception:
+                # Збій спільного розрахунку: моделі рахуються поодинці, щоб помилка
+                # однієї не зачепила інші запити пакета
+                results = await loop.run_in_executor(None, _score_each, models, method)
+            self.batches += 1
+            self.batched_models += len(batch)
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+
+def _score_each(models, method):
+    # Результат або виняток для кожної моделі окремо
+    results = []
+    for model in models:
+        try:
+            results.append(score_models([model], method)[0])
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+class ScoringService:
+    """Обробник HTTP-запитів: маршрутизація, кеш результатів і мікропакети."""
+
+    def __init__(self, max_batch=64, max_delay=0.002, cache_size=4096):
+        self.cache = ResultCache(cache_size)
+        self.batcher = MicroBatcher(max_batch, max_delay)
+        self._pending = {}
+
+    async def score(self, body, method):
+        """(статус, відповідь) для тіла запиту POST /score."""
+        key = ResultCache.key(body, method)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        # Однаковий запит, що вже рахується, не запускається вдруге
+        if key in self._pending:
+            return await asyncio.shield(self._pending[key])
+
+        task = asyncio.ensure_future(self._compute(body, method))
+        self._pending[key] = task
+        try:
+            response = await task
+        finally:
+            del self._pending[key]
+        if response[0] == 200:
+            self.cache.put(key, response)
+        return response
+
+    async def _compute(self, body, method):
+        try:
+            model = ahp_io.read_model(body)
+        except Exception as e:
+            return 400, {"error": f"Некоректне тіло запиту: {e}"}
+        result = await self.batcher.score(model, method)
+        return (400 if "error" in result else 200), result
+
+    def health(self):
+        return 200, {
+            "status": "ok",
+            "cache": self.cache.stats(),
+            "batches": self.batcher.batches,
+            "batched_models": self.batcher.batched_models,
+        }
+
+    async def route(self, verb, target, body):
+        url = urlsplit(target)
+        if url.path == "/health":
+            return self.health() if verb == "GET" else (405, {"error": "Дозволено лише GET."})
+        if url.path == "/score":
+            if verb != "POST":
+                return 405, {"error": "Дозволено лише POST."}
+            method = parse_qs(url.query).get("method", [ahp_core.MEAN])[0]
+            if method not in ahp_core.METHODS:
+                return 400, {"error": f"Невідомий метод: {method}. Доступні: {', '.join(ahp_core.METHODS)}."}
+            return await self.score(body, method)
+        return 404, {"error": f"Невідомий шлях: {url.path}"}
+
+    async def handle_connection(self, reader, writer):
+        # HTTP/1.1 з keep-alive: запити одного з'єднання обробляються по черзі
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                verb, target, version = request_line.decode("latin-1").split(maxsplit=2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get("content-length", 0))
+                    if length < 0:
+                        raise ValueError(length)
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "Некоректний заголовок Content-Length."}, keep_alive=False)
+                    break
+                if length > MAX_BODY:
+                    await self._respond(writer, 413, {"error": "Завеликий запит."}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                keep_alive = headers.get("connection", "").lower() != "close" and version.strip() == "HTTP/1.1"
+                try:
+                    status, payload = await self.route(verb.upper(), target, body)
+                except Exception as e:
+                    # Непередбачена помилка — відповідь 500 замість розірваного з'єднання
+                    status, payload = 500, {"error": f"Внутрішня помилка сервісу: {e!r}"}
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + data)
+        await writer.drain()
+
+
+async def serve(host="127.0.0.1", port=8000, max_batch=64, max_delay=0.002, cache_size=4096):
+    """Запускає сервіс і працює, доки його не зупинять."""
+    service = ScoringService(max_batch, max_delay, cache_size)
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    print(f"Сервіс розрахунку слухає http://{host}:{port}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTTP-сервіс розрахунку моделей методу Сааті.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-batch", type=int, default=64, help="найбільше моделей в одному мікропакеті")
+    parser.add_argument("--max-delay-ms", type=float, default=2.0, help="скільки чекати на інші запити пакета, мс")
+    parser.add_argument("--cache-size", type=int, default=4096, help="кількість відповідей у кеші")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.max_batch, args.max_delay_ms / 1000, args.cache_size))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
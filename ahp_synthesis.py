@@ -0,0 +1,181 @@
+"""
+Інкрементний синтез глобальних пріоритетів.
+
+Локальні ваги альтернатив зберігаються в одному масиві (альтернативи x критерії),
+тому зміна однієї матриці альтернатив оновлює лише свій стовпець і вектор
+глобальних пріоритетів (оновлення рангу 1) без перерахунку всього добутку.
+
+Для пакетних задач score_models рахує цілі моделі у форматі експорту:
+матриці кількох моделей обробляються разом, пакетами за розміром.
+Моделі з підкритеріями рахуються окремо, через ahp_hierarchy.Hierarchy.
+"""
+import numpy as np
+
+import ahp_cache
+import ahp_core
+from ahp_hierarchy import Hierarchy
+from ahp_io import model_arrays
+
+
+class IncrementalSynthesis:
+    """Глобальні пріоритети, які оновлюються по одному стовпцю або вектору ваг критеріїв."""
+
+    # Після стількох інкрементних оновлень добуток перераховується повністю,
+    # щоб не накопичувалася похибка округлення
+    REFRESH_EVERY = 1000
+
+    def __init__(self, local_weights, criteria_weights):
+        # Порядок "F": стовпець одного критерію лежить у пам'яті суцільно
+        self.local = np.array(local_weights, dtype=float, order="F")
+        self.criteria = np.array(criteria_weights, dtype=float)
+        if self.local.ndim != 2 or self.local.shape[1] != len(self.criteria):
+            raise ValueError("Розмір ваг критеріїв не відповідає кількості стовпців локальних ваг.")
+        self.refresh()
+
+    @property
+    def shape(self):
+        return self.local.shape
+
+    def refresh(self):
+        """Повний перерахунок глобальних пріоритетів."""
+        self.priorities = self.local @ self.criteria
+        self._updates = 0
+        return self.ranking()
+
+    def ranking(self):
+        """Індекси альтернатив від найкращої до найгіршої."""
+        return np.argsort(-self.priorities, kind="stable")
+
+    def _updated(self):
+        self._updates += 1
+        if self._updates >= self.REFRESH_EVERY:
+            return self.refresh()
+        return self.ranking()
+
+    def update_column(self, j, weights):
+        """
+        Нові локальні ваги альтернатив за критерієм j.
+        Глобальні пріоритети змінюються на (нові - старі) * вага критерію j.
+        Повертає нове ранжування; якщо ваги не змінилися, нічого не перераховує.
+        """
+        weights = np.asarray(weights, dtype=float)
+        delta = weights - self.local[:, j]
+        if not delta.any():
+            return self.ranking()
+        self.local[:, j] = weights
+        self.priorities += delta * self.criteria[j]
+        return self._updated()
+
+    def update_criteria(self, criteria_weights):
+        """Нові ваги критеріїв. Повертає нове ранжування."""
+        criteria_weights = np.asarray(criteria_weights, dtype=float)
+        delta = criteria_weights - self.criteria
+        changed = np.flatnonzero(delta)
+        if not len(changed):
+            return self.ranking()
+        self.criteria = criteria_weights.copy()
+        # Лише стовпці критеріїв, вага яких змінилася
+        self.priorities += self.local[:, changed] @ delta[changed]
+        return self._updated()
+
+
+def score_models(models, method=ahp_core.MEAN):
+    """
+    Ваги, узгодженість і глобальні пріоритети для набору моделей у форматі експорту.
+
+    Повертає список словників у порядку моделей: goal_name, criteria_weights
+    і priorities ({назва: значення}), local_weights ({критерій: {альтернатива: вага}}),
+    best (найкраща альтернатива), criteria_cr, alt_cr ({критерій: ВУ}), max_cr і
+    consistency ({"criteria": {lambda_max, ci, cr}, "alternatives": {критерій: {...}}}).
+    Для моделі з підкритеріями local_weights і alt_cr задаються для листових
+    критеріїв, а також додаються node_weights (глобальні ваги всіх вузлів) і
+    consistency["sub_criteria"]. Для моделі, яку не вдалося розрахувати, — лише
+    goal_name і error.
+    """
+    results = [None] * len(models)
+    parsed = []
+    cache = None
+    for idx, model in enumerate(models):
+        try:
+            if isinstance(model, dict) and model.get("sub_criteria"):
+                cache = cache or ahp_cache.WeightsCache()
+                results[idx] = _score_hierarchy(model, method, cache)
+            else:
+                parsed.append((idx, model_arrays(model)))
+        except (KeyError, TypeError, ValueError) as e:
+            results[idx] = {"goal_name": _goal(model), "error": f"Некоректна модель: {e!r}"}
+
+    # Усі матриці всіх моделей — одним викликом evaluate_many
+    matrices = []
+    for _, (_, _, criteria_matrix, alt_matrices) in parsed:
+        matrices.append(criteria_matrix)
+        matrices.extend(alt_matrices)
+    weights, lambda_max, ci, cr = ahp_core.evaluate_many(matrices, method)
+
+    start = 0
+    for idx, (criteria, alternatives, _, _) in parsed:
+        end = start + 1 + len(criteria)
+        model_weights, model_cr = weights[start:end], cr[start:end]
+        consistency = [
+            {"lambda_max": float(values[0]), "ci": float(values[1]), "cr": float(values[2])}
+            for values in zip(lambda_max[start:end], ci[start:end], model_cr)
+        ]
+        start = end
+        if any(np.isnan(w).any() for w in model_weights):
+            results[idx] = {"goal_name": _goal(models[idx]), "error": "Не вдалося розрахувати ваги: матриця некоректна."}
+            continue
+        local = np.column_stack(model_weights[1:]) if criteria else np.zeros((len(alternatives), 0))
+        priorities = ahp_core.global_priorities(model_weights[0], local)
+        results[idx] = {
+            "goal_name": _goal(models[idx]),
+            "criteria_weights": dict(zip(criteria, model_weights[0].tolist())),
+            "priorities": dict(zip(alternatives, priorities.tolist())),
+            "local_weights": {crit: dict(zip(alternatives, w.tolist())) for crit, w in zip(criteria, model_weights[1:])},
+            "best": alternatives[int(np.argmax(priorities))] if alternatives else None,
+            "criteria_cr": float(model_cr[0]),
+            "alt_cr": dict(zip(criteria, model_cr[1:].tolist())),
+            "max_cr": float(model_cr.max()),
+            "consistency": {"criteria": consistency[0], "alternatives": dict(zip(criteria, consistency[1:]))},
+        }
+    return results
+
+
+def _score_hierarchy(model, method, cache):
+    # Модель з підкритеріями: синтез через Hierarchy замість плоскої схеми
+    hierarchy = Hierarchy.from_model(model, method, cache=cache)
+    goal = _goal(model)
+    priorities = hierarchy.priorities()
+    if np.isnan(priorities).any():
+        return {"goal_name": goal, "error": "Не вдалося розрахувати ваги: матриця некоректна."}
+
+    alternatives = hierarchy.alternatives
+    criteria = model["criteria_names"]
+    leaves = hierarchy.leaves
+    node_weights = hierarchy.node_weights()
+    consistency = {
+        name: {"lambda_max": float(lam), "ci": float(ci), "cr": float(cr)}
+        for name, (lam, ci, cr) in hierarchy.consistency().items()
+    }
+    goal_node = model.get("goal_name", "ГОЛОВНА МЕТА")
+    return {
+        "goal_name": goal,
+        "criteria_weights": {crit: float(node_weights[crit]) for crit in criteria},
+        "priorities": dict(zip(alternatives, priorities.tolist())),
+        "local_weights": {
+            leaf: dict(zip(alternatives, cache.weights(hierarchy.matrices[leaf], method).tolist())) for leaf in leaves
+        },
+        "best": alternatives[int(np.argmax(priorities))] if alternatives else None,
+        "criteria_cr": consistency[goal_node]["cr"],
+        "alt_cr": {leaf: consistency[leaf]["cr"] for leaf in leaves},
+        "max_cr": float(np.max([values["cr"] for values in consistency.values()])),
+        "node_weights": {name: float(w) for name, w in node_weights.items() if name != goal_node},
+        "consistency": {
+            "criteria": consistency[goal_node],
+            "alternatives": {leaf: consistency[leaf] for leaf in leaves},
+            "sub_criteria": {name: consistency[name] for name in model["sub_criteria"] if name in consistency},
+        },
+    }
+
+
+def _goal(model):
+    return model.get("goal_name", "ГОЛОВНА МЕТА") if isinstance(model, dict) else None
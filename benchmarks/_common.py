@@ -0,0 +1,25 @@
+"""Спільні допоміжні функції для бенчмарків."""
+import time
+
+
+def best_time(func, repeat=5, number=1):
+    """Найкращий час одного виклику func() у секундах."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def autorange(func, min_time=0.02):
+    """Кількість викликів func(), яка разом триває щонайменше min_time секунд."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - start >= min_time:
+            return number
+        number *= 2
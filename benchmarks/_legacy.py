@@ -0,0 +1,84 @@
+"""
+Початкова реалізація розрахунків на pandas (до винесення в ahp_core).
+Використовується як еталон у бенчмарках; виклики st.warning/st.error прибрано.
+"""
+import numpy as np
+import pandas as pd
+
+from ahp_core import RI_TABLE
+
+
+def calc_weights(matrix):
+    col_sum = matrix.sum(axis=0)
+    if (col_sum == 0).any():
+        return pd.Series(np.nan, index=matrix.index)
+    if not np.all(np.isfinite(col_sum)) or (col_sum == 0).all():
+        return pd.Series(np.nan, index=matrix.index)
+
+    norm = matrix / col_sum
+    weights = norm.mean(axis=1)
+    return weights
+
+
+def calculate_consistency(matrix):
+    n = len(matrix)
+    if n < 3:
+        return n, 0, 0
+
+    weights = calc_weights(matrix)
+    if weights.isnull().any():
+        return np.nan, np.nan, np.nan
+
+    aw_vector = matrix.dot(weights)
+    consist_vector = aw_vector / weights
+    lambda_max = consist_vector.mean()
+    ci = (lambda_max - n) / (n - 1)
+
+    ri = RI_TABLE.get(n)
+    if ri == 0:
+        cr = 0
+    else:
+        cr = ci / ri
+    return lambda_max, ci, cr
+
+
+def fill_reciprocal(edited_df, prev):
+    # Цикл збереження матриці з кнопок «Зберегти зміни»
+    n = len(edited_df)
+    for i in range(n):
+        for j in range(i, n):
+            if i == j:
+                edited_df.iloc[i, j] = 1.0
+                continue
+            if edited_df.iloc[i, j] != prev.iloc[i, j]:
+                val = edited_df.iloc[i, j]
+                if val > 1:
+                    if np.isclose(val, np.round(val)): val = float(np.round(val))
+                    edited_df.iloc[i, j] = val
+                    edited_df.iloc[j, i] = round(1 / val, 3)
+                elif val < 1:
+                    val = round(val, 3)
+                    edited_df.iloc[i, j] = val
+                    inv_val = 1 / val
+                    if np.isclose(inv_val, np.round(inv_val)):
+                        edited_df.iloc[j, i] = float(np.round(inv_val))
+                    else:
+                        edited_df.iloc[j, i] = round(inv_val, 3)
+            elif edited_df.iloc[j, i] != prev.iloc[j, i]:
+                val = edited_df.iloc[j, i]
+                if val > 1:
+                    if np.isclose(val, np.round(val)): val = float(np.round(val))
+                    edited_df.iloc[j, i] = val
+                    edited_df.iloc[i, j] = round(1 / val, 3)
+                elif val < 1:
+                    val = round(val, 3)
+                    edited_df.iloc[j, i] = val
+                    inv_val = 1 / val
+                    if np.isclose(inv_val, np.round(inv_val)):
+                        edited_df.iloc[i, j] = float(np.round(inv_val))
+                    else:
+                        edited_df.iloc[i, j] = round(inv_val, 3)
+
+    # np.fill_diagonal(edited_df.values, ...) прибрано: діагональ уже заповнена
+    # циклом, а в pandas з copy-on-write .values доступний лише для читання
+    return edited_df
@@ -0,0 +1,80 @@
+"""
+Перезапуск сторінки saaty_app.py: час і розмір даних, що надсилаються в браузер.
+
+Використовує streamlit.testing (AppTest); розмір — сума розмірів protobuf усіх
+елементів сторінки, зокрема Arrow-таблиць редакторів матриць.
+
+Запуск з кореня репозиторію:
+    python -m benchmarks.bench_app_rerun
+    python -m benchmarks.bench_app_rerun --app old_saaty_app.py   # інша версія сторінки для порівняння
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+import ahp_core
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _nodes(node):
+    yield node
+    for child in getattr(node, "children", {}).values():
+        yield from _nodes(child)
+
+
+def payload(at):
+    """(байтів у protobuf елементів сторінки, кількість редакторів таблиць)."""
+    protos = [node.proto for node in _nodes(at._tree) if getattr(node, "proto", None) is not None]
+    size = sum(proto.ByteSize() for proto in protos if hasattr(proto, "ByteSize"))
+    editors = sum(1 for proto in protos if getattr(proto, "editing_mode", 0))
+    return size, editors
+
+
+def run(app, criteria, alternatives, reruns, seed):
+    rng = np.random.default_rng(seed)
+    names = [f"Критерій {j + 1}" for j in range(criteria)]
+    alts = [f"Альтернатива {i + 1}" for i in range(alternatives)]
+
+    at = AppTest.from_file(os.path.abspath(app), default_timeout=600)
+    at.session_state.num_criteria = criteria
+    at.session_state.num_alternatives = alternatives
+    at.session_state.criteria_matrix = pd.DataFrame(
+        ahp_core.random_reciprocal_matrices(1, criteria, rng)[0], index=names, columns=names
+    )
+    at.session_state.alt_matrices = {
+        crit: pd.DataFrame(matrix, index=alts, columns=alts)
+        for crit, matrix in zip(names, ahp_core.random_reciprocal_matrices(criteria, alternatives, rng))
+    }
+    at.run()
+    if at.exception:
+        raise RuntimeError(f"застосунок завершився з помилкою: {at.exception}")
+
+    times = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - start)
+    size, editors = payload(at)
+    print(f"{os.path.basename(app)}: {criteria} критеріїв x {alternatives} альтернатив")
+    print(f"  перезапуск: {min(times) * 1e3:.0f} мс (найкращий з {reruns}), "
+          f"дані сторінки: {size / 1024:.0f} КБ, редакторів таблиць: {editors}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--app", default=os.path.join(ROOT, "saaty_app.py"))
+    parser.add_argument("--criteria", type=int, default=20)
+    parser.add_argument("--alternatives", type=int, default=20)
+    parser.add_argument("--reruns", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.app, args.criteria, args.alternatives, args.reruns, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Порівняння пакетного API ahp_core з викликом початкових pandas-функцій у циклі.
+Збіг результатів перевіряється тестами (tests/test_batch.py).
+
+Запуск з кореня репозиторію:
+    python -m benchmarks.bench_batch
+"""
+import argparse
+
+import pandas as pd
+
+import ahp_core
+from benchmarks import _legacy
+from benchmarks._common import best_time
+
+
+def run(k, sizes, seed):
+    print(f"{'n':>4} {'k':>7} {'pandas, с':>12} {'batch, с':>12} {'прискорення':>12}")
+    for n in sizes:
+        stack = ahp_core.random_reciprocal_matrices(k, n, seed)
+        frames = [pd.DataFrame(m) for m in stack]
+
+        def legacy():
+            for df in frames:
+                _legacy.calc_weights(df)
+                _legacy.calculate_consistency(df)
+
+        def batch():
+            w = ahp_core.calc_weights_batch(stack)
+            ahp_core.consistency_batch(stack, w)
+
+        t_legacy = best_time(legacy, repeat=1)
+        t_batch = best_time(batch, repeat=3)
+        print(f"{n:>4} {k:>7} {t_legacy:>12.4f} {t_batch:>12.4f} {t_legacy / t_batch:>11.0f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-k", type=int, default=2000, help="кількість матриць кожного розміру")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 5, 7, 10])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.k, args.sizes, args.seed)
+
+
+if __name__ == "__main__":
+    main()
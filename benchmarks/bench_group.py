@@ -0,0 +1,55 @@
+"""
+Групове рішення (ahp_group): агрегування оцінок N експертів способами AIJ і AIP.
+Коректність агрегування перевіряється тестами (tests/test_group.py).
+
+Запуск з кореня репозиторію:
+    python -m benchmarks.bench_group
+"""
+import argparse
+
+import numpy as np
+
+import ahp_group
+from benchmarks._common import best_time
+
+
+def expert_matrices(experts, criteria, alternatives, noise, rng):
+    # Спільна «істинна» модель, кожен експерт оцінює її з логнормальним шумом
+    def judged(weights, count):
+        n = weights.shape[-1]
+        ratios = weights[..., :, None] / weights[..., None, :]
+        upper = np.triu(ratios * np.exp(rng.normal(0, noise, (count,) + ratios.shape)), 1)
+        with np.errstate(divide="ignore"):
+            return upper + np.swapaxes(np.where(upper > 0, 1 / upper, 0), -1, -2) + np.eye(n)
+
+    criteria_matrices = judged(rng.random(criteria) + 0.1, experts)
+    alt_matrices = judged(rng.random((criteria, alternatives)) + 0.1, experts)
+    return criteria_matrices, alt_matrices
+
+
+def run(experts, criteria, alternatives, noise, seed):
+    rng = np.random.default_rng(seed)
+    criteria_matrices, alt_matrices = expert_matrices(experts, criteria, alternatives, noise, rng)
+    print(f"Експертів: {experts}, матриць на експерта: {1 + criteria} "
+          f"(критерії {criteria} x {criteria}, альтернативи {alternatives} x {alternatives})")
+
+    for aggregation in (ahp_group.AIJ, ahp_group.AIP):
+        result = ahp_group.aggregate(criteria_matrices, alt_matrices, aggregation=aggregation)
+        seconds = best_time(lambda: ahp_group.aggregate(criteria_matrices, alt_matrices, aggregation=aggregation))
+        print(f"{aggregation.upper()}: {seconds * 1e3:.1f} мс, W Кендалла {result['kendall_w']:.3f}, "
+              f"ВУ групи (критерії) {result['group_cr'][0]:.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--experts", type=int, default=500)
+    parser.add_argument("--criteria", type=int, default=19, help="разом з матрицею критеріїв дає 20 матриць")
+    parser.add_argument("--alternatives", type=int, default=10)
+    parser.add_argument("--noise", type=float, default=0.3, help="стандартне відхилення ln-шуму суджень")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.experts, args.criteria, args.alternatives, args.noise, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Синтез багаторівневої ієрархії (ahp_hierarchy.Hierarchy): повний розрахунок
+і перерахунок після зміни однієї листової матриці.
+Збіг з рекурсивним синтезом перевіряється тестами (tests/test_hierarchy.py).
+
+Запуск з кореня репозиторію:
+    python -m benchmarks.bench_hierarchy
+"""
+import argparse
+import time
+
+import numpy as np
+
+import ahp_cache
+import ahp_core
+from ahp_hierarchy import Hierarchy
+
+
+def build(branching, alternatives, rng):
+    hierarchy = Hierarchy([f"A{i}" for i in range(alternatives)], cache=ahp_cache.WeightsCache(maxsize=100_000))
+
+    def add(name, level):
+        if level == len(branching):
+            hierarchy.add_node(name, (), ahp_core.random_reciprocal_matrices(1, alternatives, rng)[0])
+            return
+        children = [f"{name}.{i}" for i in range(branching[level])]
+        hierarchy.add_node(name, children, ahp_core.random_reciprocal_matrices(1, len(children), rng)[0])
+        for child in children:
+            add(child, level + 1)
+
+    add("G", 0)
+    return hierarchy
+
+
+def run(branching, alternatives, edits, seed):
+    rng = np.random.default_rng(seed)
+    hierarchy = build(branching, alternatives, rng)
+    leaves = hierarchy.leaves
+    print(f"Рівні: {' x '.join(map(str, branching))}, листків: {len(leaves)}, вузлів: {len(hierarchy.children)}, "
+          f"альтернатив: {alternatives}")
+
+    start = time.perf_counter()
+    hierarchy.priorities()
+    full = time.perf_counter() - start
+
+    new_matrices = ahp_core.random_reciprocal_matrices(edits, alternatives, rng)
+    targets = rng.integers(0, len(leaves), edits)
+    start = time.perf_counter()
+    for target, matrix in zip(targets, new_matrices):
+        hierarchy.set_matrix(leaves[target], matrix)
+        hierarchy.priorities()
+    incremental = (time.perf_counter() - start) / edits
+
+    print(f"Повний синтез: {full * 1e3:.1f} мс; після зміни одного листка: {incremental * 1e3:.2f} мс")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--branching", type=int, nargs="+", default=[5, 6, 10],
+                        help="кількість дочірніх вузлів на кожному рівні критеріїв")
+    parser.add_argument("--alternatives", type=int, default=20)
+    parser.add_argument("--edits", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.branching, args.alternatives, args.edits, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Розрахунок пріоритетів за неповними матрицями (ahp_core.llsm_weights).
+
+Для кожного n задається O(n) суджень: випадкове остовне дерево плюс n
+додаткових пар з узгодженої матриці із шумом; порівнюється відхилення від
+справжніх ваг. Коректність перевіряється тестами (tests/test_incomplete.py).
+
+Запуск з кореня репозиторію:
+    python -m benchmarks.bench_incomplete
+"""
+import argparse
+
+import numpy as np
+
+import ahp_core
+from benchmarks._common import best_time
+
+
+def sparse_judgments(weights, extra, noise, rng):
+    n = len(weights)
+    matrix = np.full((n, n), np.nan)
+    np.fill_diagonal(matrix, 1.0)
+    order = rng.permutation(n)
+    # Остовне дерево: кожна вершина з'єднується з однією з попередніх
+    parents = order[rng.integers(0, np.arange(1, n))]
+    pairs = list(zip(order[1:], parents))
+    pairs += list(zip(rng.integers(0, n, extra), rng.integers(0, n, extra)))
+    for i, j in pairs:
+        if i != j:
+            value = weights[i] / weights[j] * np.exp(rng.normal(0, noise))
+            matrix[i, j], matrix[j, i] = value, 1 / value
+    return matrix
+
+
+def run(sizes, noise, seed):
+    rng = np.random.default_rng(seed)
+    print(f"{'n':>5} {'суджень':>8} {'з n(n-1)/2':>11} {'llsm, мс':>9} {'доповнення, мс':>15} {'похибка ваг':>12}")
+    for n in sizes:
+        weights = rng.random(n) + 0.1
+        weights /= weights.sum()
+
+        matrix = sparse_judgments(weights, n, noise, rng)
+        given = int(np.triu(~np.isnan(matrix), 1).sum())
+        t_llsm = best_time(lambda: ahp_core.llsm_weights(matrix), repeat=5)
+        t_complete = best_time(lambda: ahp_core.complete_matrix(matrix), repeat=5)
+        error = np.abs(ahp_core.llsm_weights(matrix) - weights).max() / weights.max()
+        print(f"{n:>5} {given:>8} {n * (n - 1) // 2:>11} {t_llsm * 1e3:>9.2f} {t_complete * 1e3:>15.2f} {error:>12.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 30, 50, 100, 300])
+    parser.add_argument("--noise", type=float, default=0.1, help="стандартне відхилення шуму ln a_ij")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sizes, args.noise, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Запис і читання моделі: JSON (як у кнопці «Зберегти як JSON») проти бінарного формату .ahpm.
+
+Коректність обох форматів перевіряється тестами (tests/test_ahp_io.py).
+
+Запуск з кореня репозиторію:
+    python -m benchmarks.bench_io
+"""
+import argparse
+import json
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+import ahp_core
+import ahp_io
+from benchmarks._common import best_time
+
+
+def json_save(path, goal, criteria, alternatives, criteria_matrix, alt_matrices):
+    # Як у застосунку: ahp_io.model_to_json
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(ahp_io.model_to_json(goal, criteria, alternatives, criteria_matrix, alt_matrices))
+
+
+def json_load(path):
+    # Як у застосунку: json.load і pd.DataFrame для кожної матриці
+    with open(path, encoding="utf-8") as f:
+        imported = json.load(f)
+    return pd.DataFrame(imported["criteria_matrix"]), {k: pd.DataFrame(v) for k, v in imported["alt_matrices"].items()}
+
+
+def binary_load(path):
+    # memmap і сумування всіх значень (торкаємося кожної сторінки файлу)
+    arrays = ahp_io.load_binary(path)
+    np.nansum(arrays[4])
+    return arrays
+
+
+def run(criteria, alternatives, seed):
+    rng = np.random.default_rng(seed)
+    names = [f"Критерій {j + 1}" for j in range(criteria)]
+    alts = [f"Альтернатива {i + 1}" for i in range(alternatives)]
+    criteria_matrix = ahp_core.random_reciprocal_matrices(1, criteria, rng)[0]
+    alt_matrices = ahp_core.random_reciprocal_matrices(criteria, alternatives, rng)
+    print(f"Модель: {criteria} критеріїв, {alternatives} альтернатив")
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "model.json")
+        binary_path = os.path.join(directory, "model.ahpm")
+        args = ("Мета", names, alts, criteria_matrix, alt_matrices)
+
+        rows = [
+            ("JSON", best_time(lambda: json_save(json_path, *args)), best_time(lambda: json_load(json_path)),
+             os.path.getsize(json_path)),
+            ("ahpm", best_time(lambda: ahp_io.save_binary(binary_path, *args)), best_time(lambda: binary_load(binary_path)),
+             os.path.getsize(binary_path)),
+        ]
+
+    print(f"{'формат':>7} {'запис, мс':>10} {'читання, мс':>12} {'розмір, КБ':>11}")
+    for name, save, load, size in rows:
+        print(f"{name:>7} {save * 1e3:>10.2f} {load * 1e3:>12.2f} {size / 1024:>11.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--criteria", type=int, default=50)
+    parser.add_argument("--alternatives", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.criteria, args.alternatives, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Швидкість і точність методів розрахунку пріоритетів ahp_core.
+
+Точність — максимальне відхилення ваг і Lambda Max від головного власного
+вектора, знайденого numpy.linalg.eig.
+
+Запуск з кореня репозиторію:
+    python -m benchmarks.bench_methods
+"""
+import argparse
+
+import numpy as np
+
+import ahp_core
+from benchmarks._common import best_time
+
+
+def reference(stack):
+    values, vectors = np.linalg.eig(stack)
+    top = values.real.argmax(axis=1)
+    principal = np.abs(vectors[np.arange(len(stack)), :, top].real)
+    return principal / principal.sum(axis=1, keepdims=True), values.real.max(axis=1)
+
+
+def run(k, sizes, seed):
+    print(f"{'n':>4} {'метод':>10} {'час, с':>10} {'мкс/матр.':>10} {'похибка ваг':>12} {'похибка λmax':>13}")
+    for n in sizes:
+        stack = ahp_core.random_reciprocal_matrices(k, n, seed)
+        ref_w, ref_lam = reference(stack)
+        t_eig = best_time(lambda: reference(stack), repeat=3)
+        print(f"{n:>4} {'linalg.eig':>10} {t_eig:>10.4f} {t_eig / k * 1e6:>10.1f} {0:>12.1e} {0:>13.1e}")
+
+        for method in ahp_core.METHODS:
+            t = best_time(lambda: ahp_core.calc_weights_batch(stack, method), repeat=3)
+            w = ahp_core.calc_weights_batch(stack, method)
+            lam = ahp_core.consistency_batch(stack, w)[0]
+            err_w = np.abs(w - ref_w).max()
+            err_lam = np.abs(lam - ref_lam).max()
+            print(f"{n:>4} {method:>10} {t:>10.4f} {t / k * 1e6:>10.1f} {err_w:>12.1e} {err_lam:>13.1e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-k", type=int, default=2000, help="кількість матриць кожного розміру")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 4, 5, 6, 7, 8, 9, 10, 15, 20, 30])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.k, args.sizes, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Час моделювання стійкості ранжування (ahp_montecarlo.robustness) залежно від
+кількості процесів. Незалежність результату від кількості процесів
+перевіряється тестами (tests/test_montecarlo.py).
+
+Запуск з кореня репозиторію:
+    python -m benchmarks.bench_montecarlo
+"""
+import argparse
+import os
+import time
+
+import ahp_core
+import ahp_montecarlo
+
+
+def run(criteria, alternatives, draws, workers, seed):
+    criteria_matrix = ahp_core.random_reciprocal_matrices(1, criteria, seed)[0]
+    alt_matrices = ahp_core.random_reciprocal_matrices(criteria, alternatives, seed + 1)
+    print(f"{criteria} критеріїв, {alternatives} альтернатив, {draws} розіграшів")
+    print(f"{'процесів':>9} {'час, с':>8} {'розіграшів/с':>13}")
+
+    for count in workers:
+        start = time.perf_counter()
+        ahp_montecarlo.robustness(criteria_matrix, alt_matrices, draws=draws, seed=seed, workers=count)
+        elapsed = time.perf_counter() - start
+        print(f"{count:>9} {elapsed:>8.2f} {draws / elapsed:>13.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--criteria", type=int, default=10)
+    parser.add_argument("--alternatives", type=int, default=10)
+    parser.add_argument("--draws", type=int, default=100000)
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, os.cpu_count() or 1}))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.criteria, args.alternatives, args.draws, args.workers, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Векторизоване дзеркалення суджень (ahp_core.fill_reciprocal) проти початкового
+циклу з .iloc.
+
+Властивості fill_reciprocal перевіряються тестами (tests/test_fill_reciprocal.py).
+
+Запуск з кореня репозиторію:
+    python -m benchmarks.bench_reciprocal
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+import ahp_core
+from benchmarks import _legacy
+from benchmarks._common import best_time
+
+# Значення, які користувач може ввести в редакторі, включно з некоректними
+EDIT_VALUES = np.concatenate([
+    ahp_core.SAATY_SCALE,
+    [0.333, 0.3333333, 0.1429, 0.25, 0.3, 0.7, 1.5, 2.5, 2.0000001, 7.9999999, 0.5004, 0.0],
+])
+
+
+def saved_matrix(n, rng):
+    # Матриця у вигляді, в якому її зберігає застосунок
+    m = ahp_core.random_reciprocal_matrices(1, n, rng)[0]
+    return ahp_core.fill_reciprocal(m, np.ones((n, n)))
+
+
+def random_edit(prev, rng, count):
+    edited = prev.copy()
+    n = len(prev)
+    rows = rng.integers(0, n, count)
+    cols = rng.integers(0, n, count)
+    edited[rows, cols] = rng.choice(EDIT_VALUES, count)
+    return edited
+
+
+def run(sizes, seed):
+    rng = np.random.default_rng(seed)
+    print(f"{'n':>4} {'цикл .iloc, с':>14} {'fill_reciprocal, с':>19} {'прискорення':>12}")
+    for n in sizes:
+        prev = saved_matrix(n, rng)
+        edited = random_edit(prev, rng, n)
+        prev_df, edited_df = pd.DataFrame(prev), pd.DataFrame(edited)
+
+        with np.errstate(divide="ignore"):
+            t_legacy = best_time(lambda: _legacy.fill_reciprocal(edited_df.copy(), prev_df), repeat=3)
+            t_new = best_time(lambda: ahp_core.fill_reciprocal(edited, prev), repeat=5, number=20)
+        print(f"{n:>4} {t_legacy:>14.5f} {t_new:>19.6f} {t_legacy / t_new:>11.0f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 5, 10, 20, 40])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sizes, args.seed)
+
+
+if __name__ == "__main__":
+    main()
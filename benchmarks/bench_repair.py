@@ -0,0 +1,86 @@
+"""
+Виправлення неузгоджених матриць (ahp_repair): оцінка всіх замін одним пакетом
+проти перебору кожного судження і значення шкали по одному.
+Коректність виправлень перевіряється тестами (tests/test_repair.py).
+
+Запуск з кореня репозиторію:
+    python -m benchmarks.bench_repair
+"""
+import argparse
+import time
+
+import numpy as np
+
+import ahp_core
+import ahp_repair
+
+
+def judged(n, errors, rng):
+    # Узгоджена матриця, округлена до шкали Сааті, з кількома хибними судженнями
+    weights = rng.random(n) + 0.1
+    log_ratio = np.log(weights[:, None] / weights[None, :])
+    matrix = ahp_core.SAATY_SCALE[np.abs(log_ratio[..., None] - np.log(ahp_core.SAATY_SCALE)).argmin(axis=-1)]
+    bad = set()
+    while len(bad) < errors:
+        i, j = sorted(rng.choice(n, 2, replace=False))
+        # Судження у протилежний бік від істинного
+        matrix[i, j] = 9.0 if log_ratio[i, j] < 0 else 1 / 9
+        matrix[j, i] = 1 / matrix[i, j]
+        bad.add((int(i), int(j)))
+    return matrix, bad
+
+
+def naive_repairs(matrix, threshold, method):
+    # Еталон: на кожному кроці точний розрахунок ВУ для кожної заміни окремо
+    current = matrix.copy()
+    n = len(current)
+    cr = ahp_core.calculate_consistency(current, method=method)[2]
+    edits = 0
+    while cr > threshold:
+        best = None
+        for i in range(n):
+            for j in range(i + 1, n):
+                for v in ahp_core.SAATY_SCALE:
+                    trial = current.copy()
+                    trial[i, j], trial[j, i] = v, 1 / v
+                    trial_cr = ahp_core.calculate_consistency(trial, method=method)[2]
+                    if best is None or trial_cr < best[0]:
+                        best = trial_cr, i, j, v
+        cr, i, j, v = best
+        current[i, j], current[j, i] = v, 1 / v
+        edits += 1
+    return edits
+
+
+def run(sizes, errors, threshold, naive_limit, seed):
+    rng = np.random.default_rng(seed)
+    print(f"{'n':>4} {'ВУ до':>7} {'ВУ після':>9} {'замін':>6} {'знайдено хибних':>16} {'пакетно, мс':>12} {'перебір, мс':>12}")
+    for n in sizes:
+        matrix, bad = judged(n, errors or max(2, n // 2), rng)
+        start = time.perf_counter()
+        result = ahp_repair.propose_repairs(matrix, threshold)
+        fast = time.perf_counter() - start
+        found = sum((edit["row"], edit["col"]) in bad for edit in result["edits"])
+
+        slow = "—"
+        if n <= naive_limit:
+            start = time.perf_counter()
+            naive_repairs(matrix, threshold, ahp_core.MEAN)
+            slow = f"{(time.perf_counter() - start) * 1e3:.1f}"
+        print(f"{n:>4} {result['cr_before']:>7.3f} {result['cr_after']:>9.3f} {len(result['edits']):>6} "
+              f"{found:>9} з {len(bad):<4} {fast * 1e3:>12.1f} {slow:>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 10, 20, 30, 50])
+    parser.add_argument("--errors", type=int, default=None, help="кількість хибних суджень (типово n / 2)")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--naive-limit", type=int, default=20, help="найбільше n для еталонного перебору")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sizes, args.errors, args.threshold, args.naive_limit, args.seed)
+
+
+if __name__ == "__main__":
+    main()
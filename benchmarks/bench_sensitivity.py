@@ -0,0 +1,54 @@
+"""
+Аналіз чутливості: один добуток ahp_sensitivity.sensitivity_sweep проти
+окремого .dot для кожного критерію і точки сітки.
+Збіг результатів перевіряється тестами (tests/test_sensitivity.py).
+
+Запуск з кореня репозиторію:
+    python -m benchmarks.bench_sensitivity
+"""
+import argparse
+
+import numpy as np
+
+import ahp_sensitivity
+from benchmarks._common import best_time
+
+
+def loop_sweep(local_weights, criteria_weights, grid):
+    # Еталон: окремий добуток для кожної пари (критерій, вага)
+    weights = ahp_sensitivity.sweep_weights(criteria_weights, grid)
+    return np.array([[local_weights.dot(w) for w in row] for row in weights])
+
+
+def run(criteria, alternatives, points, seed):
+    rng = np.random.default_rng(seed)
+    grid = np.linspace(0, 1, points)
+    print(f"{'крит.':>6} {'альт.':>6} {'точок':>6} {'цикл .dot, с':>13} {'sweep + break-even, с':>22} {'точок зміни':>12}")
+    for m in alternatives:
+        local = rng.random((m, criteria))
+        local /= local.sum(axis=0)
+        criteria_weights = rng.random(criteria)
+        criteria_weights /= criteria_weights.sum()
+
+        def vectorized():
+            sweep = ahp_sensitivity.sensitivity_sweep(local, criteria_weights, grid)
+            return ahp_sensitivity.break_even_points(local, criteria_weights, grid, sweep)
+
+        t_loop = best_time(lambda: loop_sweep(local, criteria_weights, grid), repeat=1)
+        t_vec = best_time(vectorized, repeat=3)
+        found = len(vectorized()["weight"])
+        print(f"{criteria:>6} {m:>6} {points:>6} {t_loop:>13.3f} {t_vec:>22.4f} {found:>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--criteria", type=int, default=40)
+    parser.add_argument("--alternatives", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--points", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.criteria, args.alternatives, args.points, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Оновлення глобальних пріоритетів після зміни однієї матриці альтернатив:
+повна перебудова pandas-таблиці з .dot проти IncrementalSynthesis.update_column.
+Коректність оновлень перевіряється тестами (tests/test_incremental_synthesis.py).
+
+Запуск з кореня репозиторію:
+    python -m benchmarks.bench_synthesis
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from ahp_synthesis import IncrementalSynthesis
+from benchmarks._common import best_time
+
+
+def run(shapes, edits, seed):
+    rng = np.random.default_rng(seed)
+    print(f"{'альт.':>6} {'крит.':>6} {'pandas, мс':>11} {'інкрем., мкс':>13} {'прискорення':>12}")
+    for m, k in shapes:
+        alternatives = [f"A{i}" for i in range(m)]
+        criteria = [f"C{j}" for j in range(k)]
+        local = rng.random((m, k))
+        local /= local.sum(axis=0)
+        criteria_weights = rng.random(k)
+        criteria_weights /= criteria_weights.sum()
+        columns = {c: pd.Series(local[:, j], index=alternatives) for j, c in enumerate(criteria)}
+        weights_series = pd.Series(criteria_weights, index=criteria)
+
+        def full():
+            alt_weights_df = pd.DataFrame(columns).reindex(index=alternatives, columns=criteria)
+            return alt_weights_df.dot(weights_series.reindex(index=criteria)).sort_values(ascending=False)
+
+        synthesis = IncrementalSynthesis(local, criteria_weights)
+        new_columns = rng.random((edits, m))
+        new_columns /= new_columns.sum(axis=1, keepdims=True)
+        targets = rng.integers(0, k, edits)
+
+        def incremental():
+            for j, column in zip(targets, new_columns):
+                synthesis.update_column(j, column)
+
+        t_full = best_time(full, repeat=3)
+        t_incremental = best_time(incremental, repeat=3) / edits
+        print(f"{m:>6} {k:>6} {t_full * 1e3:>11.2f} {t_incremental * 1e6:>13.1f} {t_full / t_incremental:>11.0f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--edits", type=int, default=2000, help="кількість інкрементних оновлень")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run([(10, 5), (100, 20), (500, 50), (2000, 100)], args.edits, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Навантажувальний тест HTTP-сервісу ahp_service: затримки p50 / p99 і запитів за секунду.
+
+Коректність відповідей перевіряється тестами (tests/test_service.py).
+
+Запуск з кореня репозиторію (сервіс запускається окремим процесом на вільному порту):
+    python -m benchmarks.load_service
+    python -m benchmarks.load_service --url http://127.0.0.1:8000 --clients 64
+"""
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+import numpy as np
+
+import ahp_core
+import ahp_io
+
+
+def make_bodies(count, criteria, alternatives, rng):
+    # Різні моделі у форматі експорту, серіалізовані як у кнопці «Зберегти як JSON»
+    names = [f"Критерій {j + 1}" for j in range(criteria)]
+    alts = [f"Альтернатива {i + 1}" for i in range(alternatives)]
+    models = [
+        ahp_io.model_from_arrays(
+            f"Мета {n}", names, alts,
+            ahp_core.random_reciprocal_matrices(1, criteria, rng)[0],
+            ahp_core.random_reciprocal_matrices(criteria, alternatives, rng),
+        )
+        for n in range(count)
+    ]
+    return [json.dumps(model, ensure_ascii=False).encode("utf-8") for model in models]
+
+
+async def request(reader, writer, host, path, body):
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+async def client(host, port, path, bodies, picks, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for pick in picks:
+            start = time.perf_counter()
+            status, data = await request(reader, writer, host, path, bodies[pick])
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                raise RuntimeError(f"статус {status}: {data[:200]!r}")
+    finally:
+        writer.close()
+
+
+async def load(host, port, path, bodies, requests, clients, seed):
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, len(bodies), requests)
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        client(host, port, path, bodies, picks[c::clients], latencies) for c in range(clients)
+    ])
+    return time.perf_counter() - start, np.array(latencies)
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for(host, port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((host, port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("сервіс не запустився")
+
+
+def run(url, requests, clients, models, criteria, alternatives, method, seed):
+    rng = np.random.default_rng(seed)
+    bodies = make_bodies(models, criteria, alternatives, rng)
+    process = None
+    if url is None:
+        port = free_port()
+        process = subprocess.Popen([sys.executable, "ahp_service.py", "--port", str(port)], stdout=subprocess.DEVNULL)
+        url = f"http://127.0.0.1:{port}"
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+    path = f"/score?method={method}"
+
+    try:
+        wait_for(host, port)
+        print(f"Запитів: {requests}, одночасних клієнтів: {clients}, різних моделей: {models} "
+              f"({criteria} критеріїв, {alternatives} альтернатив)")
+        elapsed, latencies = asyncio.run(load(host, port, path, bodies, requests, clients, seed))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1e3
+    print(f"p50: {p50:.2f} мс, p99: {p99:.2f} мс, {requests / elapsed:.0f} запитів/с")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", help="адреса запущеного сервісу (типово — запустити власний)")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--models", type=int, default=2000, help="різних моделей; решта запитів — повтори з кешу")
+    parser.add_argument("--criteria", type=int, default=5)
+    parser.add_argument("--alternatives", type=int, default=6)
+    parser.add_argument("--method", choices=ahp_core.METHODS, default=ahp_core.MEAN)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.url, args.requests, args.clients, args.models, args.criteria, args.alternatives, args.method, args.seed)
+
+
+if __name__ == "__main__":
+    main()
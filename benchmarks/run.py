@@ -0,0 +1,298 @@
+"""
+Набір бенчмарків усіх гарячих шляхів застосунку з базовими результатами та профілюванням.
+
+Сценарії (моделі генеруються із заданим зерном, n від 3 до 100):
+  weights/n, consistency/n — ваги та ВУ однієї матриці;
+  reciprocal/n — збереження правок матриці з оберненими значеннями;
+  synthesis/k×m — глобальні пріоритети (добуток локальних ваг на ваги критеріїв);
+  graph/k×m — побудова повного графа ієрархії graphviz (як до ahp_graph);
+  graph_collapsed/k×m — схема ahp_graph зі згорнутими альтернативами, без кешу;
+  json_export/k×m, json_import/k×m — експорт та імпорт JSON, як у застосунку;
+  binary_export/k×m, binary_import/k×m — бінарний формат .ahpm.
+
+Запуск з кореня репозиторію:
+    python -m benchmarks.run --save-baseline      # зберегти базові результати
+    python -m benchmarks.run                      # порівняти з базовими
+    python -m benchmarks.run --filter "weights/*"
+    python -m benchmarks.run --profile synthesis/100x20
+"""
+import argparse
+import cProfile
+import fnmatch
+import json
+import os
+import platform
+import pstats
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+
+import graphviz
+import numpy as np
+import pandas as pd
+
+import ahp_core
+import ahp_graph
+import ahp_io
+from benchmarks._common import autorange, best_time
+
+# Розміри окремих матриць і моделей (критерії, альтернативи)
+MATRIX_SIZES = (3, 5, 10, 20, 50, 100)
+MODEL_SHAPES = ((3, 3), (10, 10), (50, 50), (100, 20))
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def _model(k, m, rng):
+    criteria = [f"Критерій {j + 1}" for j in range(k)]
+    alternatives = [f"Альтернатива {i + 1}" for i in range(m)]
+    criteria_matrix = ahp_core.random_reciprocal_matrices(1, k, rng)[0]
+    alt_matrices = ahp_core.random_reciprocal_matrices(k, m, rng)
+    return criteria, alternatives, criteria_matrix, alt_matrices
+
+
+def _weights(n, rng):
+    matrix = ahp_core.random_reciprocal_matrices(1, n, rng)[0]
+    return lambda: ahp_core.calc_weights(matrix)
+
+
+def _consistency(n, rng):
+    matrix = ahp_core.random_reciprocal_matrices(1, n, rng)[0]
+    weights = ahp_core.calc_weights(matrix)
+    return lambda: ahp_core.calculate_consistency(matrix, weights)
+
+
+def _reciprocal(n, rng):
+    # Правка половини суджень над діагоналлю, як після редагування таблиці
+    prev = ahp_core.random_reciprocal_matrices(1, n, rng)[0]
+    edited = prev.copy()
+    i, j = np.triu_indices(n, 1)
+    changed = rng.random(len(i)) < 0.5
+    edited[i[changed], j[changed]] = rng.choice(ahp_core.SAATY_SCALE, changed.sum())
+    return lambda: ahp_core.fill_reciprocal(edited, prev)
+
+
+def _synthesis(k, m, rng):
+    _, _, criteria_matrix, alt_matrices = _model(k, m, rng)
+    criteria_weights = ahp_core.calc_weights(criteria_matrix)
+    local = np.column_stack(ahp_core.calc_weights_batch(alt_matrices))
+    return lambda: ahp_core.global_priorities(criteria_weights, local)
+
+
+def _graph(k, m, rng):
+    criteria, alternatives, _, _ = _model(k, m, rng)
+
+    def build():
+        # Як у saaty_app.py: мета, критерії, альтернативи і всі ребра між рівнями
+        dot = graphviz.Digraph()
+        dot.attr(rankdir="BT", size="8,6")
+        dot.node("goal", "ГОЛОВНА МЕТА", shape="box", style="filled", color="#a1c9f1")
+        for alt in alternatives:
+            dot.node(alt, alt, shape="ellipse", style="filled", color="#fce8a6")
+        for crit in criteria:
+            dot.node(crit, crit, shape="box", style="filled", color="#b6fcb6")
+        for crit in criteria:
+            for alt in alternatives:
+                dot.edge(alt, crit)
+            dot.edge(crit, "goal")
+        return dot.source
+
+    return build
+
+
+def _graph_collapsed(k, m, rng):
+    criteria, alternatives, _, _ = _model(k, m, rng)
+    build = ahp_graph._hierarchy_dot.__wrapped__
+    return lambda: build("ГОЛОВНА МЕТА", tuple(criteria), tuple(alternatives), criteria[0])
+
+
+def _json_export(k, m, rng):
+    model = _model(k, m, rng)
+    return lambda: ahp_io.model_to_json("ГОЛОВНА МЕТА", *model).encode("utf-8")
+
+
+def _json_import(k, m, rng):
+    data = _json_export(k, m, rng)()
+
+    def load():
+        imported = ahp_io.read_model(data)
+        criteria_df = pd.DataFrame(imported["criteria_matrix"])
+        return criteria_df, {c: pd.DataFrame(v) for c, v in imported["alt_matrices"].items()}
+
+    return load
+
+
+def _binary_export(k, m, rng):
+    model = _model(k, m, rng)
+    return lambda: ahp_io.model_to_bytes("ГОЛОВНА МЕТА", *model)
+
+
+def _binary_import(k, m, rng):
+    # Тимчасовий каталог живе, доки існує функція, що вимірюється
+    directory = tempfile.TemporaryDirectory()
+    path = os.path.join(directory.name, "model.ahpm")
+    ahp_io.save_binary(path, "ГОЛОВНА МЕТА", *_model(k, m, rng))
+    return lambda: (directory, np.nansum(ahp_io.load_binary(path)[4]))
+
+
+def scenarios():
+    """Словник {назва: функція підготовки(rng) -> функція, що вимірюється}."""
+    result = {}
+    for n in MATRIX_SIZES:
+        result[f"weights/{n}"] = lambda rng, n=n: _weights(n, rng)
+        result[f"consistency/{n}"] = lambda rng, n=n: _consistency(n, rng)
+        result[f"reciprocal/{n}"] = lambda rng, n=n: _reciprocal(n, rng)
+    for k, m in MODEL_SHAPES:
+        for name, setup in (
+            ("synthesis", _synthesis), ("graph", _graph), ("graph_collapsed", _graph_collapsed),
+            ("json_export", _json_export),
+            ("json_import", _json_import), ("binary_export", _binary_export), ("binary_import", _binary_import),
+        ):
+            result[f"{name}/{k}x{m}"] = lambda rng, setup=setup, k=k, m=m: setup(k, m, rng)
+    return result
+
+
+def measure(names, seed, repeat):
+    """Найкращий час одного виклику кожного сценарію, секунди."""
+    available = scenarios()
+    results = {}
+    for name in names:
+        func = available[name](np.random.default_rng(seed))
+        results[name] = best_time(func, repeat=repeat, number=autorange(func, min_time=0.05))
+        print(f"{name:<24} {_format(results[name]):>12}", file=sys.stderr)
+    return results
+
+
+def _format(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} мкс"
+    return f"{seconds * 1e3:.2f} мс" if seconds < 1 else f"{seconds:.2f} с"
+
+
+def compare(results, baseline, tolerance):
+    """Друкує порівняння з базовими результатами; повертає назви сценаріїв, що сповільнилися."""
+    regressions = []
+    print(f"{'сценарій':<24} {'базовий':>12} {'зараз':>12} {'зміна':>8}")
+    for name, seconds in results.items():
+        if name not in baseline:
+            print(f"{name:<24} {'—':>12} {_format(seconds):>12} {'нове':>8}")
+            continue
+        ratio = seconds / baseline[name]
+        mark = ""
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+            mark = "  ← повільніше"
+        print(f"{name:<24} {_format(baseline[name]):>12} {_format(seconds):>12} {ratio - 1:>+8.0%}{mark}")
+    return regressions
+
+
+def sample_stacks(func, seconds, interval=0.001):
+    """
+    Вибіркове профілювання: стеки виклику func() з потоку-спостерігача у
+    згорнутому форматі flame graph ({"a;b;c": кількість вибірок}).
+    """
+    target = threading.get_ident()
+    counts = Counter()
+    done = threading.Event()
+
+    def sampler():
+        while not done.is_set():
+            frame = sys._current_frames().get(target)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)})")
+                frame = frame.f_back
+            counts[";".join(reversed(stack))] += 1
+            time.sleep(interval)
+
+    thread = threading.Thread(target=sampler, daemon=True)
+    thread.start()
+    deadline = time.perf_counter() + seconds
+    try:
+        while time.perf_counter() < deadline:
+            func()
+    finally:
+        done.set()
+        thread.join()
+    return counts
+
+
+def profile(name, seed, seconds, output):
+    """cProfile (output.prof) і згорнуті стеки для flame graph (output.folded) для одного сценарію."""
+    func = scenarios()[name](np.random.default_rng(seed))
+    number = autorange(func, min_time=seconds)
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for _ in range(number):
+        func()
+    profiler.disable()
+    profiler.dump_stats(f"{output}.prof")
+    pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+
+    with open(f"{output}.folded", "w", encoding="utf-8") as f:
+        for stack, count in sample_stacks(func, seconds).items():
+            f.write(f"{stack} {count}\n")
+    print(f"Профіль: {output}.prof (pstats, snakeviz); стеки: {output}.folded (flamegraph.pl, speedscope)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--filter", default="*", help="шаблон назв сценаріїв (fnmatch), напр. 'json_*'")
+    parser.add_argument("--list", action="store_true", help="лише показати назви сценаріїв")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="файл базових результатів")
+    parser.add_argument("--save-baseline", action="store_true", help="записати результати як базові")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="допустиме сповільнення відносно базового (0.25 — на 25%%)")
+    parser.add_argument("--profile", metavar="SCENARIO", help="профілювати один сценарій замість вимірювань")
+    parser.add_argument("--profile-seconds", type=float, default=2.0)
+    parser.add_argument("--profile-output", default="profile", help="префікс файлів профілю")
+    args = parser.parse_args()
+
+    available = scenarios()
+    if args.profile:
+        if args.profile not in available:
+            parser.error(f"невідомий сценарій: {args.profile}")
+        profile(args.profile, args.seed, args.profile_seconds, args.profile_output)
+        return 0
+
+    names = [name for name in available if fnmatch.fnmatch(name, args.filter)]
+    if args.list:
+        print("\n".join(names))
+        return 0
+    results = measure(names, args.seed, args.repeat)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)["results"]
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": platform.python_version(), "numpy": np.__version__, "machine": platform.platform(),
+                "seed": args.seed, "results": baseline,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"Базові результати записано у {args.baseline} ({len(results)} сценаріїв).")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("Базових результатів ще немає; запустіть з --save-baseline.")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"Сповільнення понад {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    print("Сповільнень не виявлено.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+# Корінь репозиторію в sys.path, щоб тести імпортували модулі ahp_* та benchmarks
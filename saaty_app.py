@@ -1,64 +1,131 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import graphviz
-import json
 from io import BytesIO
 
+import ahp_cache
+import ahp_core
+import ahp_graph
+import ahp_group
+import ahp_io
+import ahp_montecarlo
+import ahp_repair
+import ahp_sensitivity
+import ahp_synthesis
+
 
 # Налаштування сторінки
 st.set_page_config(page_title="Метод Сааті", layout="wide")
 st.title("Метод Сааті — Ієрархия задачі")
 
 
-# Таблиця випадкової узгодженості 
+# Максимальна кількість критеріїв та альтернатив
+MAX_CRITERIA = 50
+MAX_ALTERNATIVES = 50
+
+# Способи об'єднання оцінок експертів у груповому рішенні
+GROUP_AGGREGATIONS = {
+    "Агрегування суджень (AIJ)": ahp_group.AIJ,
+    "Агрегування пріоритетів (AIP)": ahp_group.AIP,
+}
+
+# Поріг ВУ, вище якого застосунок пропонує виправлення суджень, і найбільша кількість замін
+CR_LIMIT = ahp_core.CR_LIMIT
+REPAIR_MAX_EDITS = 25
+
+# Кількість точок сітки ваг в аналізі чутливості
+SENSITIVITY_POINTS = 1001
 
-# (n: ВВУ) для n = 1...10
-RI_TABLE = {
-    1: 0, 2: 0, 3: 0.58, 4: 0.9, 5: 1.12, 6: 1.24, 7: 1.32, 8: 1.41, 9: 1.45, 10: 1.49
+# Методи розрахунку вектора пріоритетів
+PRIORITY_METHODS = {
+    "Нормалізація стовпців (наближений)": ahp_core.MEAN,
+    "Власний вектор (Сааті)": ahp_core.EIGEN,
+    "Середнє геометричне": ahp_core.GEOMETRIC,
 }
 
-# Функції розрахунку
+# Функції розрахунку (обгортки над ahp_core для DataFrame)
 
 def calc_weights(matrix):
-    col_sum = matrix.sum(axis=0)
-    if (col_sum == 0).any():
-        st.warning("Помилка: сума стовпця нульова. Неможливо нормалізувати.")
-        return pd.Series(np.nan, index=matrix.index)
-    if not np.all(np.isfinite(col_sum)) or (col_sum == 0).all():
-        st.error("Помилка в даних матриці (NaN/Inf або нульові стовпці). Розрахунок неможливий.")
-        return pd.Series(np.nan, index=matrix.index)
-
-    norm = matrix / col_sum
-    weights = norm.mean(axis=1)
-    return weights
+    values = matrix.to_numpy(dtype=float)
+    method = st.session_state.get("priority_method", ahp_core.MEAN)
+    weights = ahp_cache.default_cache.weights(values, method)
+    if np.isnan(weights).any():
+        problem = ahp_core.check_matrix(values)
+        if problem == ahp_core.ZERO_COLUMN:
+            st.warning("Помилка: сума стовпця нульова. Неможливо нормалізувати.")
+        elif problem == ahp_core.NOT_FINITE:
+            st.error("Помилка в даних матриці (NaN/Inf або нульові стовпці). Розрахунок неможливий.")
+        elif problem == ahp_core.DISCONNECTED:
+            st.warning("Недостатньо порівнянь: заповнені судження мають пов'язувати всі елементи матриці.")
+    return pd.Series(weights, index=matrix.index)
 
 def calculate_consistency(matrix):
+    method = st.session_state.get("priority_method", ahp_core.MEAN)
+    return ahp_cache.default_cache.consistency(matrix.to_numpy(dtype=float), method)
+
+def empty_matrix(names):
+    # Нова матриця: одиниці на діагоналі, решта суджень ще не задана (NaN)
+    values = np.full((len(names), len(names)), np.nan)
+    np.fill_diagonal(values, 1.0)
+    return pd.DataFrame(values, columns=names, index=names)
+
+def matrix_values(df, names):
+    # Значення збереженої матриці; ще не створена матриця — порожня (лише діагональ)
+    if df is None or len(df) != len(names):
+        df = empty_matrix(names)
+    return df.to_numpy(dtype=float)
+
+def is_filled(df):
+    # Матриця готова до розрахунку, якщо судження пов'язують усі елементи (порожня — ні)
+    return df is not None and ahp_core.check_matrix(df.to_numpy(dtype=float)) != ahp_core.DISCONNECTED
+
+def fill_reciprocal(edited_df, prev_df):
+    values = ahp_core.fill_reciprocal(edited_df.to_numpy(dtype=float), prev_df.to_numpy(dtype=float))
+    return pd.DataFrame(values, index=edited_df.index, columns=edited_df.columns)
+
+def repair_panel(df, key):
     """
-    Розраховує Lambda Max, Індекс Узгодженості (ІУ/CI) та Відношення Узгодженості (ВУ/CR).
+    Пропозиції замін суджень, що знижують ВУ матриці до CR_LIMIT.
+    Повертає виправлену матрицю, якщо користувач натиснув «Застосувати».
     """
-    n = len(matrix)
-    if n < 3:
-        return n, 0, 0 
-
-    weights = calc_weights(matrix)
-    if weights.isnull().any():
-        return np.nan, np.nan, np.nan # Помилка при розрахунку ваг
-
-    aw_vector = matrix.dot(weights)
-    consist_vector = aw_vector / weights
-    
-    lambda_max = consist_vector.mean()
-    
-    ci = (lambda_max - n) / (n - 1)
-    
-    ri = RI_TABLE.get(n)
-    if ri == 0:
-        cr = 0 # Уникнення ділення на нуль (хоча n < 3 вже оброблено)
+    method = st.session_state.get("priority_method", ahp_core.MEAN)
+    values = df.to_numpy(dtype=float)
+    # Пошук замін дорогий, тому результат зберігається, доки матриця й метод не зміняться
+    repair_key = ahp_cache.WeightsCache.key(values, method)
+    cached = st.session_state.get(f"repair_result_{key}")
+    if cached is not None and cached[0] == repair_key:
+        result = cached[1]
     else:
-        cr = ci / ri
-        
-    return lambda_max, ci, cr
+        result = ahp_repair.propose_repairs(values, CR_LIMIT, method, REPAIR_MAX_EDITS)
+        st.session_state[f"repair_result_{key}"] = (repair_key, result)
+    edits = result["edits"]
+    if not edits:
+        return None
+
+    names = list(df.index)
+    with st.expander("🛠️ Запропоновані виправлення суджень", expanded=True):
+        st.dataframe(pd.DataFrame({
+            "Рядок": [names[e["row"]] for e in edits],
+            "Стовпець": [names[e["col"]] for e in edits],
+            "Було": [e["old"] for e in edits],
+            "Стане": [e["new"] for e in edits],
+            "ВУ після заміни": [e["cr"] for e in edits],
+        }).style.format({"Було": "{:.3f}", "Стане": "{:.3f}", "ВУ після заміни": "{:.1%}"}),
+            hide_index=True, use_container_width=True)
+        if not result["reached"]:
+            st.caption(f"Після {len(edits)} замін ВУ становить {result['cr_after']:.1%}; решту суджень варто переглянути вручну.")
+        if not st.button("✅ Застосувати виправлення", key=f"repair_{key}"):
+            return None
+
+    # Заміни зберігаються так само, як ручне введення цілого значення шкали:
+    # змінюється клітинка зі значенням >= 1, а fill_reciprocal дзеркалить і округлює
+    edited = df.to_numpy(dtype=float, copy=True)
+    for e in edits:
+        if e["new"] >= 1:
+            edited[e["row"], e["col"]] = e["new"]
+        if e["new"] <= 1:
+            edited[e["col"], e["row"]] = 1 / e["new"]
+    return fill_reciprocal(pd.DataFrame(edited, index=df.index, columns=df.columns), df)
 
 # Ініціалізація session_state
 
@@ -68,14 +135,24 @@ if "num_alternatives" not in st.session_state:
     st.session_state.num_alternatives = 3
 if "alt_consistency" not in st.session_state:
     st.session_state.alt_consistency = {}
+if "alt_drafts" not in st.session_state:
+    st.session_state.alt_drafts = {}  # незбережені правки матриць альтернатив
+if "alt_editor_version" not in st.session_state:
+    st.session_state.alt_editor_version = 0
 
 num_criteria = st.number_input(
-    "Кількість критеріїв:", 1, 10, value=st.session_state.num_criteria
+    "Кількість критеріїв:", 1, MAX_CRITERIA, value=st.session_state.num_criteria
 )
 num_alternatives = st.number_input(
-    "Кількість альтернатив:", 1, 9, value=st.session_state.num_alternatives
+    "Кількість альтернатив:", 1, MAX_ALTERNATIVES, value=st.session_state.num_alternatives
 )
 
+# ВВУ для n > 10 моделюється один раз і далі береться з кешу
+for n in {int(num_criteria), int(num_alternatives)}:
+    if n not in ahp_core.RI_TABLE:
+        with st.spinner(f"Розрахунок випадкового індексу узгодженості для n = {n}..."):
+            ahp_core.random_index(n)
+
 #  Підтримка оновлення при зміні кількості
 if num_criteria != st.session_state.num_criteria:
     st.session_state.num_criteria = int(num_criteria)
@@ -111,90 +188,165 @@ if len(alternative_names) != num_alternatives:
 
 # Вкладка збереження / імпорту
 
+def apply_model(model):
+    """
+    Завантажує модель у форматі експорту в стан застосунку та скидає розрахунки.
+    Повертає False, якщо модель не можна показати в застосунку.
+    """
+    if model.get("sub_criteria"):
+        # Редактор працює лише з одним рівнем критеріїв; підкритерії загубилися б без попередження
+        st.sidebar.error(
+            "❌ Моделі з підкритеріями (sub_criteria) поки не підтримуються в застосунку. "
+            "Розрахуйте таку модель через CLI або ahp_hierarchy."
+        )
+        return False
+    st.session_state.goal_name = model.get("goal_name", "ГОЛОВНА МЕТА")
+    st.session_state.criteria_names = model.get("criteria_names", [])
+    st.session_state.alternative_names = model.get("alternative_names", [])
+    st.session_state.num_criteria = model["num_criteria"]
+    st.session_state.num_alternatives = model["num_alternatives"]
+    st.session_state.criteria_matrix = pd.DataFrame(model["criteria_matrix"])
+    st.session_state.alt_matrices = {
+        k: pd.DataFrame(v) for k, v in model.get("alt_matrices", {}).items()
+    }
+    # Скидаємо всі розрахунки
+    if "criteria_weights_display" in st.session_state:
+        del st.session_state.criteria_weights_display
+    if "criteria_consistency" in st.session_state:
+        del st.session_state.criteria_consistency
+    st.session_state.alt_consistency = {}
+    st.session_state.alt_drafts = {}
+    st.session_state.pop("alt_editor_crit", None)
+    return True
+
+
+# Вибір методу розрахунку пріоритетів
+
+st.sidebar.header("⚙️ Метод розрахунку")
+method_label = st.sidebar.selectbox("Вектор пріоритетів:", list(PRIORITY_METHODS))
+if PRIORITY_METHODS[method_label] != st.session_state.get("priority_method", ahp_core.MEAN):
+    st.session_state.priority_method = PRIORITY_METHODS[method_label]
+    # Перераховуємо вже збережені результати новим методом
+    if "criteria_weights_display" in st.session_state:
+        st.session_state.criteria_weights_display = calc_weights(st.session_state.criteria_matrix).round(3)
+    if "criteria_consistency" in st.session_state:
+        lambda_max, ci, cr = calculate_consistency(st.session_state.criteria_matrix)
+        st.session_state.criteria_consistency = {"lambda": lambda_max, "ci": ci, "cr": cr}
+    for crit in st.session_state.alt_consistency:
+        lambda_max, ci, cr = calculate_consistency(st.session_state.alt_matrices[crit])
+        st.session_state.alt_consistency[crit] = {"lambda": lambda_max, "ci": ci, "cr": cr}
+
 st.sidebar.header("💾 Збереження / Імпорт")
-mode = st.sidebar.radio("Оберіть режим:", ["Зберегти матриці", "Імпортувати матриці"])
+mode = st.sidebar.radio("Оберіть режим:", ["Зберегти матриці", "Імпортувати матриці", "Групове рішення"])
 
 if mode == "Зберегти матриці":
     st.sidebar.markdown("#### 📤 Експортувати поточні матриці")
-    filename = st.sidebar.text_input("Ім'я файлу (без .json):", "ahp_matrices")
-
-    if st.sidebar.button("💾 Зберегти як JSON"):
-        export_data = {
-            "goal_name": goal_name,
-            "criteria_names": criteria_names,
-            "alternative_names": alternative_names,
-            "num_criteria": st.session_state.num_criteria,
-            "num_alternatives": st.session_state.num_alternatives,
-            "criteria_matrix": st.session_state.get("criteria_matrix", pd.DataFrame()).to_dict(),
-            "alt_matrices": {k: v.to_dict() for k, v in st.session_state.get("alt_matrices", {}).items()},
-        }
-        json_str = json.dumps(export_data, ensure_ascii=False, indent=2)
+    filename = st.sidebar.text_input("Ім'я файлу (без розширення):", "ahp_matrices")
+    export_format = st.sidebar.radio("Формат:", ["JSON", "Бінарний (.ahpm)"])
+
+    if export_format == "JSON" and st.sidebar.button("💾 Зберегти як JSON"):
+        saved_alts = st.session_state.get("alt_matrices", {})
+        json_str = ahp_io.model_to_json(
+            goal_name, criteria_names, alternative_names,
+            matrix_values(st.session_state.get("criteria_matrix"), criteria_names),
+            [matrix_values(saved_alts.get(crit), alternative_names) for crit in criteria_names],
+        )
         b = BytesIO(json_str.encode("utf-8"))
         st.sidebar.download_button(
             label="⬇️ Завантажити JSON-файл", data=b, file_name=f"{filename}.json", mime="application/json"
         )
         st.sidebar.success(f"✅ Файл {filename}.json готовий до завантаження.")
 
+    elif export_format != "JSON" and st.sidebar.button("💾 Зберегти у бінарному форматі"):
+        # Компактний формат: усі матриці одним блоком float64 (ahp_io.model_to_bytes)
+        saved_alts = st.session_state.get("alt_matrices", {})
+        data = ahp_io.model_to_bytes(
+            goal_name, criteria_names, alternative_names,
+            matrix_values(st.session_state.get("criteria_matrix"), criteria_names),
+            [matrix_values(saved_alts.get(crit), alternative_names) for crit in criteria_names],
+        )
+        st.sidebar.download_button(
+            label="⬇️ Завантажити файл .ahpm", data=data, file_name=f"{filename}.ahpm",
+            mime="application/octet-stream",
+        )
+        st.sidebar.success(f"✅ Файл {filename}.ahpm готовий до завантаження.")
+
 elif mode == "Імпортувати матриці":
     st.sidebar.markdown("#### 📥 Завантажити готові матриці")
-    uploaded_file = st.sidebar.file_uploader("Оберіть JSON-файл", type=["json"])
+    uploaded_file = st.sidebar.file_uploader("Оберіть файл моделі (JSON або .ahpm)", type=["json", "ahpm"])
 
     if uploaded_file:
         try:
-            imported = json.load(uploaded_file)
+            imported = ahp_io.read_model(uploaded_file.getvalue())
             st.sidebar.success("✅ Файл успішно прочитано!")
 
             if st.sidebar.button("📂 Імпортувати в застосунок"):
-                st.session_state.goal_name = imported.get("goal_name", "ГОЛОВНА МЕТА")
-                st.session_state.criteria_names = imported.get("criteria_names", [])
-                st.session_state.alternative_names = imported.get("alternative_names", [])
-                st.session_state.num_criteria = imported["num_criteria"]
-                st.session_state.num_alternatives = imported["num_alternatives"]
-                st.session_state.criteria_matrix = pd.DataFrame(imported["criteria_matrix"])
-                st.session_state.alt_matrices = {
-                    k: pd.DataFrame(v) for k, v in imported.get("alt_matrices", {}).items()
-                }
-                # Скидаємо всі розрахунки
-                if "criteria_weights_display" in st.session_state:
-                    del st.session_state.criteria_weights_display
-                if "criteria_consistency" in st.session_state:
-                    del st.session_state.criteria_consistency
-                st.session_state.alt_consistency = {}
-                st.sidebar.success("✅ Матриці імпортовано! Оновлення застосунку...")
-                st.rerun()
+                if apply_model(imported):
+                    st.sidebar.success("✅ Матриці імпортовано! Оновлення застосунку...")
+                    st.rerun()
 
         except Exception as e:
             st.sidebar.error(f"❌ Помилка при імпорті: {e}")
 
+elif mode == "Групове рішення":
+    st.sidebar.markdown("#### 👥 Об'єднати оцінки експертів")
+    expert_files = st.sidebar.file_uploader(
+        "Файли експертів (однакові критерії та альтернативи)", type=["json", "ahpm"], accept_multiple_files=True
+    )
+    aggregation_label = st.sidebar.radio("Спосіб агрегування:", list(GROUP_AGGREGATIONS))
+
+    if expert_files and st.sidebar.button("🤝 Об'єднати"):
+        try:
+            models = [ahp_io.read_model(f.getvalue()) for f in expert_files]
+            aggregation = GROUP_AGGREGATIONS[aggregation_label]
+            group = ahp_group.group_decision(
+                models, method=st.session_state.get("priority_method", ahp_core.MEAN), aggregation=aggregation
+            )
+            group["experts"] = [f.name for f in expert_files]
+            st.session_state.group_result = group
+            if aggregation == ahp_group.AIJ:
+                # Групові матриці стають поточними матрицями застосунку
+                apply_model(ahp_io.model_from_arrays(
+                    models[0].get("goal_name", "ГОЛОВНА МЕТА"), group["criteria_names"], group["alternative_names"],
+                    group["group_criteria_matrix"].round(3), group["group_alt_matrices"].round(3),
+                ))
+            st.sidebar.success(f"✅ Об'єднано оцінки {len(models)} експертів.")
+            st.rerun()
+        except Exception as e:
+            st.sidebar.error(f"❌ Помилка при об'єднанні: {e}")
+
 st.markdown("## Ієрархія задачі (візуалізація)")
-dot = graphviz.Digraph()
-dot.attr(rankdir="BT", size="8,6")
-dot.node("goal", goal_name, shape="box", style="filled", color="#a1c9f1")
-for alt in alternative_names:
-    dot.node(alt, alt, shape="ellipse", style="filled", color="#fce8a6")
-for crit in criteria_names:
-    dot.node(crit, crit, shape="box", style="filled", color="#b6fcb6")
-for crit in criteria_names:
-    for alt in alternative_names:
-        dot.edge(alt, crit)
-    dot.edge(crit, "goal")
-st.graphviz_chart(dot, use_container_width=True)
+expanded_crit = None
+if ahp_graph.is_collapsed(criteria_names, alternative_names):
+    st.caption(
+        f"Модель велика ({len(criteria_names) * len(alternative_names)} зв'язків «альтернатива → критерій»), тому альтернативи "
+        "згорнуто в один вузол. Оберіть критерій, щоб показати зв'язки з його альтернативами."
+    )
+    expanded_label = st.selectbox("Розгорнути критерій:", ["—"] + criteria_names, key="graph_expanded")
+    expanded_crit = None if expanded_label == "—" else expanded_label
+# DOT і SVG кешуються в ahp_graph: розкладка повторюється лише після зміни ієрархії
+dot_source = ahp_graph.hierarchy_dot(goal_name, criteria_names, alternative_names, expanded_crit)
+svg = ahp_graph.render_svg(dot_source)
+if svg is not None:
+    st.image(svg, use_container_width=True)
+else:
+    st.graphviz_chart(dot_source, use_container_width=True)
 
 
 # Матриця попарних порівнянь критеріїв
 
 st.markdown("## 📊 Матриця попарних порівнянь критеріїв")
+st.caption(
+    "Порожні клітинки — пропущені судження. Достатньо заповнити порівняння, що пов'язують усі елементи; "
+    "пропущені значення доповнюються методом логарифмічних найменших квадратів."
+)
 
 # 1. Ініціалізуємо матрицю, ТІЛЬКИ ЯКЩО її немає або змінився РОЗМІР
 if (
     "criteria_matrix" not in st.session_state
     or len(st.session_state.criteria_matrix) != num_criteria
 ):
-    st.session_state.criteria_matrix = pd.DataFrame(
-        np.ones((num_criteria, num_criteria)),
-        columns=criteria_names,
-        index=criteria_names,
-    )
+    st.session_state.criteria_matrix = empty_matrix(criteria_names)
     if "criteria_weights_display" in st.session_state:
         del st.session_state.criteria_weights_display
     if "criteria_consistency" in st.session_state:
@@ -223,43 +375,7 @@ if save_clicked:
         st.error("🚨 **Помилка: Введено числа, більші за 9.**\n\nМетод Сааті використовує шкалу від 1 (однакова важливість) до 9 (абсолютна перевага). Будь ласка, виправте введені значення.")
     else:
         # ---  ЛОГІКА ЗБЕРЕЖЕННЯ (тепер всередині 'else') ---
-        prev = st.session_state.criteria_matrix.copy()
-        
-        for i in range(num_criteria):
-            for j in range(i, num_criteria): 
-                if i == j:
-                    edited_df.iloc[i, j] = 1.0
-                    continue
-                if edited_df.iloc[i, j] != prev.iloc[i, j]:
-                    val = edited_df.iloc[i, j]
-                    if val > 1: 
-                        if np.isclose(val, np.round(val)): val = float(np.round(val))
-                        edited_df.iloc[i, j] = val
-                        edited_df.iloc[j, i] = round(1 / val, 3)
-                    elif val < 1:
-                        val = round(val, 3) 
-                        edited_df.iloc[i, j] = val
-                        inv_val = 1 / val
-                        if np.isclose(inv_val, np.round(inv_val)):
-                            edited_df.iloc[j, i] = float(np.round(inv_val))
-                        else:
-                            edited_df.iloc[j, i] = round(inv_val, 3)
-                elif edited_df.iloc[j, i] != prev.iloc[j, i]:
-                    val = edited_df.iloc[j, i]
-                    if val > 1:
-                        if np.isclose(val, np.round(val)): val = float(np.round(val))
-                        edited_df.iloc[j, i] = val
-                        edited_df.iloc[i, j] = round(1 / val, 3)
-                    elif val < 1:
-                        val = round(val, 3)
-                        edited_df.iloc[j, i] = val
-                        inv_val = 1 / val
-                        if np.isclose(inv_val, np.round(inv_val)):
-                            edited_df.iloc[i, j] = float(np.round(inv_val))
-                        else:
-                            edited_df.iloc[i, j] = round(inv_val, 3)
-
-        np.fill_diagonal(edited_df.values, 1.000)
+        edited_df = fill_reciprocal(edited_df, st.session_state.criteria_matrix)
         st.session_state.criteria_matrix = edited_df
 
         # 1. Розраховуємо ваги
@@ -279,7 +395,7 @@ if "criteria_weights_display" in st.session_state:
         st.markdown("### Матриця критеріїв з вектором пріоритетів")
         display_df = st.session_state.criteria_matrix.copy()
         display_df["Вектор пріоритетів"] = st.session_state.criteria_weights_display
-        st.dataframe(display_df.style.format("{:.3f}"), use_container_width=True)
+        st.dataframe(display_df.style.format("{:.3f}", na_rep="—"), use_container_width=True)
     else:
         del st.session_state.criteria_weights_display
         if "criteria_consistency" in st.session_state:
@@ -295,12 +411,21 @@ if "criteria_consistency" in st.session_state:
     col2.metric("Індекс Узгодженості (ІУ)", f"{cons_data['ci']:.3f}")
     col3.metric("Відношення Узгодженості (ВУ)", f"{cons_data['cr']:.1%}")
     
-    if cons_data['cr'] > 0.20:
-        st.error("🚨 **Увага! ВУ > 20%**\n\nУзгодженість матриці низька. Це означає, що ваші судження суперечливі. Будь ласка, перегляньте та змініть значення в матриці.")
+    if cons_data['cr'] > CR_LIMIT:
+        st.error(f"🚨 **Увага! ВУ > {CR_LIMIT:.0%}**\n\nУзгодженість матриці низька. Це означає, що ваші судження суперечливі. Будь ласка, перегляньте та змініть значення в матриці.")
+        repaired = repair_panel(st.session_state.criteria_matrix, "criteria")
+        if repaired is not None:
+            st.session_state.criteria_matrix = repaired
+            st.session_state.criteria_weights_display = calc_weights(repaired).round(3)
+            lambda_max, ci, cr = calculate_consistency(repaired)
+            st.session_state.criteria_consistency = {"lambda": lambda_max, "ci": ci, "cr": cr}
+            # Редактор має показати виправлену матрицю, а не попередні правки
+            st.session_state.pop("criteria_editor", None)
+            st.rerun()
     elif np.isnan(cons_data['cr']):
-        st.warning("Не вдалося розрахувати узгодженість. Перевірте, чи немає нулів у стовпцях матриці.")
+        st.warning("Не вдалося розрахувати узгодженість. Перевірте, чи немає нулів у стовпцях матриці та чи пов'язують судження всі елементи.")
     else:
-        st.success("✅ **ВУ ≤ 20%**\n\nУзгодженість матриці в межах норми.")
+        st.success(f"✅ **ВУ ≤ {CR_LIMIT:.0%}**\n\nУзгодженість матриці в межах норми.")
 
 
 
@@ -312,106 +437,110 @@ if "alt_matrices" not in st.session_state:
 st.markdown("---")
 st.markdown("## Матриці альтернатив по кожному критерію")
 
-tabs = st.tabs(criteria_names)
-for tab, crit in zip(tabs, criteria_names):
-    with tab:
-        st.markdown(f"### Порівняння альтернатив за критерієм **{crit}**")
-
-        if (
-            crit not in st.session_state.alt_matrices
-            or len(st.session_state.alt_matrices[crit]) != num_alternatives
-        ):
-            st.session_state.alt_matrices[crit] = pd.DataFrame(
-                np.ones((num_alternatives, num_alternatives)),
-                columns=alternative_names,
-                index=alternative_names,
-            )
-            if crit in st.session_state.alt_consistency:
-                del st.session_state.alt_consistency[crit]
+# Матриці всіх критеріїв створюються одразу, а редактор будується лише для обраного:
+# на кожному перезапуску в браузер надсилається одна таблиця замість усіх
+for crit in criteria_names:
+    if (
+        crit not in st.session_state.alt_matrices
+        or len(st.session_state.alt_matrices[crit]) != num_alternatives
+    ):
+        st.session_state.alt_matrices[crit] = empty_matrix(alternative_names)
+        st.session_state.alt_drafts.pop(crit, None)
+        if crit in st.session_state.alt_consistency:
+            del st.session_state.alt_consistency[crit]
 
-        st.session_state.alt_matrices[crit].columns = alternative_names
-        st.session_state.alt_matrices[crit].index = alternative_names
+    st.session_state.alt_matrices[crit].columns = alternative_names
+    st.session_state.alt_matrices[crit].index = alternative_names
 
-        alt_df = st.data_editor(
-            st.session_state.alt_matrices[crit],
-            key=f"matrix_{crit}",
-            use_container_width=True,
-        )
+if len(criteria_names) <= 8:
+    crit = st.radio("Критерій:", criteria_names, horizontal=True, key="active_criterion")
+else:
+    crit = st.selectbox("Критерій:", criteria_names, key="active_criterion")
+drafts = st.session_state.alt_drafts
 
-        save_alt = st.button(f"💾 Зберегти зміни ({crit})")
-
-        if save_alt:
-            edited_alt_df = pd.DataFrame(alt_df, columns=alternative_names, index=alternative_names).astype(float)
-            
-            # ---  ПЕРЕВІРКА НА > 9 ---
-            if (edited_alt_df > 9).any().any():
-                st.error(f"🚨 **Помилка: Введено числа, більші за 9, у матриці для '{crit}'.**\n\nБудь ласка, використовуйте лише значення від 1 до 9.")
-            else:
-                # ---  ЛОГІКА ЗБЕРЕЖЕННЯ 
-                prev_alt = st.session_state.alt_matrices[crit].copy()
-
-                for i in range(num_alternatives):
-                    for j in range(i, num_alternatives):
-                        if i == j:
-                            edited_alt_df.iloc[i, j] = 1.0
-                            continue
-                        if edited_alt_df.iloc[i, j] != prev_alt.iloc[i, j]:
-                            val = edited_alt_df.iloc[i, j]
-                            if val > 1: 
-                                if np.isclose(val, np.round(val)): val = float(np.round(val))
-                                edited_alt_df.iloc[i, j] = val
-                                edited_alt_df.iloc[j, i] = round(1 / val, 3)
-                            elif val < 1:
-                                val = round(val, 3) 
-                                edited_alt_df.iloc[i, j] = val
-                                inv_val = 1 / val
-                                if np.isclose(inv_val, np.round(inv_val)):
-                                    edited_alt_df.iloc[j, i] = float(np.round(inv_val))
-                                else:
-                                    edited_alt_df.iloc[j, i] = round(inv_val, 3)
-                        elif edited_alt_df.iloc[j, i] != prev_alt.iloc[j, i]:
-                            val = edited_alt_df.iloc[j, i]
-                            if val > 1:
-                                if np.isclose(val, np.round(val)): val = float(np.round(val))
-                                edited_alt_df.iloc[j, i] = val
-                                edited_alt_df.iloc[i, j] = round(1 / val, 3)
-                            elif val < 1:
-                                val = round(val, 3)
-                                edited_alt_df.iloc[j, i] = val
-                                inv_val = 1 / val
-                                if np.isclose(inv_val, np.round(inv_val)):
-                                    edited_alt_df.iloc[i, j] = float(np.round(inv_val))
-                                else:
-                                    edited_alt_df.iloc[i, j] = round(inv_val, 3)
-
-                np.fill_diagonal(edited_alt_df.values, 1.000)
-                st.session_state.alt_matrices[crit] = edited_alt_df
-                
-                # --- Розрахунок узгодженості для матриці альтернатив ---
-                lambda_max, ci, cr = calculate_consistency(edited_alt_df)
-                st.session_state.alt_consistency[crit] = {"lambda": lambda_max, "ci": ci, "cr": cr}
-                
-                st.success(f"✅ Матриця для {crit} оновлена!")
-                
-                # Показуємо оновлену матрицю відразу
-                st.dataframe(edited_alt_df.style.format("{:.3f}"), use_container_width=True)
+st.markdown(f"### Порівняння альтернатив за критерієм **{crit}**")
 
-        # --- БЛОК ВІДОБРАЖЕННЯ УЗГОДЖЕНОСТІ АЛЬТЕРНАТИВ ---
-        if crit in st.session_state.alt_consistency:
-            st.markdown(f"#### 🔬 Аналіз узгодженості для **{crit}**")
-            cons_data = st.session_state.alt_consistency[crit]
-            
-            col1, col2, col3 = st.columns(3)
-            col1.metric("λ max (Лямбда)", f"{cons_data['lambda']:.3f}")
-            col2.metric("Індекс Узгодженості (ІУ)", f"{cons_data['ci']:.3f}")
-            col3.metric("Відношення Узгодженості (ВУ)", f"{cons_data['cr']:.1%}")
-            
-            if cons_data['cr'] > 0.20:
-                st.error(f"🚨 **Увага! ВУ > 20%**\n\nУзгодженість матриці для '{crit}' низька. Перегляньте ваші порівняння.")
-            elif np.isnan(cons_data['cr']):
-                st.warning("Не вдалося розрахувати узгодженість. Перевірте, чи немає нулів у стовпцях матриці.")
-            else:
-                st.success(f"✅ **ВУ ≤ 20%**\n\nУзгодженість матриці для '{crit}' в межах норми.")
+# Редактор відкривається з незбереженої чернетки критерію, якщо вона є.
+# Поки критерій обрано і має правки, вихідні дані редактора не змінюються, щоб не скинути їх
+base = st.session_state.get("alt_editor_base")
+if (
+    st.session_state.get("alt_editor_crit") != crit
+    or base is None
+    or list(base.index) != alternative_names
+    or (crit not in drafts and not base.equals(st.session_state.alt_matrices[crit]))
+):
+    base = drafts.get(crit, st.session_state.alt_matrices[crit]).copy()
+    base.columns = alternative_names
+    base.index = alternative_names
+    st.session_state.alt_editor_crit = crit
+    st.session_state.alt_editor_base = base
+
+alt_df = st.data_editor(
+    base,
+    key=f"matrix_{crit}_{st.session_state.alt_editor_version}",
+    use_container_width=True,
+)
+
+# Правки зберігаються як чернетка, тож не губляться при переході до іншого критерію
+if alt_df.equals(st.session_state.alt_matrices[crit]):
+    drafts.pop(crit, None)
+else:
+    drafts[crit] = alt_df.copy()
+other_drafts = [name for name in criteria_names if name in drafts and name != crit]
+if other_drafts:
+    st.caption(f"✏️ Незбережені правки: {', '.join(other_drafts)}")
+
+save_alt = st.button(f"💾 Зберегти зміни ({crit})")
+
+if save_alt:
+    edited_alt_df = pd.DataFrame(alt_df, columns=alternative_names, index=alternative_names).astype(float)
+    
+    # ---  ПЕРЕВІРКА НА > 9 ---
+    if (edited_alt_df > 9).any().any():
+        st.error(f"🚨 **Помилка: Введено числа, більші за 9, у матриці для '{crit}'.**\n\nБудь ласка, використовуйте лише значення від 1 до 9.")
+    else:
+        # ---  ЛОГІКА ЗБЕРЕЖЕННЯ 
+        edited_alt_df = fill_reciprocal(edited_alt_df, st.session_state.alt_matrices[crit])
+        st.session_state.alt_matrices[crit] = edited_alt_df
+        drafts.pop(crit, None)
+        # Наступного разу редактор відкривається вже зі збереженої матриці
+        st.session_state.alt_editor_base = edited_alt_df.copy()
+        st.session_state.alt_editor_version += 1
+        
+        # --- Розрахунок узгодженості для матриці альтернатив ---
+        lambda_max, ci, cr = calculate_consistency(edited_alt_df)
+        st.session_state.alt_consistency[crit] = {"lambda": lambda_max, "ci": ci, "cr": cr}
+        
+        st.success(f"✅ Матриця для {crit} оновлена!")
+        
+        # Показуємо оновлену матрицю відразу
+        st.dataframe(edited_alt_df.style.format("{:.3f}", na_rep="—"), use_container_width=True)
+
+# --- БЛОК ВІДОБРАЖЕННЯ УЗГОДЖЕНОСТІ АЛЬТЕРНАТИВ ---
+if crit in st.session_state.alt_consistency:
+    st.markdown(f"#### 🔬 Аналіз узгодженості для **{crit}**")
+    cons_data = st.session_state.alt_consistency[crit]
+    
+    col1, col2, col3 = st.columns(3)
+    col1.metric("λ max (Лямбда)", f"{cons_data['lambda']:.3f}")
+    col2.metric("Індекс Узгодженості (ІУ)", f"{cons_data['ci']:.3f}")
+    col3.metric("Відношення Узгодженості (ВУ)", f"{cons_data['cr']:.1%}")
+    
+    if cons_data['cr'] > CR_LIMIT:
+        st.error(f"🚨 **Увага! ВУ > {CR_LIMIT:.0%}**\n\nУзгодженість матриці для '{crit}' низька. Перегляньте ваші порівняння.")
+        repaired = repair_panel(st.session_state.alt_matrices[crit], f"alt_{crit}")
+        if repaired is not None:
+            st.session_state.alt_matrices[crit] = repaired
+            lambda_max, ci, cr = calculate_consistency(repaired)
+            st.session_state.alt_consistency[crit] = {"lambda": lambda_max, "ci": ci, "cr": cr}
+            drafts.pop(crit, None)
+            st.session_state.alt_editor_base = repaired.copy()
+            st.session_state.alt_editor_version += 1
+            st.rerun()
+    elif np.isnan(cons_data['cr']):
+        st.warning("Не вдалося розрахувати узгодженість. Перевірте, чи немає нулів у стовпцях матриці та чи пов'язують судження всі елементи.")
+    else:
+        st.success(f"✅ **ВУ ≤ {CR_LIMIT:.0%}**\n\nУзгодженість матриці для '{crit}' в межах норми.")
 
 
 
@@ -421,8 +550,8 @@ st.markdown("---")
 st.markdown("## 🧮 Розрахунок глобальних пріоритетів")
 
 # ... (Код розрахунку ... залишається без змін) ...
-criteria_ready = "criteria_matrix" in st.session_state
-alts_ready = all(crit in st.session_state.alt_matrices for crit in criteria_names)
+criteria_ready = is_filled(st.session_state.get("criteria_matrix"))
+alts_ready = all(is_filled(st.session_state.alt_matrices.get(crit)) for crit in criteria_names)
 
 if criteria_ready and alts_ready and len(criteria_names) > 0 and len(alternative_names) > 0:
     try:
@@ -430,7 +559,7 @@ if criteria_ready and alts_ready and len(criteria_names) > 0 and len(alternative
         if criteria_weights.isnull().any():
             st.error("❌ Не вдалося розрахувати ваги критеріїв. Перевірте матрицю критеріїв.")
         else:
-            alt_weights_dict = {}
+            alt_weights_cols = []
             all_alts_calculated = True
             for crit in criteria_names:
                 weights = calc_weights(st.session_state.alt_matrices[crit])
@@ -438,23 +567,132 @@ if criteria_ready and alts_ready and len(criteria_names) > 0 and len(alternative
                     st.error(f"❌ Не вдалося розрахувати ваги для альтернатив за критерієм '{crit}'.")
                     all_alts_calculated = False
                     break
-                alt_weights_dict[crit] = weights
+                alt_weights_cols.append(weights.to_numpy())
             if all_alts_calculated:
-                alt_weights_df = pd.DataFrame(alt_weights_dict)
-                alt_weights_df = alt_weights_df.reindex(index=alternative_names, columns=criteria_names)
-                criteria_weights = criteria_weights.reindex(index=criteria_names)
-                global_priorities_vec = alt_weights_df.dot(criteria_weights)
-                global_priorities_display = pd.DataFrame({
-                    "Глоб. пріор.": global_priorities_vec
-                }, index=alternative_names)
-                global_priorities_display = global_priorities_display.sort_values("Глоб. пріор.", ascending=False)
+                local_weights = np.column_stack(alt_weights_cols)
+                synthesis = st.session_state.get("synthesis")
+                if synthesis is None or synthesis.shape != local_weights.shape:
+                    synthesis = ahp_synthesis.IncrementalSynthesis(local_weights, criteria_weights.to_numpy())
+                    st.session_state.synthesis = synthesis
+                else:
+                    # Перераховуються лише стовпці, ваги яких змінилися
+                    for j in range(local_weights.shape[1]):
+                        synthesis.update_column(j, local_weights[:, j])
+                    synthesis.update_criteria(criteria_weights.to_numpy())
+                ranking = synthesis.ranking()
+
+                alt_weights_df = pd.DataFrame(synthesis.local, index=alternative_names, columns=criteria_names)
+                global_priorities_display = pd.DataFrame(
+                    {"Глоб. пріор.": synthesis.priorities[ranking]},
+                    index=[alternative_names[i] for i in ranking],
+                )
                 
                 st.markdown("### 1. Ваги альтернатив по кожному критерію")
-                st.dataframe(alt_weights_df.style.format("{:.3f}"), use_container_width=True)
+                st.dataframe(alt_weights_df.style.format("{:.3f}", na_rep="—"), use_container_width=True)
                 st.markdown("### 2. Глобальні пріоритети")
-                st.dataframe(global_priorities_display.style.format("{:.3f}"), use_container_width=True)
+                st.dataframe(global_priorities_display.style.format("{:.3f}", na_rep="—"), use_container_width=True)
                 st.success("✅ Розрахунок завершено!")
+
+                # --- АНАЛІЗ ЧУТЛИВОСТІ ---
+                if st.checkbox("📈 Показати аналіз чутливості до ваг критеріїв"):
+                    grid = np.linspace(0, 1, SENSITIVITY_POINTS)
+                    sweep = ahp_sensitivity.sensitivity_sweep(synthesis.local, synthesis.criteria, grid)
+                    points = ahp_sensitivity.break_even_points(synthesis.local, synthesis.criteria, grid, sweep)
+
+                    sens_crit = st.selectbox("Критерій:", criteria_names, key="sensitivity_criterion")
+                    j = criteria_names.index(sens_crit)
+                    shown = ranking[:10]
+                    chart_df = pd.DataFrame(
+                        sweep[j][:, shown], index=pd.Index(grid, name=f"Вага «{sens_crit}»"),
+                        columns=[alternative_names[i] for i in shown],
+                    )
+                    st.line_chart(chart_df)
+                    st.caption(f"Поточна вага: {synthesis.criteria[j]:.3f}. Показано до 10 найкращих альтернатив.")
+
+                    st.markdown("#### Точки зміни найкращої альтернативи")
+                    if len(points["weight"]):
+                        st.dataframe(pd.DataFrame({
+                            "Критерій": [criteria_names[c] for c in points["criterion"]],
+                            "Поточна вага": synthesis.criteria[points["criterion"]],
+                            "Вага зміни": points["weight"],
+                            "Було найкраще": [alternative_names[a] for a in points["before"]],
+                            "Стає найкращим": [alternative_names[a] for a in points["after"]],
+                        }).style.format({"Поточна вага": "{:.3f}", "Вага зміни": "{:.3f}"}), use_container_width=True)
+                    else:
+                        st.info("Найкраща альтернатива не змінюється за жодної ваги окремого критерію.")
+
+                # --- СТІЙКІСТЬ РАНЖУВАННЯ (МОНТЕ-КАРЛО) ---
+                if st.checkbox("🎲 Перевірити стійкість ранжування (Монте-Карло)"):
+                    st.caption(
+                        "Кожне задане судження випадково зсувається на −1, 0 або +1 крок шкали Сааті; "
+                        "пропущені судження в кожному розіграші доповнюються заново."
+                    )
+                    col1, col2 = st.columns(2)
+                    mc_draws = col1.number_input("Кількість розіграшів:", 1000, 200000, 10000, step=1000)
+                    mc_seed = col2.number_input("Зерно генератора:", 0, value=0)
+
+                    method = st.session_state.get("priority_method", ahp_core.MEAN)
+                    criteria_values = st.session_state.criteria_matrix.to_numpy(dtype=float)
+                    alt_values = np.stack([
+                        st.session_state.alt_matrices[crit].to_numpy(dtype=float) for crit in criteria_names
+                    ])
+                    mc_key = (ahp_cache.WeightsCache.key(criteria_values, method), ahp_cache.WeightsCache.key(alt_values, method))
+
+                    if st.button("▶️ Запустити моделювання"):
+                        with st.spinner("Моделювання..."):
+                            st.session_state.mc_result = ahp_montecarlo.robustness(
+                                criteria_values, alt_values, draws=int(mc_draws), seed=int(mc_seed), method=method
+                            )
+                            st.session_state.mc_key = mc_key
+
+                    if st.session_state.get("mc_key") == mc_key:
+                        mc_result = st.session_state.mc_result
+                        st.markdown(f"#### Індекси прийнятності рангів ({mc_result['draws']} розіграшів)")
+                        acceptability_df = pd.DataFrame(
+                            mc_result["acceptability"], index=alternative_names,
+                            columns=[f"Ранг {r + 1}" for r in range(len(alternative_names))],
+                        ).iloc[ranking]
+                        st.dataframe(acceptability_df.style.format("{:.1%}"), use_container_width=True)
+                        st.markdown("#### Довірчі інтервали глобальних пріоритетів (95%)")
+                        interval_df = pd.DataFrame({
+                            "Середнє": mc_result["mean"],
+                            "Нижня межа": mc_result["lower"],
+                            "Верхня межа": mc_result["upper"],
+                        }, index=alternative_names).iloc[ranking]
+                        st.dataframe(interval_df.style.format("{:.3f}"), use_container_width=True)
     except Exception as e:
         st.error(f"❌ Помилка при розрахунку глобальних пріоритетів: {e}. Перевірте введені значення.")
 else:
     st.warning("⚠️ Необхідно заповнити та зберегти Матрицю критеріїв та всі Матриці альтернатив для розрахунку.")
+
+
+# Результати групового рішення
+
+group = st.session_state.get("group_result")
+if group is not None:
+    st.markdown("## 👥 Групове рішення")
+    group_order = np.argsort(-group["priorities"], kind="stable")
+    st.dataframe(pd.DataFrame(
+        {"Груп. пріор.": group["priorities"][group_order]},
+        index=[group["alternative_names"][i] for i in group_order],
+    ).style.format("{:.3f}"), use_container_width=True)
+    st.markdown(
+        f"**Узгодженість ранжувань експертів (W Кендалла):** {group['kendall_w']:.3f}  \n"
+        f"**ВУ групової матриці критеріїв:** {group['group_cr'][0]:.3f}"
+    )
+    st.markdown("#### Експерти")
+    st.dataframe(pd.DataFrame({
+        "ВУ критеріїв": group["expert_cr"][:, 0],
+        "Макс. ВУ альтернатив": np.nanmax(group["expert_cr"][:, 1:], axis=1),
+        "Розбіжність з групою": group["expert_divergence"],
+    }, index=group["experts"]).style.format("{:.3f}", na_rep="—"), use_container_width=True)
+    st.caption("Розбіжність — середній квадрат відхилення логарифмів суджень експерта від групових.")
+
+
+# Статистика спільного кешу розрахунків
+
+cache_stats = ahp_cache.default_cache.stats()
+st.sidebar.caption(
+    f"🗄️ Кеш розрахунків: {cache_stats['hits']} влучань, {cache_stats['misses']} промахів, "
+    f"{cache_stats['size']}/{cache_stats['maxsize']} записів"
+)
@@ -0,0 +1,131 @@
+"""Збереження і читання моделей (ahp_io): JSON і бінарний формат .ahpm."""
+import json
+
+import numpy as np
+import pytest
+
+import ahp_core
+import ahp_io
+
+CRITERIA = ["Ціна", "Якість", "Критерій «3»"]
+ALTERNATIVES = ["Альтернатива 1", "A2"]
+
+
+@pytest.fixture
+def arrays():
+    rng = np.random.default_rng(0)
+    criteria_matrix = ahp_core.random_reciprocal_matrices(1, 3, rng)[0]
+    criteria_matrix[0, 2] = criteria_matrix[2, 0] = np.nan
+    alt_matrices = ahp_core.random_reciprocal_matrices(3, 2, rng)
+    return "Мета", CRITERIA, ALTERNATIVES, criteria_matrix, alt_matrices
+
+
+def with_header(header, block=b""):
+    # Бінарний файл з довільним заголовком JSON
+    data = json.dumps(header).encode("utf-8")
+    return ahp_io._PREFIX.pack(ahp_io.MAGIC, ahp_io.FORMAT_VERSION, len(data)) + data + block
+
+
+def test_binary_round_trip(tmp_path, arrays):
+    # Бінарний формат зберігає значення побітово, включно з NaN
+    path = tmp_path / "model.ahpm"
+    ahp_io.save_binary(path, *arrays)
+    goal, names, alts, criteria_matrix, alt_matrices = ahp_io.load_binary(path)
+    assert (goal, names, alts) == arrays[:3]
+    assert isinstance(alt_matrices, np.memmap)
+    assert np.array_equal(criteria_matrix, arrays[3], equal_nan=True)
+    assert np.array_equal(alt_matrices, arrays[4])
+
+    data = path.read_bytes()
+    assert len(data) % 8 == 0
+    assert np.array_equal(ahp_io.binary_from_bytes(data)[4], arrays[4])
+
+
+def test_json_and_binary_give_same_model(arrays):
+    from_json = ahp_io.read_model(ahp_io.model_to_json(*arrays).encode("utf-8"))
+    from_binary = ahp_io.read_model(ahp_io.model_to_bytes(*arrays))
+    for a, b in zip(ahp_io.model_arrays(from_binary), ahp_io.model_arrays(from_json)):
+        assert np.array_equal(a, b, equal_nan=True) if isinstance(a, np.ndarray) else a == b
+
+
+def test_missing_goal_name_gets_default():
+    data = with_header({"criteria_names": ["a"], "alternative_names": ["x"]}, np.ones(2).tobytes())
+    assert ahp_io.binary_from_bytes(data)[0] == "ГОЛОВНА МЕТА"
+
+
+@pytest.mark.parametrize("header", [
+    [CRITERIA, ALTERNATIVES],
+    "Мета",
+    {"goal_name": "Мета", "alternative_names": ALTERNATIVES},
+    {"goal_name": "Мета", "criteria_names": CRITERIA},
+    {"goal_name": "Мета", "criteria_names": "abc", "alternative_names": ALTERNATIVES},
+    {"goal_name": "Мета", "criteria_names": [1, 2, 3], "alternative_names": ALTERNATIVES},
+    {"goal_name": "Мета", "criteria_names": ["a", "a"], "alternative_names": ALTERNATIVES},
+    {"goal_name": 5, "criteria_names": CRITERIA, "alternative_names": ALTERNATIVES},
+], ids=["list", "string", "no_criteria", "no_alternatives", "criteria_string",
+        "criteria_numbers", "duplicate_names", "goal_number"])
+def test_malformed_header_rejected(tmp_path, header):
+    block = np.ones(3 * 3 + 3 * 2 * 2).tobytes()
+    data = with_header(header, block)
+    with pytest.raises(ValueError):
+        ahp_io.binary_from_bytes(data)
+    path = tmp_path / "broken.ahpm"
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        ahp_io.load_binary(path)
+
+
+@pytest.mark.parametrize("cut", [8, 1, 3])
+def test_wrong_block_size_rejected(tmp_path, arrays, cut):
+    data = ahp_io.model_to_bytes(*arrays)[:-cut]
+    with pytest.raises(ValueError):
+        ahp_io.binary_from_bytes(data)
+    path = tmp_path / "short.ahpm"
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        ahp_io.load_binary(path)
+
+
+def test_extra_data_rejected(tmp_path, arrays):
+    data = ahp_io.model_to_bytes(*arrays) + np.ones(1).tobytes()
+    with pytest.raises(ValueError):
+        ahp_io.binary_from_bytes(data)
+    path = tmp_path / "long.ahpm"
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        ahp_io.load_binary(path)
+
+
+def test_truncated_header_rejected(arrays):
+    with pytest.raises(ValueError):
+        ahp_io.binary_from_bytes(ahp_io.model_to_bytes(*arrays)[:ahp_io._PREFIX.size + 4])
+
+
+def test_unknown_version_rejected(arrays):
+    data = bytearray(ahp_io.model_to_bytes(*arrays))
+    data[8] = ahp_io.FORMAT_VERSION + 1
+    with pytest.raises(ValueError):
+        ahp_io.binary_from_bytes(bytes(data))
+
+
+def test_wrong_signature_rejected(tmp_path, arrays):
+    data = b"NOTMODEL" + ahp_io.model_to_bytes(*arrays)[8:]
+    assert not ahp_io.is_binary(data)
+    with pytest.raises(ValueError):
+        ahp_io.binary_from_bytes(data)
+    path = tmp_path / "other.ahpm"
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        ahp_io.load_binary(path)
+    # read_model вважає такі байти JSON і теж відхиляє їх
+    with pytest.raises(ValueError):
+        ahp_io.read_model(data)
+
+
+def test_missing_judgments_exported_as_null(arrays):
+    # Пропущені судження — null, тобто коректний JSON для будь-якого споживача
+    text = ahp_io.model_to_json(*arrays)
+    assert "null" in text and "NaN" not in text
+    criteria, alternatives, criteria_matrix, alt_matrices = ahp_io.model_arrays(json.loads(text))
+    assert np.array_equal(criteria_matrix, arrays[3], equal_nan=True)
+    assert np.array_equal(alt_matrices, arrays[4])
@@ -0,0 +1,46 @@
+"""Пакетне API ahp_core проти початкових pandas-функцій і розрахунку по одній матриці."""
+import numpy as np
+import pandas as pd
+import pytest
+
+import ahp_core
+from benchmarks import _legacy
+
+SIZES = [3, 5, 7, 10]
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_batch_matches_legacy(n):
+    stack = ahp_core.random_reciprocal_matrices(50, n, n)
+    weights = ahp_core.calc_weights_batch(stack)
+    lam, ci, cr = ahp_core.consistency_batch(stack, weights)
+    for idx, matrix in enumerate(stack):
+        frame = pd.DataFrame(matrix)
+        assert np.allclose(weights[idx], _legacy.calc_weights(frame).to_numpy())
+        assert np.allclose([lam[idx], ci[idx], cr[idx]], _legacy.calculate_consistency(frame))
+
+
+@pytest.mark.parametrize("method", ahp_core.METHODS)
+def test_batch_matches_single(method):
+    stack = ahp_core.random_reciprocal_matrices(20, 6, 1)
+    weights = ahp_core.calc_weights_batch(stack, method)
+    lam, ci, cr = ahp_core.consistency_batch(stack, weights)
+    for idx, matrix in enumerate(stack):
+        assert np.allclose(weights[idx], ahp_core.calc_weights(matrix, method))
+        assert np.allclose([lam[idx], ci[idx], cr[idx]], ahp_core.calculate_consistency(matrix, method=method))
+
+
+def test_invalid_matrices_give_nan_rows():
+    stack = ahp_core.random_reciprocal_matrices(3, 4, 2)
+    stack[1, :, 2] = 0
+    weights = ahp_core.calc_weights_batch(stack)
+    assert np.isnan(weights[1]).all()
+    assert np.isfinite(weights[[0, 2]]).all()
+
+
+def test_evaluate_many_groups_sizes():
+    matrices = [ahp_core.random_reciprocal_matrices(1, n, n)[0] for n in (3, 5, 3, 4)]
+    weights, lam, ci, cr = ahp_core.evaluate_many(matrices)
+    for idx, matrix in enumerate(matrices):
+        assert np.allclose(weights[idx], ahp_core.calc_weights(matrix))
+        assert np.allclose([lam[idx], ci[idx], cr[idx]], ahp_core.calculate_consistency(matrix))
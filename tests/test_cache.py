@@ -0,0 +1,35 @@
+"""LRU-кеші ahp_cache і відповідей ahp_service."""
+import numpy as np
+
+import ahp_cache
+import ahp_core
+from ahp_service import ResultCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = ahp_cache.LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get_many(["a", "b", "c"]) == [1, None, 3]
+    assert cache.stats() == {"hits": 3, "misses": 1, "size": 2, "maxsize": 2}
+
+
+def test_weights_cache_matches_ahp_core():
+    cache = ahp_cache.WeightsCache()
+    matrix = np.array([[1, 3, 5], [1 / 3, 1, 2], [1 / 5, 1 / 2, 1]])
+    weights, consistency = cache.get(matrix, ahp_core.EIGEN)
+    np.testing.assert_allclose(weights, ahp_core.calc_weights(matrix, ahp_core.EIGEN))
+    np.testing.assert_allclose(consistency, ahp_core.calculate_consistency(matrix, method=ahp_core.EIGEN))
+
+    (again, _), (other, _) = cache.get_many([matrix, matrix.T], ahp_core.EIGEN)
+    assert again is weights
+    np.testing.assert_allclose(other, ahp_core.calc_weights(matrix.T, ahp_core.EIGEN))
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_result_cache_key_depends_on_body_and_method():
+    keys = {ResultCache.key(b"{}", "mean"), ResultCache.key(b"{}", "eigen"), ResultCache.key(b"[]", "mean")}
+    assert len(keys) == 3
@@ -0,0 +1,105 @@
+"""Властивості ahp_core.fill_reciprocal (дзеркалення суджень редактора матриць)."""
+import numpy as np
+import pandas as pd
+import pytest
+
+import ahp_core
+from benchmarks import _legacy
+
+# Значення, які користувач може ввести в редакторі, включно з некоректними
+EDIT_VALUES = np.concatenate([
+    ahp_core.SAATY_SCALE,
+    [0.333, 0.3333333, 0.1429, 0.25, 0.3, 0.7, 1.5, 2.5, 2.0000001, 7.9999999, 0.5004, 0.0],
+])
+
+SIZES = [3, 5, 10, 20]
+CASES = 50
+
+
+def saved_matrix(n, rng):
+    # Матриця у вигляді, в якому її зберігає застосунок
+    m = ahp_core.random_reciprocal_matrices(1, n, rng)[0]
+    return ahp_core.fill_reciprocal(m, np.ones((n, n)))
+
+
+def random_edit(prev, rng, count):
+    edited = prev.copy()
+    n = len(prev)
+    rows = rng.integers(0, n, count)
+    cols = rng.integers(0, n, count)
+    edited[rows, cols] = rng.choice(EDIT_VALUES, count)
+    return edited
+
+
+def empty_matrix(n):
+    values = np.full((n, n), np.nan)
+    np.fill_diagonal(values, 1.0)
+    return values
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_matches_legacy_loop(n):
+    rng = np.random.default_rng(n)
+    for _ in range(CASES):
+        prev = saved_matrix(n, rng)
+        edited = random_edit(prev, rng, rng.integers(1, n * n))
+        with np.errstate(divide="ignore"):
+            expected = _legacy.fill_reciprocal(pd.DataFrame(edited), pd.DataFrame(prev)).to_numpy()
+            result = ahp_core.fill_reciprocal(edited, prev)
+        assert np.array_equal(result, expected, equal_nan=True), (edited, prev)
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_changed_pairs_stay_reciprocal(n):
+    # Кожна пара, змінена значенням зі шкали (крім 1), лишається оберненою (до округлення)
+    rng = np.random.default_rng(100 + n)
+    for _ in range(CASES):
+        prev = saved_matrix(n, rng)
+        edited = random_edit(prev, rng, rng.integers(1, n * n))
+        with np.errstate(divide="ignore"):
+            result = ahp_core.fill_reciprocal(edited, prev)
+        changed = edited != prev
+        source = np.triu(changed, 1) | (np.tril(changed, -1) & ~np.triu(changed, 1).T)
+        source &= np.isin(edited, ahp_core.SAATY_SCALE) & (edited != 1)
+        i, j = np.nonzero(source)
+        assert np.allclose(result[i, j] * result[j, i], 1, rtol=5e-3)
+        assert (np.diag(result) == 1).all()
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_cleared_judgment_clears_mirror(n):
+    # Стерте судження стирає симетричне, решта матриці не змінюється
+    rng = np.random.default_rng(200 + n)
+    for _ in range(CASES):
+        result = saved_matrix(n, rng)
+        i, j = rng.choice(n, 2, replace=False)
+        cleared = result.copy()
+        cleared[i, j] = np.nan
+        after = ahp_core.fill_reciprocal(cleared, result)
+        assert np.isnan(after[i, j]) and np.isnan(after[j, i])
+        after[[i, j], [j, i]] = result[[i, j], [j, i]]
+        assert np.array_equal(after, result, equal_nan=True)
+
+
+def test_one_fills_empty_mirror():
+    # Одиниця в порожній матриці дзеркалиться, з будь-якого боку діагоналі
+    prev = empty_matrix(4)
+    edited = prev.copy()
+    edited[0, 2] = 1.0
+    edited[3, 1] = 1.0
+    result = ahp_core.fill_reciprocal(edited, prev)
+    assert result[0, 2] == result[2, 0] == 1.0
+    assert result[3, 1] == result[1, 3] == 1.0
+    # Решта суджень лишається незаданою
+    assert np.isnan(result[0, 1]) and np.isnan(result[1, 0])
+
+
+def test_one_keeps_given_mirror():
+    # Якщо симетричне судження вже задане, одиниця його не змінює
+    prev = empty_matrix(3)
+    prev[0, 1], prev[1, 0] = 3.0, 1 / 3
+    edited = prev.copy()
+    edited[0, 1] = 1.0
+    result = ahp_core.fill_reciprocal(edited, prev)
+    assert result[0, 1] == 1.0
+    assert result[1, 0] == 1 / 3
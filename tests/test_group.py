@@ -0,0 +1,80 @@
+"""Групове рішення (ahp_group): агрегування суджень (AIJ) і пріоритетів (AIP)."""
+import numpy as np
+import pytest
+
+import ahp_core
+import ahp_group
+import ahp_io
+
+CRITERIA, ALTERNATIVES = 4, 5
+
+
+def expert_matrices(experts, noise, rng):
+    # Спільна «істинна» модель, кожен експерт оцінює її з логнормальним шумом
+    def judged(weights):
+        n = weights.shape[-1]
+        ratios = weights[..., :, None] / weights[..., None, :]
+        upper = np.triu(ratios * np.exp(rng.normal(0, noise, (experts,) + ratios.shape)), 1)
+        with np.errstate(divide="ignore"):
+            return upper + np.swapaxes(np.where(upper > 0, 1 / upper, 0), -1, -2) + np.eye(n)
+
+    return judged(rng.random(CRITERIA) + 0.1), judged(rng.random((CRITERIA, ALTERNATIVES)) + 0.1)
+
+
+@pytest.fixture
+def experts():
+    return expert_matrices(7, 0.3, np.random.default_rng(0))
+
+
+def test_aij_matches_cellwise_geometric_mean(experts):
+    criteria_matrices, alt_matrices = experts
+    criteria = ahp_core.calc_weights(np.exp(np.log(criteria_matrices).mean(axis=0)))
+    group_alts = np.exp(np.log(alt_matrices).mean(axis=0))
+    local = np.column_stack([ahp_core.calc_weights(matrix) for matrix in group_alts])
+    result = ahp_group.aggregate(criteria_matrices, alt_matrices)
+    assert np.allclose(result["priorities"], local @ criteria)
+
+
+@pytest.mark.parametrize("aggregation", [ahp_group.AIJ, ahp_group.AIP])
+def test_priorities_normalized(experts, aggregation):
+    result = ahp_group.aggregate(*experts, aggregation=aggregation)
+    assert np.isclose(result["priorities"].sum(), 1)
+    assert result["expert_priorities"].shape == (7, ALTERNATIVES)
+    assert 0 <= result["kendall_w"] <= 1
+
+
+@pytest.mark.parametrize("aggregation", [ahp_group.AIJ, ahp_group.AIP])
+def test_single_expert_reproduces_own_result(experts, aggregation):
+    criteria_matrices, alt_matrices = experts
+    single = ahp_group.aggregate(criteria_matrices[:1], alt_matrices[:1], aggregation=aggregation)
+    local = np.column_stack([ahp_core.calc_weights(matrix) for matrix in alt_matrices[0]])
+    own = local @ ahp_core.calc_weights(criteria_matrices[0])
+    assert np.allclose(single["priorities"], own)
+    assert np.allclose(single["priorities"], single["expert_priorities"][0])
+    assert np.allclose(single["expert_divergence"], 0)
+
+
+def test_expert_weights_shift_group_towards_expert(experts):
+    criteria_matrices, alt_matrices = experts
+    weights = np.ones(7)
+    weights[2] = 1000
+    result = ahp_group.aggregate(criteria_matrices, alt_matrices, expert_weights=weights)
+    assert np.abs(result["priorities"] - result["expert_priorities"][2]).max() < 0.01
+
+
+def test_missing_judgment_skipped(experts):
+    # Через формат експорту: пропущене судження одного експерта не заважає агрегуванню
+    criteria_matrices, alt_matrices = experts
+    names = [f"C{j}" for j in range(CRITERIA)]
+    alts = [f"A{i}" for i in range(ALTERNATIVES)]
+    models = [ahp_io.model_from_arrays("G", names, alts, criteria_matrices[e], alt_matrices[e]) for e in range(3)]
+    models[0]["criteria_matrix"]["C1"]["C0"] = models[0]["criteria_matrix"]["C0"]["C1"] = None
+    group = ahp_group.group_decision(models, aggregation=ahp_group.AIJ)
+    assert np.isfinite(group["priorities"]).all() and group["alternative_names"] == alts
+    expected = np.sqrt(criteria_matrices[1, 0, 1] * criteria_matrices[2, 0, 1])
+    assert np.isclose(group["group_criteria_matrix"][0, 1], expected)
+
+
+def test_unknown_aggregation_rejected(experts):
+    with pytest.raises(ValueError):
+        ahp_group.aggregate(*experts, aggregation="median")
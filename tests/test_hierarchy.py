@@ -0,0 +1,119 @@
+"""Багаторівнева ієрархія (ahp_hierarchy.Hierarchy): повний та інкрементний синтез."""
+import numpy as np
+import pytest
+
+import ahp_cache
+import ahp_core
+from ahp_hierarchy import Hierarchy
+from ahp_io import matrix_to_dict
+
+ALTERNATIVES = ["A0", "A1", "A2", "A3"]
+
+
+def random_matrix(n, rng):
+    return ahp_core.random_reciprocal_matrices(1, n, rng)[0]
+
+
+def build(branching, rng):
+    hierarchy = Hierarchy(ALTERNATIVES, cache=ahp_cache.WeightsCache())
+
+    def add(name, level):
+        if level == len(branching):
+            hierarchy.add_node(name, (), random_matrix(len(ALTERNATIVES), rng))
+            return
+        children = [f"{name}.{i}" for i in range(branching[level])]
+        hierarchy.add_node(name, children, random_matrix(len(children), rng))
+        for child in children:
+            add(child, level + 1)
+
+    add("G", 0)
+    return hierarchy
+
+
+def dag(rng):
+    # Листок «спільний» входить до обох критеріїв
+    hierarchy = Hierarchy(ALTERNATIVES, cache=ahp_cache.WeightsCache())
+    hierarchy.add_node("G", ["К1", "К2"], random_matrix(2, rng))
+    hierarchy.add_node("К1", ["спільний", "л1"], random_matrix(2, rng))
+    hierarchy.add_node("К2", ["спільний", "л2", "л3"], random_matrix(3, rng))
+    for leaf in ["спільний", "л1", "л2", "л3"]:
+        hierarchy.add_node(leaf, (), random_matrix(len(ALTERNATIVES), rng))
+    return hierarchy
+
+
+def naive(hierarchy, name):
+    # Еталон: рекурсивний синтез без кешу
+    weights = ahp_core.calc_weights(hierarchy.matrices[name])
+    if not hierarchy.children[name]:
+        return weights
+    return sum(w * naive(hierarchy, child) for w, child in zip(weights, hierarchy.children[name]))
+
+
+@pytest.mark.parametrize("make", [lambda rng: build([3, 2], rng), lambda rng: build([2, 2, 3], rng), dag],
+                         ids=["tree", "deep_tree", "dag"])
+def test_incremental_matches_naive(make):
+    rng = np.random.default_rng(0)
+    hierarchy = make(rng)
+    assert np.allclose(hierarchy.priorities(), naive(hierarchy, "G"))
+
+    inner = [name for name, children in hierarchy.children.items() if children]
+    for _ in range(30):
+        leaves = hierarchy.leaves
+        if rng.random() < 0.7:
+            hierarchy.set_matrix(leaves[rng.integers(len(leaves))], random_matrix(len(ALTERNATIVES), rng))
+        else:
+            name = inner[rng.integers(len(inner))]
+            hierarchy.set_matrix(name, random_matrix(len(hierarchy.children[name]), rng))
+        assert np.allclose(hierarchy.priorities(), naive(hierarchy, "G"))
+
+
+def test_dag_node_weights_sum_over_paths():
+    hierarchy = dag(np.random.default_rng(1))
+    weights = hierarchy.node_weights()
+    top = ahp_core.calc_weights(hierarchy.matrices["G"])
+    first = ahp_core.calc_weights(hierarchy.matrices["К1"])
+    second = ahp_core.calc_weights(hierarchy.matrices["К2"])
+    assert np.isclose(weights["спільний"], top[0] * first[0] + top[1] * second[0])
+    assert np.isclose(sum(weights[leaf] for leaf in hierarchy.leaves), 1)
+
+
+def test_from_model_with_sub_criteria():
+    rng = np.random.default_rng(2)
+    criteria, subs = ["К1", "К2"], ["К1.1", "К1.2"]
+    criteria_matrix, sub_matrix = random_matrix(2, rng), random_matrix(2, rng)
+    leaf_matrices = {name: random_matrix(len(ALTERNATIVES), rng) for name in ["К1.1", "К1.2", "К2"]}
+    model = {
+        "goal_name": "Мета",
+        "criteria_names": criteria,
+        "alternative_names": ALTERNATIVES,
+        "criteria_matrix": matrix_to_dict(criteria_matrix, criteria),
+        "sub_criteria": {"К1": {"names": subs, "matrix": matrix_to_dict(sub_matrix, subs)}},
+        "alt_matrices": {name: matrix_to_dict(m, ALTERNATIVES) for name, m in leaf_matrices.items()},
+    }
+    hierarchy = Hierarchy.from_model(model, cache=ahp_cache.WeightsCache())
+    assert sorted(hierarchy.leaves) == ["К1.1", "К1.2", "К2"]
+    assert np.allclose(hierarchy.priorities(), naive(hierarchy, "Мета"))
+    assert set(hierarchy.consistency()) == {"Мета", "К1", "К1.1", "К1.2", "К2"}
+
+
+def test_invalid_structures_rejected():
+    rng = np.random.default_rng(3)
+    cyclic = Hierarchy(ALTERNATIVES)
+    cyclic.add_node("G", ["К"], np.ones((1, 1)))
+    cyclic.add_node("К", ["Л"], np.ones((1, 1)))
+    cyclic.add_node("Л", ["К"], np.ones((1, 1)))
+    with pytest.raises(ValueError):
+        cyclic.priorities()
+
+    two_roots = Hierarchy(ALTERNATIVES)
+    two_roots.add_node("G1", (), random_matrix(4, rng))
+    two_roots.add_node("G2", (), random_matrix(4, rng))
+    with pytest.raises(ValueError):
+        two_roots.priorities()
+
+    hierarchy = Hierarchy(ALTERNATIVES)
+    hierarchy.add_node("G", ["К1", "К2"])
+    with pytest.raises(ValueError):
+        hierarchy.set_matrix("G", np.ones((3, 3)))
+    with pytest.raises(ValueError):
+        hierarchy.add_node("G")
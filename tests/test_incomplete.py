@@ -0,0 +1,85 @@
+"""Неповні матриці: зв'язність, LLSM і доповнення (ahp_core)."""
+import numpy as np
+import pytest
+
+import ahp_core
+
+SIZES = [3, 5, 10, 30]
+
+
+def sparse_judgments(weights, extra, noise, rng):
+    # Випадкове остовне дерево плюс extra додаткових пар з узгодженої матриці
+    n = len(weights)
+    matrix = np.full((n, n), np.nan)
+    np.fill_diagonal(matrix, 1.0)
+    order = rng.permutation(n)
+    parents = order[rng.integers(0, np.arange(1, n))]
+    pairs = list(zip(order[1:], parents))
+    pairs += list(zip(rng.integers(0, n, extra), rng.integers(0, n, extra)))
+    for i, j in pairs:
+        if i != j:
+            value = weights[i] / weights[j] * np.exp(rng.normal(0, noise))
+            matrix[i, j], matrix[j, i] = value, 1 / value
+    return matrix
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_llsm_equals_geometric_on_complete(n):
+    matrix = ahp_core.random_reciprocal_matrices(1, n, np.random.default_rng(n))[0]
+    assert np.allclose(ahp_core.llsm_weights(matrix), ahp_core.calc_weights(matrix, ahp_core.GEOMETRIC))
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_consistent_spanning_tree_recovers_weights(n):
+    rng = np.random.default_rng(10 + n)
+    weights = rng.random(n) + 0.1
+    weights /= weights.sum()
+    assert np.allclose(ahp_core.llsm_weights(sparse_judgments(weights, n, 0.0, rng)), weights)
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_completion_keeps_known_judgments(n):
+    rng = np.random.default_rng(20 + n)
+    matrix = sparse_judgments(rng.random(n) + 0.1, n, 0.3, rng)
+    completed = ahp_core.complete_matrix(matrix)
+    known = ~np.isnan(matrix)
+    assert ahp_core.is_complete(completed)
+    assert np.array_equal(completed[known], matrix[known])
+    assert np.allclose(completed * completed.T, 1)
+    assert ahp_core.check_matrix(matrix) is None
+
+
+def test_one_sided_judgment_mirrored():
+    matrix = np.array([[1, 4, np.nan], [np.nan, 1, 2], [np.nan, 0.5, 1]])
+    completed = ahp_core.complete_matrix(matrix)
+    assert completed[1, 0] == 0.25
+    assert np.isclose(completed[0, 2], 8)
+
+
+def test_disconnected_graph():
+    matrix = np.full((4, 4), np.nan)
+    np.fill_diagonal(matrix, 1.0)
+    matrix[0, 1], matrix[1, 0] = 3, 1 / 3
+    matrix[2, 3], matrix[3, 2] = 2, 0.5
+    assert not ahp_core.is_connected(matrix)
+    assert ahp_core.check_matrix(matrix) == ahp_core.DISCONNECTED
+    assert np.isnan(ahp_core.calc_weights(matrix)).all()
+    with pytest.raises(ValueError):
+        ahp_core.llsm_weights(matrix)
+    with pytest.raises(ValueError):
+        ahp_core.complete_matrix(matrix)
+
+
+def test_empty_matrix_is_disconnected():
+    matrix = np.full((3, 3), np.nan)
+    np.fill_diagonal(matrix, 1.0)
+    assert ahp_core.check_matrix(matrix) == ahp_core.DISCONNECTED
+    assert ahp_core.is_connected(np.ones((1, 1)))
+
+
+def test_evaluate_many_completes_incomplete():
+    rng = np.random.default_rng(3)
+    matrix = sparse_judgments(rng.random(6) + 0.1, 4, 0.2, rng)
+    weights, _, _, cr = ahp_core.evaluate_many([matrix])
+    assert np.allclose(weights[0], ahp_core.calc_weights(ahp_core.complete_matrix(matrix)))
+    assert np.isfinite(cr[0])
@@ -0,0 +1,52 @@
+"""Інкрементний синтез глобальних пріоритетів (ahp_synthesis.IncrementalSynthesis)."""
+import numpy as np
+import pytest
+
+from ahp_synthesis import IncrementalSynthesis
+
+
+def random_model(m, k, rng):
+    local = rng.random((m, k))
+    local /= local.sum(axis=0)
+    criteria = rng.random(k)
+    return local, criteria / criteria.sum()
+
+
+@pytest.mark.parametrize("m, k", [(10, 5), (100, 20)])
+def test_updates_match_full_product(m, k):
+    rng = np.random.default_rng(m)
+    local, criteria = random_model(m, k, rng)
+    synthesis = IncrementalSynthesis(local, criteria)
+    for j in rng.integers(0, k, 500):
+        column = rng.random(m)
+        ranking = synthesis.update_column(j, column / column.sum())
+        local[:, j] = column / column.sum()
+    assert np.allclose(synthesis.priorities, local @ criteria)
+    assert np.array_equal(ranking, np.argsort(-(local @ criteria), kind="stable"))
+
+    criteria = rng.random(k)
+    criteria /= criteria.sum()
+    synthesis.update_criteria(criteria)
+    assert np.allclose(synthesis.priorities, local @ criteria)
+
+
+def test_refresh_after_many_updates():
+    rng = np.random.default_rng(0)
+    local, criteria = random_model(5, 3, rng)
+    synthesis = IncrementalSynthesis(local, criteria)
+    for _ in range(IncrementalSynthesis.REFRESH_EVERY):
+        synthesis.update_column(0, rng.dirichlet(np.ones(5)))
+    assert synthesis._updates == 0
+    assert np.array_equal(synthesis.priorities, synthesis.local @ synthesis.criteria)
+
+
+def test_unchanged_column_skips_update():
+    local, criteria = random_model(4, 2, np.random.default_rng(1))
+    synthesis = IncrementalSynthesis(local, criteria)
+    synthesis.update_column(1, local[:, 1].copy())
+    assert synthesis._updates == 0
+
+
+def test_shape_mismatch_rejected():
+    with pytest.raises(ValueError):
+        IncrementalSynthesis(np.ones((3, 2)), np.ones(3))
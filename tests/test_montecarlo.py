@@ -0,0 +1,63 @@
+"""Стійкість ранжування (ahp_montecarlo) для повних і неповних матриць."""
+import numpy as np
+import pytest
+
+import ahp_core
+import ahp_montecarlo
+
+
+def with_gaps(matrix, pairs):
+    matrix = matrix.copy()
+    for i, j in pairs:
+        matrix[i, j] = matrix[j, i] = np.nan
+    return matrix
+
+
+@pytest.fixture
+def model():
+    rng = np.random.default_rng(0)
+    criteria = with_gaps(ahp_core.random_reciprocal_matrices(1, 4, rng)[0], [(0, 3)])
+    alts = ahp_core.random_reciprocal_matrices(4, 5, rng)
+    alts[1] = with_gaps(alts[1], [(0, 2), (1, 4), (3, 4)])
+    return criteria, alts
+
+
+def test_perturb_keeps_missing_judgments(model):
+    criteria, _ = model
+    draws = ahp_montecarlo.perturb(criteria[None], 200, np.random.default_rng(1))[:, 0]
+    assert np.isnan(draws[:, 0, 3]).all() and np.isnan(draws[:, 3, 0]).all()
+    given = ~np.isnan(criteria)
+    assert np.isfinite(draws[:, given]).all()
+    assert np.allclose(draws[:, 1, 2] * draws[:, 2, 1], 1)
+
+
+def test_draws_completed_from_their_own_judgments(model):
+    _, alts = model
+    draws = ahp_montecarlo.perturb(alts[1][None], 50, np.random.default_rng(2))[:, 0]
+    expected = [ahp_core.complete_matrix(draw) for draw in draws]
+    completed = ahp_montecarlo.complete_draws(draws.copy(), ahp_montecarlo._completion(alts[1]))
+    assert np.allclose(completed, expected)
+
+
+def test_zero_step_gives_completed_priorities(model):
+    criteria, alts = model
+    result = ahp_montecarlo.robustness(criteria, alts, draws=100, max_step=0, workers=1)
+    local = np.column_stack([ahp_core.calc_weights(matrix) for matrix in alts])
+    expected = ahp_core.global_priorities(ahp_core.calc_weights(criteria), local)
+    assert np.allclose(result["mean"], expected)
+    assert np.allclose(result["lower"], result["upper"])
+
+
+def test_result_independent_of_workers(model):
+    criteria, alts = model
+    one = ahp_montecarlo.robustness(criteria, alts, draws=12000, seed=5, workers=1)
+    two = ahp_montecarlo.robustness(criteria, alts, draws=12000, seed=5, workers=2)
+    assert np.array_equal(one["acceptability"], two["acceptability"])
+    assert np.allclose(one["acceptability"].sum(axis=1), 1)
+
+
+def test_disconnected_matrix_rejected(model):
+    criteria, alts = model
+    criteria = with_gaps(criteria, [(0, 1), (0, 2)])
+    with pytest.raises(ValueError):
+        ahp_montecarlo.robustness(criteria, alts, draws=10, workers=1)
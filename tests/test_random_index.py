@@ -0,0 +1,43 @@
+"""Файловий кеш ВВУ (ahp_core._save_ri_cache)."""
+import json
+
+import pytest
+
+import ahp_core
+
+
+@pytest.fixture
+def ri_cache(tmp_path, monkeypatch):
+    path = tmp_path / "random_index.json"
+    monkeypatch.setattr(ahp_core, "RI_CACHE_PATH", str(path))
+    monkeypatch.setattr(ahp_core, "_ri_cache", {})
+    return path
+
+
+def write_cache(path, values):
+    data = {"trials": ahp_core.RI_TRIALS, "seed": ahp_core.RI_SEED, "values": {str(n): ri for n, ri in values.items()}}
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_save_keeps_values_written_by_another_process(ri_cache):
+    write_cache(ri_cache, {12: 1.54})
+    ahp_core._ri_cache[11] = 1.51
+    ahp_core._save_ri_cache()
+
+    values = json.loads(ri_cache.read_text(encoding="utf-8"))["values"]
+    assert values == {"11": 1.51, "12": 1.54}
+    assert [p.name for p in ri_cache.parent.iterdir()] == [ri_cache.name]
+
+
+def test_save_ignores_cache_from_other_settings(ri_cache):
+    ri_cache.write_text(json.dumps({"trials": 1, "seed": 0, "values": {"12": 9.0}}), encoding="utf-8")
+    ahp_core._ri_cache[11] = 1.51
+    ahp_core._save_ri_cache()
+
+    values = json.loads(ri_cache.read_text(encoding="utf-8"))["values"]
+    assert values == {"11": 1.51}
+
+
+def test_random_index_reads_saved_value(ri_cache):
+    write_cache(ri_cache, {11: 1.51})
+    assert ahp_core.random_index(11) == 1.51
@@ -0,0 +1,76 @@
+"""Пропозиції виправлень суперечливих суджень (ahp_repair)."""
+import numpy as np
+import pytest
+
+import ahp_core
+import ahp_repair
+
+
+def judged(n, errors, rng):
+    # Узгоджена матриця, округлена до шкали Сааті, з кількома хибними судженнями
+    weights = rng.random(n) + 0.1
+    log_ratio = np.log(weights[:, None] / weights[None, :])
+    matrix = ahp_core.SAATY_SCALE[np.abs(log_ratio[..., None] - np.log(ahp_core.SAATY_SCALE)).argmin(axis=-1)]
+    bad = set()
+    while len(bad) < errors:
+        i, j = sorted(rng.choice(n, 2, replace=False))
+        matrix[i, j] = 9.0 if log_ratio[i, j] < 0 else 1 / 9
+        matrix[j, i] = 1 / matrix[i, j]
+        bad.add((int(i), int(j)))
+    return matrix, bad
+
+
+@pytest.mark.parametrize("n", [5, 10, 20])
+@pytest.mark.parametrize("threshold", [0.1, ahp_core.CR_LIMIT])
+def test_reaches_threshold(n, threshold):
+    matrix, _ = judged(n, max(2, n // 2), np.random.default_rng(n))
+    result = ahp_repair.propose_repairs(matrix, threshold)
+    assert result["cr_before"] > threshold
+    assert result["reached"] and result["cr_after"] <= threshold
+    assert np.isclose(ahp_core.calculate_consistency(result["matrix"])[2], result["cr_after"])
+    assert np.isclose(result["edits"][-1]["cr"], result["cr_after"])
+    # Кожна заміна — значення шкали, матриця лишається оберненою
+    for edit in result["edits"]:
+        assert edit["new"] in ahp_core.SAATY_SCALE
+        assert result["matrix"][edit["row"], edit["col"]] == edit["new"]
+    assert np.allclose(result["matrix"] * result["matrix"].T, 1)
+
+
+def test_finds_planted_errors():
+    matrix, bad = judged(10, 3, np.random.default_rng(0))
+    result = ahp_repair.propose_repairs(matrix, 0.1)
+    found = {(edit["row"], edit["col"]) for edit in result["edits"]}
+    assert len(found & bad) >= 2
+    worst = {(i, j) for i, j, *_ in ahp_repair.worst_judgments(matrix, count=3)}
+    assert worst & bad
+
+
+def test_consistent_matrix_unchanged():
+    matrix, _ = judged(6, 0, np.random.default_rng(1))
+    result = ahp_repair.propose_repairs(matrix, 0.1)
+    assert result["edits"] == [] and result["reached"]
+    assert np.array_equal(result["matrix"], matrix)
+
+
+def test_missing_judgments_stay_missing():
+    matrix, _ = judged(8, 3, np.random.default_rng(2))
+    matrix[0, 5] = matrix[5, 0] = np.nan
+    result = ahp_repair.propose_repairs(matrix, 0.1)
+    assert np.isnan(result["matrix"][0, 5]) and np.isnan(result["matrix"][5, 0])
+    assert all((edit["row"], edit["col"]) != (0, 5) for edit in result["edits"])
+    completed = ahp_core.complete_matrix(result["matrix"])
+    assert np.isclose(ahp_core.calculate_consistency(completed)[2], result["cr_after"])
+
+
+def test_max_edits_respected():
+    matrix, _ = judged(12, 6, np.random.default_rng(3))
+    result = ahp_repair.propose_repairs(matrix, 0.01, max_edits=2)
+    assert len(result["edits"]) == 2
+    assert not result["reached"]
+
+
+def test_default_threshold_is_shared_limit():
+    matrix, _ = judged(10, 5, np.random.default_rng(4))
+    result = ahp_repair.propose_repairs(matrix)
+    assert result["reached"] and result["cr_after"] <= ahp_core.CR_LIMIT
+    assert result["edits"] == ahp_repair.propose_repairs(matrix, ahp_core.CR_LIMIT)["edits"]
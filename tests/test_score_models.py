@@ -0,0 +1,78 @@
+"""Пакетний розрахунок моделей у форматі експорту (ahp_synthesis.score_models)."""
+import numpy as np
+import pytest
+
+import ahp_core
+from ahp_io import matrix_from_dict, matrix_to_dict, model_from_arrays
+from ahp_synthesis import score_models
+
+ALTERNATIVES = ["A1", "A2", "A3"]
+
+
+def flat_model(rng, criteria=("К1", "К2", "К3")):
+    criteria = list(criteria)
+    return model_from_arrays(
+        "Мета", criteria, ALTERNATIVES,
+        ahp_core.random_reciprocal_matrices(1, len(criteria), rng)[0],
+        ahp_core.random_reciprocal_matrices(len(criteria), len(ALTERNATIVES), rng),
+    )
+
+
+def hierarchy_model(rng):
+    # К1 розбито на два підкритерії; матриці альтернатив задано для листків
+    model = flat_model(rng, ["К1", "К2"])
+    names = ["К1.1", "К1.2"]
+    sub_matrix = ahp_core.random_reciprocal_matrices(1, 2, rng)[0]
+    model["sub_criteria"] = {"К1": {"names": names, "matrix": matrix_to_dict(sub_matrix, names)}}
+    leaf_matrices = ahp_core.random_reciprocal_matrices(2, len(ALTERNATIVES), rng)
+    del model["alt_matrices"]["К1"]
+    for name, matrix in zip(names, leaf_matrices):
+        model["alt_matrices"][name] = matrix_to_dict(matrix, ALTERNATIVES)
+    return model, sub_matrix, leaf_matrices
+
+
+def test_flat_model():
+    rng = np.random.default_rng(0)
+    model = flat_model(rng)
+    result, = score_models([model])
+    criteria_weights = ahp_core.calc_weights(matrix_from_dict(model["criteria_matrix"], model["criteria_names"]))
+    assert np.allclose(list(result["criteria_weights"].values()), criteria_weights)
+    assert np.isclose(sum(result["priorities"].values()), 1)
+    assert result["max_cr"] == max(result["criteria_cr"], *result["alt_cr"].values())
+
+
+def test_sub_criteria_synthesized_through_hierarchy():
+    rng = np.random.default_rng(1)
+    model, sub_matrix, leaf_matrices = hierarchy_model(rng)
+    flat = flat_model(rng)
+    flat_result, result = score_models([flat, model])
+    assert "error" not in flat_result and "error" not in result
+
+    criteria_weights = ahp_core.calc_weights(matrix_from_dict(model["criteria_matrix"], ["К1", "К2"]))
+    sub_weights = ahp_core.calc_weights(sub_matrix)
+    other = matrix_from_dict(model["alt_matrices"]["К2"], ALTERNATIVES)
+    expected = criteria_weights[0] * (
+        sub_weights[0] * ahp_core.calc_weights(leaf_matrices[0]) + sub_weights[1] * ahp_core.calc_weights(leaf_matrices[1])
+    ) + criteria_weights[1] * ahp_core.calc_weights(other)
+
+    assert np.allclose(list(result["priorities"].values()), expected)
+    assert np.allclose(list(result["criteria_weights"].values()), criteria_weights)
+    assert set(result["local_weights"]) == set(result["alt_cr"]) == {"К1.1", "К1.2", "К2"}
+    assert np.isclose(result["node_weights"]["К1.2"], criteria_weights[0] * sub_weights[1])
+    assert set(result["consistency"]["sub_criteria"]) == {"К1"}
+    assert result["best"] == ALTERNATIVES[int(np.argmax(expected))]
+
+
+def test_broken_sub_criteria_reported():
+    rng = np.random.default_rng(2)
+    model, _, _ = hierarchy_model(rng)
+    del model["alt_matrices"]["К1.1"]
+    result, = score_models([model])
+    assert result["goal_name"] == "Мета"
+    assert "error" in result
+
+
+@pytest.mark.parametrize("model", [None, [], {"criteria_names": ["К1"]}])
+def test_invalid_model_reported(model):
+    result, = score_models([model])
+    assert "error" in result
@@ -0,0 +1,51 @@
+"""Аналіз чутливості до ваг критеріїв (ahp_sensitivity)."""
+import numpy as np
+
+import ahp_sensitivity
+
+
+def random_model(m, k, rng):
+    local = rng.random((m, k))
+    local /= local.sum(axis=0)
+    criteria = rng.random(k)
+    return local, criteria / criteria.sum()
+
+
+def test_sweep_matches_loop():
+    rng = np.random.default_rng(0)
+    local, criteria = random_model(20, 6, rng)
+    grid = np.linspace(0, 1, 101)
+    weights = ahp_sensitivity.sweep_weights(criteria, grid)
+    expected = np.array([[local.dot(w) for w in row] for row in weights])
+    assert np.allclose(ahp_sensitivity.sensitivity_sweep(local, criteria, grid), expected)
+
+
+def test_swept_weights_sum_to_one():
+    criteria = np.array([0.5, 0.3, 0.2, 0.0])
+    grid = np.linspace(0, 1, 11)
+    weights = ahp_sensitivity.sweep_weights(criteria, grid)
+    assert np.allclose(weights.sum(axis=2), 1)
+    assert np.allclose(weights[np.arange(4), :, np.arange(4)], grid)
+    # Інші критерії зберігають свої пропорції
+    assert np.allclose(weights[0, 3, 1] / weights[0, 3, 2], 0.3 / 0.2)
+
+
+def test_single_nonzero_criterion_shares_rest_equally():
+    weights = ahp_sensitivity.sweep_weights(np.array([1.0, 0.0, 0.0]), np.array([0.4]))
+    assert np.allclose(weights[0, 0], [0.4, 0.3, 0.3])
+
+
+def test_break_even_point_is_exact():
+    # Дві альтернативи, пріоритети лінійні за вагою першого критерію: перетин при w = 0.5
+    local = np.array([[0.8, 0.2], [0.2, 0.8]])
+    criteria = np.array([0.7, 0.3])
+    points = ahp_sensitivity.break_even_points(local, criteria, np.linspace(0, 1, 8))
+    first = points["criterion"] == 0
+    assert np.allclose(points["weight"][first], 0.5)
+    assert points["before"][first][0] == 1 and points["after"][first][0] == 0
+
+
+def test_no_break_even_for_dominant_alternative():
+    local = np.array([[0.9, 0.9], [0.1, 0.1]])
+    points = ahp_sensitivity.break_even_points(local, np.array([0.5, 0.5]), np.linspace(0, 1, 11))
+    assert len(points["weight"]) == 0
@@ -0,0 +1,84 @@
+"""HTTP-сервіс ahp_service: маршрути, мікропакети й кеш (без мережі, через ScoringService.route)."""
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+import ahp_core
+import ahp_io
+import ahp_service
+from ahp_synthesis import score_models
+
+CRITERIA = ["Критерій 1", "Критерій 2", "Критерій 3"]
+ALTERNATIVES = ["Альтернатива 1", "Альтернатива 2", "Альтернатива 3", "Альтернатива 4"]
+
+
+def make_models(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        ahp_io.model_from_arrays(
+            f"Мета {n}", CRITERIA, ALTERNATIVES,
+            ahp_core.random_reciprocal_matrices(1, len(CRITERIA), rng)[0],
+            ahp_core.random_reciprocal_matrices(len(CRITERIA), len(ALTERNATIVES), rng),
+        )
+        for n in range(count)
+    ]
+
+
+def body(model):
+    return json.dumps(model, ensure_ascii=False).encode("utf-8")
+
+
+async def post_all(service, bodies, method=ahp_core.MEAN):
+    return await asyncio.gather(
+        *[service.route("POST", f"/score?method={method}", b) for b in bodies], return_exceptions=True
+    )
+
+
+@pytest.mark.parametrize("method", ahp_core.METHODS)
+def test_batched_responses_match_score_models(method):
+    models = make_models(20)
+    service = ahp_service.ScoringService(max_batch=8)
+    responses = asyncio.run(post_all(service, [body(m) for m in models] * 2, method))
+
+    for (status, got), expected in zip(responses, score_models(models, method) * 2):
+        assert status == 200
+        assert got["best"] == expected["best"]
+        np.testing.assert_allclose(list(got["priorities"].values()), list(expected["priorities"].values()))
+        assert np.isclose(got["consistency"]["criteria"]["cr"], expected["criteria_cr"])
+
+    health = service.health()[1]
+    assert health["batched_models"] == len(models)
+    assert health["batches"] < len(models)
+    assert health["cache"]["size"] == len(models)
+
+
+def test_failure_stays_with_its_request(monkeypatch):
+    def failing(models, method):
+        if any(m["goal_name"] == "Мета 1" for m in models):
+            raise RuntimeError("збій розрахунку")
+        return score_models(models, method)
+
+    monkeypatch.setattr(ahp_service, "score_models", failing)
+    models = make_models(4)
+    responses = asyncio.run(post_all(ahp_service.ScoringService(), [body(m) for m in models]))
+
+    assert isinstance(responses[1], RuntimeError)
+    for pos in (0, 2, 3):
+        status, got = responses[pos]
+        assert status == 200
+        assert got["best"] == score_models([models[pos]])[0]["best"]
+
+
+@pytest.mark.parametrize("verb, target, data, status", [
+    ("POST", "/score", b"not json", 400),
+    ("POST", "/score?method=median", b"{}", 400),
+    ("GET", "/score", b"", 405),
+    ("POST", "/health", b"", 405),
+    ("GET", "/missing", b"", 404),
+])
+def test_error_statuses(verb, target, data, status):
+    got, payload = asyncio.run(ahp_service.ScoringService().route(verb, target, data))
+    assert got == status
+    assert "error" in payload